@@ -57,58 +57,60 @@ if [ -n "${BASH_VERSION:-}" ]; then
     fi
 fi
 
-# Shell compatibility functions for regex matching
-parse_field_line() {
-    local line="$1"
-    local field params value
-    
-    # Bash version using BASH_REMATCH
-    local pattern='^([^:;]+)(;[^:]*)?:(.*)$'
-    if [[ "$line" =~ $pattern ]]; then
-        field="${BASH_REMATCH[1]}"
-        params="${BASH_REMATCH[2]}"
-        value="${BASH_REMATCH[3]}"
-        echo "MATCH:$field:$params:$value"
-        return 0
+# Parsing helpers
+#
+# These helpers return their result in REPLY (or the SPLIT array) instead of
+# printing it, so callers never need a $(...) subshell. Every VCF line is
+# handled with shell builtins only.
+
+# Normalize a value the way `IFS=':' read -r` treats the last variable:
+# a single trailing ':' is dropped when it is the only ':' left in the value
+strip_read_delimiter() {
+    REPLY="$1"
+    if [[ "$REPLY" == *: && "${REPLY%:}" != *:* ]]; then
+        REPLY="${REPLY%:}"
     fi
-    
-    return 1
+}
+
+# Split a string on a single-character delimiter into the SPLIT array,
+# with the same field rules as `IFS=<delimiter> read -ra`
+split_fields() {
+    local rest="$1"
+    local delimiter="$2"
+    SPLIT=()
+    while [[ "$rest" == *"$delimiter"* ]]; do
+        SPLIT+=("${rest%%"$delimiter"*}")
+        rest="${rest#*"$delimiter"}"
+    done
+    if [[ -n "$rest" ]]; then
+        SPLIT+=("$rest")
+    fi
+}
+
+# Trim leading and trailing whitespace
+trim_whitespace() {
+    REPLY="$1"
+    REPLY="${REPLY#"${REPLY%%[![:space:]]*}"}"
+    REPLY="${REPLY%"${REPLY##*[![:space:]]}"}"
 }
 
 parse_type_param() {
     local params="$1"
-    local type="DEFAULT"
+    # Only ASCII letters are upper-cased, as with tr '[:lower:]' '[:upper:]'
+    local LC_ALL=C
+    REPLY="DEFAULT"
     
     local pattern='TYPE=([^;]*)'
     if [[ "$params" =~ $pattern ]]; then
-        type=$(echo "${BASH_REMATCH[1]}" | tr '[:lower:]' '[:upper:]')
+        REPLY="${BASH_REMATCH[1]^^}"
     fi
-    
-    echo "$type"
 }
 
-# Parse simple patterns like "FIELD:key:value", "TEL:value", etc.
-parse_simple_field() {
-    local line="$1"
-    local pattern="$2"  # "FIELD", "TEL", "EMAIL", "ADR"
-    
-    case "$pattern" in
-        "FIELD")
-            if [[ "$line" =~ ^FIELD:([^:]+):(.*)$ ]]; then
-                echo "${BASH_REMATCH[1]}:${BASH_REMATCH[2]}"
-                return 0
-            fi
-            ;;
-        *)
-            if [[ "$line" =~ ^${pattern}:(.*)$ ]]; then
-                echo "${BASH_REMATCH[1]}"
-                return 0
-            fi
-            ;;
-    esac
-    
-    return 1
-}
+# Version of the note template, recorded in each note's frontmatter; keep it
+# equal to RENDERER_VERSION in vcf_to_obsidian/markdown_writer.py so both
+# implementations write the same notes and the Python converter does not
+# re-render notes written here
+RENDERER_VERSION=1
 
 # Global variables
 VERBOSE=false
@@ -116,6 +118,17 @@ SOURCES=()
 DESTINATION=""
 SUCCESSFUL_CONVERSIONS=0
 TOTAL_FILES=0
+JOBS=1
+MIRROR_MTIME=false
+
+# Parsed card of the file currently being converted
+declare -A VCF_FIELDS
+VCF_TELS=()
+VCF_EMAILS=()
+VCF_ADRS=()
+
+# Modification times (seconds since the epoch) collected during discovery
+declare -A VCF_MTIMES
 
 # Help function
 show_help() {
@@ -130,6 +143,8 @@ Options:
     --folder DIR     Source directory containing VCF files (can be specified multiple times)
     --file FILE      Specific VCF file to process (can be specified multiple times)
     --obsidian DIR   Destination directory for generated Markdown files (required)
+    --jobs, -j N     Convert up to N files in parallel (default: 1, requires bash 4.3+)
+    --mirror-mtime   Give each note its VCF file's mtime and skip notes whose mtime matches
     --verbose, -v    Enable verbose output
     --help, -h       Show this help message
 
@@ -137,6 +152,7 @@ Examples:
     vcf-to-obsidian.sh --folder ./contacts --obsidian ./obsidian-vault/contacts
     vcf-to-obsidian.sh --file ./contact.vcf --obsidian ./obsidian-vault/contacts
     vcf-to-obsidian.sh --folder ./contacts1 --folder ./contacts2 --obsidian ./vault
+    vcf-to-obsidian.sh --folder ./contacts --obsidian ./vault -j 4
 
 Note: You must specify at least one source (--folder or --file) and exactly one destination (--obsidian).
 EOF
@@ -151,32 +167,27 @@ log() {
 
 # Clean filename by replacing invalid characters
 clean_filename() {
-    local filename="$1"
     # Replace invalid filename characters with underscores
-    echo "$filename" | sed 's/[<>:"/\\|?*]/_/g'
+    REPLY="${1//[<>:\"\/\\|?*]/_}"
 }
 
-# Parse VCF file and extract fields
+# Parse VCF file and extract fields into VCF_FIELDS, VCF_TELS, VCF_EMAILS and VCF_ADRS
 parse_vcf_file() {
     local vcf_file="$1"
-    declare -A fields
+    local line field params value type i adr_data
+    local -a name_parts adr_parts
+    local pattern='^([^:;]+)(;[^:]*)?:(.*)$'
     
     # Initialize all fields as empty
-    fields[FN]=""
-    fields[N_FAMILY]=""
-    fields[N_GIVEN]=""
-    fields[UID]=""
-    fields[ORG]=""
-    fields[VERSION]=""
-    fields[BDAY]=""
-    fields[NOTE]=""
-    fields[URL]=""
-    fields[CATEGORIES]=""
+    VCF_FIELDS=(
+        [FN]="" [N_FAMILY]="" [N_GIVEN]="" [UID]="" [ORG]=""
+        [VERSION]="" [BDAY]="" [NOTE]="" [URL]="" [CATEGORIES]=""
+    )
     
     # Arrays for multiple-value fields
-    local -a tel_fields
-    local -a email_fields
-    local -a adr_fields
+    VCF_TELS=()
+    VCF_EMAILS=()
+    VCF_ADRS=()
     
     local in_vcard=false
     
@@ -201,150 +212,94 @@ parse_vcf_file() {
         fi
         
         # Parse field:value pairs
-        parse_result=$(parse_field_line "$line")
-        if [ $? -eq 0 ]; then
-            # Extract field, params, and value from the result
-            IFS=':' read -r _ field params value <<< "$parse_result"
-            
-            case "$field" in
-                "FN")
-                    fields[FN]="$value"
-                    ;;
-                "N")
-                    # N field format: Family;Given;Additional;Prefix;Suffix
-                    IFS=';' read -ra name_parts <<< "$value"
-                    fields[N_FAMILY]="${name_parts[0]:-}"
-                    fields[N_GIVEN]="${name_parts[1]:-}"
-                    ;;
-                "UID")
-                    fields[UID]="$value"
-                    ;;
-                "ORG")
-                    fields[ORG]="$value"
-                    ;;
-                "VERSION")
-                    fields[VERSION]="$value"
-                    ;;
-                "BDAY")
-                    fields[BDAY]="$value"
-                    ;;
-                "NOTE")
-                    fields[NOTE]="$value"
-                    ;;
-                "URL")
-                    # Extract type from parameters if present
-                    local type=$(parse_type_param "$params")
-                    fields[URL]="$value"
-                    fields[URL_TYPE]="$type"
-                    ;;
-                "CATEGORIES")
-                    fields[CATEGORIES]="$value"
-                    ;;
-                "PHOTO")
-                    fields[PHOTO]="$value"
-                    ;;
-                "TEL")
-                    # Extract type from parameters if present
-                    local type=$(parse_type_param "$params")
-                    tel_fields+=("$type:$value")
-                    ;;
-                "EMAIL")
-                    # Extract type from parameters if present
-                    local type=$(parse_type_param "$params")
-                    email_fields+=("$type:$value")
-                    ;;
-                "ADR")
-                    # Extract type from parameters if present
-                    local type=$(parse_type_param "$params")
-                    # ADR format: POBOX;EXTENDED;STREET;LOCALITY;REGION;POSTAL;COUNTRY
-                    IFS=';' read -ra adr_parts <<< "$value"
-                    local adr_data="$type"
-                    for i in "${!adr_parts[@]}"; do
-                        case $i in
-                            0) adr_data="$adr_data:POBOX:${adr_parts[i]}" ;;
-                            1) adr_data="$adr_data:EXTENDED:${adr_parts[i]}" ;;
-                            2) adr_data="$adr_data:STREET:${adr_parts[i]}" ;;
-                            3) adr_data="$adr_data:LOCALITY:${adr_parts[i]}" ;;
-                            4) adr_data="$adr_data:REGION:${adr_parts[i]}" ;;
-                            5) adr_data="$adr_data:POSTAL:${adr_parts[i]}" ;;
-                            6) adr_data="$adr_data:COUNTRY:${adr_parts[i]}" ;;
-                        esac
-                    done
-                    adr_fields+=("$adr_data")
-                    ;;
-            esac
+        if [[ ! "$line" =~ $pattern ]]; then
+            continue
         fi
+        field="${BASH_REMATCH[1]}"
+        params="${BASH_REMATCH[2]}"
+        strip_read_delimiter "${BASH_REMATCH[3]}"
+        value="$REPLY"
+        
+        case "$field" in
+            "FN"|"UID"|"ORG"|"VERSION"|"BDAY"|"NOTE"|"CATEGORIES"|"PHOTO")
+                VCF_FIELDS[$field]="$value"
+                ;;
+            "N")
+                # N field format: Family;Given;Additional;Prefix;Suffix
+                split_fields "$value" ";"
+                name_parts=("${SPLIT[@]}")
+                VCF_FIELDS[N_FAMILY]="${name_parts[0]:-}"
+                VCF_FIELDS[N_GIVEN]="${name_parts[1]:-}"
+                ;;
+            "URL")
+                # Extract type from parameters if present
+                parse_type_param "$params"
+                VCF_FIELDS[URL]="$value"
+                VCF_FIELDS[URL_TYPE]="$REPLY"
+                ;;
+            "TEL")
+                parse_type_param "$params"
+                VCF_TELS+=("$REPLY:$value")
+                ;;
+            "EMAIL")
+                parse_type_param "$params"
+                VCF_EMAILS+=("$REPLY:$value")
+                ;;
+            "ADR")
+                parse_type_param "$params"
+                # ADR format: POBOX;EXTENDED;STREET;LOCALITY;REGION;POSTAL;COUNTRY
+                split_fields "$value" ";"
+                adr_parts=("${SPLIT[@]}")
+                adr_data="$REPLY"
+                for i in "${!adr_parts[@]}"; do
+                    case $i in
+                        0) adr_data="$adr_data:POBOX:${adr_parts[i]}" ;;
+                        1) adr_data="$adr_data:EXTENDED:${adr_parts[i]}" ;;
+                        2) adr_data="$adr_data:STREET:${adr_parts[i]}" ;;
+                        3) adr_data="$adr_data:LOCALITY:${adr_parts[i]}" ;;
+                        4) adr_data="$adr_data:REGION:${adr_parts[i]}" ;;
+                        5) adr_data="$adr_data:POSTAL:${adr_parts[i]}" ;;
+                        6) adr_data="$adr_data:COUNTRY:${adr_parts[i]}" ;;
+                    esac
+                done
+                VCF_ADRS+=("$adr_data")
+                ;;
+        esac
     done < "$vcf_file"
     
-    # Output all fields in a format that can be read by the calling function
-    for field in "${!fields[@]}"; do
-        echo "FIELD:$field:${fields[$field]}"
-    done
-    
-    # Output arrays
-    for tel in "${tel_fields[@]}"; do
-        echo "TEL:$tel"
-    done
-    
-    for email in "${email_fields[@]}"; do
-        echo "EMAIL:$email"
-    done
-    
-    for adr in "${adr_fields[@]}"; do
-        echo "ADR:$adr"
+    # Single fields are stored as KEY:value pairs, so they get the same
+    # trailing-delimiter normalization as the values themselves
+    for field in "${!VCF_FIELDS[@]}"; do
+        strip_read_delimiter "${VCF_FIELDS[$field]}"
+        VCF_FIELDS[$field]="$REPLY"
     done
 }
 
-# Generate Obsidian markdown content
+# Generate Obsidian markdown content from the parsed card
 generate_markdown() {
-    declare -A fields
-    local -a tel_list
-    local -a email_list
-    local -a adr_list
-    
-    # Read parsed VCF data
-    while IFS= read -r line; do
-        field_result=$(parse_simple_field "$line" "FIELD")
-        if [ $? -eq 0 ]; then
-            IFS=':' read -r field_key field_value <<< "$field_result"
-            fields["$field_key"]="$field_value"
-        else
-            tel_result=$(parse_simple_field "$line" "TEL")
-            if [ $? -eq 0 ]; then
-                tel_list+=("$tel_result")
-            else
-                email_result=$(parse_simple_field "$line" "EMAIL")
-                if [ $? -eq 0 ]; then
-                    email_list+=("$email_result")
-                else
-                    adr_result=$(parse_simple_field "$line" "ADR")
-                    if [ $? -eq 0 ]; then
-                        adr_list+=("$adr_result")
-                    fi
-                fi
-            fi
-        fi
-    done
+    local entry type value rest base_key comp_name comp_value i
+    local current_time contact_line category
+    local -a components categories
     
     # Start markdown output
     echo "---"
     
     # Extract structured name
-    if [[ -n "${fields[N_FAMILY]:-}" ]]; then
-        echo "N.FN: ${fields[N_FAMILY]}"
+    if [[ -n "${VCF_FIELDS[N_FAMILY]:-}" ]]; then
+        echo "N.FN: ${VCF_FIELDS[N_FAMILY]}"
     fi
-    if [[ -n "${fields[N_GIVEN]:-}" ]]; then
-        echo "N.GN: ${fields[N_GIVEN]}"
+    if [[ -n "${VCF_FIELDS[N_GIVEN]:-}" ]]; then
+        echo "N.GN: ${VCF_FIELDS[N_GIVEN]}"
     fi
     
     # Extract Full Name
-    if [[ -n "${fields[FN]:-}" ]]; then
-        echo "FN: ${fields[FN]}"
+    if [[ -n "${VCF_FIELDS[FN]:-}" ]]; then
+        echo "FN: ${VCF_FIELDS[FN]}"
     fi
     
     # Extract photo
-    if [[ -n "${fields[PHOTO]:-}" ]]; then
-        local photo_value="${fields[PHOTO]}"
+    if [[ -n "${VCF_FIELDS[PHOTO]:-}" ]]; then
+        local photo_value="${VCF_FIELDS[PHOTO]}"
         # Check if it's already a data URI with base64 encoding
         if [[ "$photo_value" =~ ^data:image.*base64 ]]; then
             echo "PHOTO: $photo_value"
@@ -358,45 +313,50 @@ generate_markdown() {
     fi
     
     # Extract email addresses with type information
-    for email in "${email_list[@]}"; do
-        IFS=':' read -r type value <<< "$email"
-        echo "\"EMAIL[$type]\": $value"
+    for entry in "${VCF_EMAILS[@]}"; do
+        strip_read_delimiter "${entry#*:}"
+        echo "\"EMAIL[${entry%%:*}]\": $REPLY"
     done
     
     # Extract phone numbers with type information
-    for tel in "${tel_list[@]}"; do
-        IFS=':' read -r type value <<< "$tel"
-        echo "\"TEL[$type]\": \"$value\""
+    for entry in "${VCF_TELS[@]}"; do
+        strip_read_delimiter "${entry#*:}"
+        echo "\"TEL[${entry%%:*}]\": \"$REPLY\""
     done
     
     # Extract birthday
-    if [[ -n "${fields[BDAY]:-}" ]]; then
-        echo "BDAY: ${fields[BDAY]}"
+    if [[ -n "${VCF_FIELDS[BDAY]:-}" ]]; then
+        echo "BDAY: ${VCF_FIELDS[BDAY]}"
     fi
     
     # Extract URLs with type information
-    if [[ -n "${fields[URL]:-}" ]]; then
-        local type="${fields[URL_TYPE]:-DEFAULT}"
-        echo "\"URL[$type]\": ${fields[URL]}"
+    if [[ -n "${VCF_FIELDS[URL]:-}" ]]; then
+        type="${VCF_FIELDS[URL_TYPE]:-DEFAULT}"
+        echo "\"URL[$type]\": ${VCF_FIELDS[URL]}"
     fi
     
     # Extract organization
-    if [[ -n "${fields[ORG]:-}" ]]; then
-        echo "ORG: ${fields[ORG]}"
+    if [[ -n "${VCF_FIELDS[ORG]:-}" ]]; then
+        echo "ORG: ${VCF_FIELDS[ORG]}"
     fi
     
     # Extract addresses with type information
-    for adr in "${adr_list[@]}"; do
-        IFS=':' read -r type rest <<< "$adr"
-        local base_key="ADR[$type]"
+    for entry in "${VCF_ADRS[@]}"; do
+        type="${entry%%:*}"
+        rest=""
+        if [[ "$entry" == *:* ]]; then
+            rest="${entry#*:}"
+        fi
+        strip_read_delimiter "$rest"
+        base_key="ADR[$type]"
         
         # Parse the address components
-        local components=()
-        IFS=':' read -ra components <<< "$rest"
+        split_fields "$REPLY" ":"
+        components=("${SPLIT[@]}")
         
         for ((i=0; i<${#components[@]}; i+=2)); do
-            local comp_name="${components[i]}"
-            local comp_value="${components[i+1]:-}"
+            comp_name="${components[i]}"
+            comp_value="${components[i+1]:-}"
             if [[ -n "$comp_value" ]]; then
                 case "$comp_name" in
                     "POBOX") echo "\"$base_key.POBOX\": $comp_value" ;;
@@ -412,41 +372,40 @@ generate_markdown() {
     done
     
     # Extract categories
-    if [[ -n "${fields[CATEGORIES]:-}" ]]; then
-        echo "CATEGORIES: ${fields[CATEGORIES]}"
+    if [[ -n "${VCF_FIELDS[CATEGORIES]:-}" ]]; then
+        echo "CATEGORIES: ${VCF_FIELDS[CATEGORIES]}"
     fi
     
     # Extract UID
-    if [[ -n "${fields[UID]:-}" ]]; then
-        echo "UID: ${fields[UID]}"
+    if [[ -n "${VCF_FIELDS[UID]:-}" ]]; then
+        echo "UID: ${VCF_FIELDS[UID]}"
     fi
     
     # Extract version
-    if [[ -n "${fields[VERSION]:-}" ]]; then
-        echo "VERSION: \"${fields[VERSION]}\""
+    if [[ -n "${VCF_FIELDS[VERSION]:-}" ]]; then
+        echo "VERSION: \"${VCF_FIELDS[VERSION]}\""
     fi
     
     # Add REV timestamp - always current time when markdown is created/updated
-    local current_time=$(date -u +"%Y%m%dT%H%M%SZ")
-    echo "REV: $current_time"
+    current_timestamp
+    echo "REV: $REPLY"
+    echo "# vcf-to-obsidian renderer: $RENDERER_VERSION"
     
     echo ""
     echo "---"
     
     # Add notes section if available
-    local notes_added=false
-    if [[ -n "${fields[NOTE]:-}" || -n "${fields[CATEGORIES]:-}" ]]; then
-        notes_added=true
+    if [[ -n "${VCF_FIELDS[NOTE]:-}" || -n "${VCF_FIELDS[CATEGORIES]:-}" ]]; then
         echo "#### Notes"
         echo ""
         
-        if [[ -n "${fields[CATEGORIES]:-}" ]]; then
-            local contact_line="#Contact"
-            IFS=',' read -ra categories <<< "${fields[CATEGORIES]}"
+        if [[ -n "${VCF_FIELDS[CATEGORIES]:-}" ]]; then
+            contact_line="#Contact"
+            split_fields "${VCF_FIELDS[CATEGORIES]}" ","
+            categories=("${SPLIT[@]}")
             for category in "${categories[@]}"; do
-                # Trim whitespace
-                category=$(echo "$category" | sed 's/^[[:space:]]*//;s/[[:space:]]*$//')
-                contact_line="$contact_line #$category"
+                trim_whitespace "$category"
+                contact_line="$contact_line #$REPLY"
             done
             echo "$contact_line"
         else
@@ -457,74 +416,100 @@ generate_markdown() {
 
 # Determine output filename based on priority
 determine_filename() {
-    declare -A fields
     local vcf_filename="$1"
-    
-    # Read parsed VCF data to get field values
-    while IFS= read -r line; do
-        field_result=$(parse_simple_field "$line" "FIELD")
-        if [ $? -eq 0 ]; then
-            IFS=':' read -r field_key field_value <<< "$field_result"
-            fields["$field_key"]="$field_value"
-        fi
-    done
-    
     local contact_name=""
     
     # Priority 1: Use FN (Full Name) if available
-    if [[ -n "${fields[FN]:-}" ]]; then
-        contact_name="${fields[FN]}"
+    if [[ -n "${VCF_FIELDS[FN]:-}" ]]; then
+        contact_name="${VCF_FIELDS[FN]}"
     # Priority 2: Construct name from N fields (Given + Family)
-    elif [[ -n "${fields[N_GIVEN]:-}" || -n "${fields[N_FAMILY]:-}" ]]; then
-        local given="${fields[N_GIVEN]:-}"
-        local family="${fields[N_FAMILY]:-}"
-        contact_name=$(echo "$given $family" | sed 's/^[[:space:]]*//;s/[[:space:]]*$//')
+    elif [[ -n "${VCF_FIELDS[N_GIVEN]:-}" || -n "${VCF_FIELDS[N_FAMILY]:-}" ]]; then
+        trim_whitespace "${VCF_FIELDS[N_GIVEN]:-} ${VCF_FIELDS[N_FAMILY]:-}"
+        contact_name="$REPLY"
     # Priority 3: Use UID if no name is available
-    elif [[ -n "${fields[UID]:-}" ]]; then
-        contact_name="${fields[UID]}"
+    elif [[ -n "${VCF_FIELDS[UID]:-}" ]]; then
+        contact_name="${VCF_FIELDS[UID]}"
     # Priority 4: Use VCF filename as final fallback
     else
-        contact_name="$(basename "$vcf_filename" .vcf)"
+        contact_name="${vcf_filename##*/}"
+        if [[ "$contact_name" != ".vcf" ]]; then
+            contact_name="${contact_name%.vcf}"
+        fi
     fi
     
     # Clean the filename
     clean_filename "$contact_name"
 }
 
+# Format the current UTC time as YYYYMMDDTHHMMSSZ
+# printf's %(...)T, added in bash 4.2, avoids starting date for every note
+if (( BASH_VERSINFO[0] > 4 || BASH_VERSINFO[1] >= 2 )); then
+    current_timestamp() {
+        TZ=UTC0 printf -v REPLY '%(%Y%m%dT%H%M%SZ)T' -1
+    }
+else
+    current_timestamp() {
+        REPLY=$(date -u +%Y%m%dT%H%M%SZ)
+    }
+fi
+
 # Extract REV timestamp from existing Markdown file
 extract_rev_timestamp() {
     local markdown_file="$1"
+    local line
     
     if [[ ! -f "$markdown_file" ]]; then
         return 1
     fi
     
     # Look for REV timestamp in format: REV: YYYYMMDDTHHMMSSZ
-    local rev_line
-    rev_line=$(grep "^REV: " "$markdown_file" 2>/dev/null || true)
-    
-    if [[ -n "$rev_line" ]]; then
-        echo "$rev_line" | sed 's/REV: //'
-        return 0
-    fi
+    while IFS= read -r line || [[ -n "$line" ]]; do
+        if [[ "$line" == "REV: "* ]]; then
+            REPLY="${line#REV: }"
+            return 0
+        fi
+    done < "$markdown_file"
     
     return 1
 }
 
-# Convert timestamp format YYYYMMDDTHHMMSSZ to Unix timestamp
+# Convert timestamp format YYYYMMDDTHHMMSSZ to Unix timestamp (0 if invalid)
 timestamp_to_unix() {
     local timestamp="$1"
+    local pattern='^([0-9]{4})([0-9]{2})([0-9]{2}).([0-9]{2})([0-9]{2})([0-9]{2})'
+    local year month day hour minute second era yoe doy doe days_in_month
     
-    # Extract components: YYYYMMDDTHHMMSSZ
-    local year="${timestamp:0:4}"
-    local month="${timestamp:4:2}"
-    local day="${timestamp:6:2}"
-    local hour="${timestamp:9:2}"
-    local minute="${timestamp:11:2}"
-    local second="${timestamp:13:2}"
+    REPLY=0
+    if [[ ! "$timestamp" =~ $pattern ]]; then
+        return 0
+    fi
+    year=$((10#${BASH_REMATCH[1]}))
+    month=$((10#${BASH_REMATCH[2]}))
+    day=$((10#${BASH_REMATCH[3]}))
+    hour=$((10#${BASH_REMATCH[4]}))
+    minute=$((10#${BASH_REMATCH[5]}))
+    second=$((10#${BASH_REMATCH[6]}))
+    
+    if (( month < 1 || month > 12 || hour > 23 || minute > 59 || second > 60 )); then
+        return 0
+    fi
+    days_in_month=(0 31 28 31 30 31 30 31 31 30 31 30 31)
+    if (( month == 2 && (year % 4 == 0 && year % 100 != 0 || year % 400 == 0) )); then
+        days_in_month[2]=29
+    fi
+    if (( day < 1 || day > days_in_month[month] )); then
+        return 0
+    fi
     
-    # Convert to Unix timestamp (UTC)
-    date -u -d "${year}-${month}-${day} ${hour}:${minute}:${second}" +%s 2>/dev/null || echo "0"
+    # Days since the epoch for a proleptic Gregorian date (UTC)
+    if (( month <= 2 )); then
+        year=$((year - 1))
+    fi
+    era=$((year / 400))
+    yoe=$((year - era * 400))
+    doy=$(((153 * ((month + 9) % 12) + 2) / 5 + day - 1))
+    doe=$((yoe * 365 + yoe / 4 - yoe / 100 + doy))
+    REPLY=$((((era * 146097 + doe - 719468) * 24 + hour) * 3600 + minute * 60 + second))
 }
 
 # Check if conversion should be skipped based on modification times
@@ -532,46 +517,41 @@ should_skip_conversion() {
     local vcf_file="$1"
     local markdown_file="$2"
     
-    # Debug output
-    # echo "DEBUG: Checking skip for VCF: $vcf_file, MD: $markdown_file" >&2
-    
     if [[ ! -f "$markdown_file" ]]; then
-        # echo "DEBUG: Markdown file doesn't exist, not skipping" >&2
         return 1  # Don't skip if markdown doesn't exist
     fi
     
-    # Get VCF file modification time
-    local vcf_mtime
-    vcf_mtime=$(stat -c "%Y" "$vcf_file" 2>/dev/null || echo "0")
+    # With mirrored mtimes, skip when neither file is newer than the other;
+    # this needs no stat fork and does not read the markdown file
+    if [[ "$MIRROR_MTIME" == "true" ]]; then
+        [[ ! "$vcf_file" -nt "$markdown_file" && ! "$markdown_file" -nt "$vcf_file" ]]
+        return
+    fi
     
-    # Get REV timestamp from markdown
-    local rev_timestamp
-    rev_timestamp=$(extract_rev_timestamp "$markdown_file")
+    # Get VCF file modification time, preferring the one recorded during discovery
+    local vcf_mtime="${VCF_MTIMES[$vcf_file]:-}"
+    if [[ -z "$vcf_mtime" ]]; then
+        vcf_mtime=$(stat -c "%Y" "$vcf_file" 2>/dev/null || echo "0")
+    fi
     
-    if [[ -z "$rev_timestamp" ]]; then
-        # echo "DEBUG: No REV timestamp found, not skipping" >&2
+    # Get REV timestamp from markdown
+    if ! extract_rev_timestamp "$markdown_file" || [[ -z "$REPLY" ]]; then
         return 1  # Don't skip if we can't find REV timestamp
     fi
     
     # Convert REV timestamp to Unix timestamp
-    local rev_unix
-    rev_unix=$(timestamp_to_unix "$rev_timestamp")
+    timestamp_to_unix "$REPLY"
+    local rev_unix="$REPLY"
     
     if [[ "$rev_unix" -eq 0 ]]; then
-        # echo "DEBUG: REV timestamp conversion failed, not skipping" >&2
         return 1  # Don't skip if timestamp conversion failed
     fi
     
-    # Debug output
-    # echo "DEBUG: VCF mtime: $vcf_mtime, REV unix: $rev_unix" >&2
-    
     # Skip conversion if VCF file is not newer than the REV timestamp
     if [[ "$vcf_mtime" -le "$rev_unix" ]]; then
-        # echo "DEBUG: VCF is older, skipping" >&2
         return 0  # Skip conversion
     fi
     
-    # echo "DEBUG: VCF is newer, not skipping" >&2
     return 1  # Don't skip conversion
 }
 
@@ -588,33 +568,36 @@ convert_vcf_file() {
     fi
     
     # Parse VCF file
-    local parsed_data
-    parsed_data=$(parse_vcf_file "$vcf_file")
+    parse_vcf_file "$vcf_file"
     
     # Determine output filename
-    local output_filename
-    output_filename=$(echo "$parsed_data" | determine_filename "$vcf_file")
+    determine_filename "$vcf_file"
+    local output_filename="$REPLY"
     
     local output_file="$output_dir/${output_filename}.md"
     
     # Check if we should skip conversion based on modification times
     if should_skip_conversion "$vcf_file" "$output_file"; then
-        echo "Skipped: $(basename "$vcf_file") -> ${output_filename}.md (VCF not newer than markdown)"
+        if [[ "$MIRROR_MTIME" == "true" ]]; then
+            echo "Skipped: ${vcf_file##*/} -> ${output_filename}.md (mtime unchanged)"
+        else
+            echo "Skipped: ${vcf_file##*/} -> ${output_filename}.md (VCF not newer than markdown)"
+        fi
         return 0
     fi
     
-    # Generate markdown content
-    local markdown_content
-    markdown_content=$(echo "$parsed_data" | generate_markdown)
+    # Generate markdown content straight into the output file
+    generate_markdown > "$output_file"
     
-    # Write to output file
-    echo "$markdown_content" > "$output_file"
+    if [[ "$MIRROR_MTIME" == "true" ]]; then
+        touch -r "$vcf_file" "$output_file"
+    fi
     
-    echo "Converted: $(basename "$vcf_file") -> ${output_filename}.md"
+    echo "Converted: ${vcf_file##*/} -> ${output_filename}.md"
     return 0
 }
 
-# Find VCF files in a directory
+# Find VCF files in a directory, printing "<mtime><TAB><path>" per file
 find_vcf_files() {
     local dir="$1"
     if [[ ! -d "$dir" ]]; then
@@ -622,12 +605,42 @@ find_vcf_files() {
         return 1
     fi
     
-    find "$dir" -name "*.vcf" -type f
+    find "$dir" -name "*.vcf" -type f -printf '%T@\t%p\n'
+}
+
+# Convert the collected files with up to JOBS background workers
+convert_in_parallel() {
+    local running=0
+    local vcf_file
+    
+    for vcf_file in "$@"; do
+        if (( running >= JOBS )); then
+            if wait -n; then
+                SUCCESSFUL_CONVERSIONS=$((SUCCESSFUL_CONVERSIONS + 1))
+            fi
+            running=$((running - 1))
+        fi
+        {
+            if convert_vcf_file "$vcf_file" "$DESTINATION"; then
+                exit 0
+            fi
+            exit 1
+        } &
+        running=$((running + 1))
+    done
+    
+    while (( running > 0 )); do
+        if wait -n; then
+            SUCCESSFUL_CONVERSIONS=$((SUCCESSFUL_CONVERSIONS + 1))
+        fi
+        running=$((running - 1))
+    done
 }
 
 # Process all sources
 process_sources() {
     local -a all_vcf_files
+    local entry vcf_file
     
     # Collect all VCF files from sources
     for source in "${SOURCES[@]}"; do
@@ -645,7 +658,9 @@ process_sources() {
             local dir_files
             dir_files=$(find_vcf_files "$source")
             if [[ -n "$dir_files" ]]; then
-                while IFS= read -r vcf_file; do
+                while IFS= read -r entry; do
+                    vcf_file="${entry#*$'\t'}"
+                    VCF_MTIMES[$vcf_file]="${entry%%[.$'\t']*}"
                     all_vcf_files+=("$vcf_file")
                     log "Found file: $vcf_file"
                 done <<< "$dir_files"
@@ -672,11 +687,15 @@ process_sources() {
     mkdir -p "$DESTINATION"
     
     # Process each VCF file
-    for vcf_file in "${all_vcf_files[@]}"; do
-        if convert_vcf_file "$vcf_file" "$DESTINATION"; then
-            SUCCESSFUL_CONVERSIONS=$((SUCCESSFUL_CONVERSIONS + 1))
-        fi
-    done
+    if (( JOBS > 1 )); then
+        convert_in_parallel "${all_vcf_files[@]}"
+    else
+        for vcf_file in "${all_vcf_files[@]}"; do
+            if convert_vcf_file "$vcf_file" "$DESTINATION"; then
+                SUCCESSFUL_CONVERSIONS=$((SUCCESSFUL_CONVERSIONS + 1))
+            fi
+        done
+    fi
     
     echo "Successfully completed $SUCCESSFUL_CONVERSIONS/$TOTAL_FILES conversions."
 }
@@ -717,6 +736,18 @@ parse_args() {
                 DESTINATION="$2"
                 shift 2
                 ;;
+            --jobs|-j)
+                if [[ ! "${2:-}" =~ ^[1-9][0-9]*$ ]]; then
+                    echo "Error: --jobs requires a positive integer argument" >&2
+                    exit 1
+                fi
+                JOBS="$2"
+                shift 2
+                ;;
+            --mirror-mtime)
+                MIRROR_MTIME=true
+                shift
+                ;;
             --verbose|-v)
                 VERBOSE=true
                 shift
@@ -743,6 +774,12 @@ parse_args() {
         echo "Error: Destination directory (--obsidian) must be specified" >&2
         exit 1
     fi
+    
+    # wait -n, used to throttle parallel jobs, was added in bash 4.3
+    if (( JOBS > 1 )) && (( BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] < 3 )); then
+        echo "Error: --jobs requires bash 4.3+, but you have bash $BASH_VERSION" >&2
+        exit 1
+    fi
 }
 
 # Main function
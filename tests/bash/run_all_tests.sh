@@ -42,6 +42,8 @@ TEST_FILES=(
     "test_photo_support.sh"
     "test_cli_options.sh"
     "test_shell_compatibility.sh"
+    "test_parallel_jobs.sh"
+    "test_mirror_mtime.sh"
 )
 
 # Track results
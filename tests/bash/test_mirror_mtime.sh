@@ -0,0 +1,59 @@
+#!/bin/bash
+
+# Test mirroring VCF modification times onto notes with --mirror-mtime
+
+set -e
+
+# Source common test configuration
+source "$(dirname "${BASH_SOURCE[0]}")/run_all_tests.sh"
+
+OUTPUT_DIR=$(create_unique_test_dir "mirror_mtime")
+
+echo "Running mirror mtime tests..."
+
+VCF_FILE="$OUTPUT_DIR/test.vcf"
+cat > "$VCF_FILE" << 'EOF'
+BEGIN:VCARD
+VERSION:3.0
+FN:Mirror Test User
+UID:mirror-test-123
+END:VCARD
+EOF
+touch -d "2020-01-02 03:04:05" "$VCF_FILE"
+output_file="$OUTPUT_DIR/Mirror Test User.md"
+
+# Test 1: Note receives the VCF file's mtime
+echo "Test 1: Validating note mtime matches VCF mtime..."
+"$VCF_TO_OBSIDIAN" --file "$VCF_FILE" --obsidian "$OUTPUT_DIR" --mirror-mtime > /dev/null
+
+if [[ "$(stat -c %Y "$output_file")" != "$(stat -c %Y "$VCF_FILE")" ]]; then
+    echo "FAIL: Note mtime does not match VCF mtime"
+    exit 1
+fi
+
+echo "✓ Test 1 passed: Note mtime matches VCF mtime"
+
+# Test 2: Matching mtimes skip conversion
+echo "Test 2: Validating conversion is skipped when mtimes match..."
+result=$("$VCF_TO_OBSIDIAN" --file "$VCF_FILE" --obsidian "$OUTPUT_DIR" --mirror-mtime 2>&1)
+if [[ ! "$result" == *"Skipped:"*"(mtime unchanged)"* ]]; then
+    echo "FAIL: Conversion should have been skipped"
+    echo "Result: $result"
+    exit 1
+fi
+
+echo "✓ Test 2 passed: Conversion skipped when mtimes match"
+
+# Test 3: An older VCF (e.g. restored from backup) is converted again
+echo "Test 3: Validating conversion when VCF mtime moves backwards..."
+touch -d "2019-01-01 00:00:00" "$VCF_FILE"
+result=$("$VCF_TO_OBSIDIAN" --file "$VCF_FILE" --obsidian "$OUTPUT_DIR" --mirror-mtime 2>&1)
+if [[ ! "$result" == *"Converted:"* ]]; then
+    echo "FAIL: Conversion should have been performed when VCF mtime changed"
+    echo "Result: $result"
+    exit 1
+fi
+
+echo "✓ Test 3 passed: Conversion performed when VCF mtime changed"
+
+echo "All mirror mtime tests passed! ✅"
@@ -0,0 +1,75 @@
+#!/bin/bash
+
+# Test parallel conversion with --jobs/-j
+
+set -e
+
+# Source common test configuration
+source "$(dirname "${BASH_SOURCE[0]}")/run_all_tests.sh"
+
+SOURCE_DIR=$(create_unique_test_dir "parallel_jobs_source")
+SERIAL_DIR=$(create_unique_test_dir "parallel_jobs_serial")
+PARALLEL_DIR=$(create_unique_test_dir "parallel_jobs_parallel")
+
+echo "Running parallel job tests..."
+
+for i in $(seq 1 12); do
+    cat > "$SOURCE_DIR/contact_$i.vcf" << EOF
+BEGIN:VCARD
+VERSION:3.0
+FN:Parallel Contact $i
+N:Contact;Parallel $i;;;
+TEL;TYPE=CELL:+1-555-000-$i
+EMAIL;TYPE=WORK:parallel$i@example.com
+ADR;TYPE=HOME:;;$i Main St;Springfield;IL;62701;USA
+CATEGORIES:Parallel,Test
+UID:parallel-$i
+END:VCARD
+EOF
+done
+
+# Test 1: Parallel output matches serial output
+echo "Test 1: Validating -j output matches serial output..."
+"$VCF_TO_OBSIDIAN" --folder "$SOURCE_DIR" --obsidian "$SERIAL_DIR" > /dev/null
+result=$("$VCF_TO_OBSIDIAN" --folder "$SOURCE_DIR" --obsidian "$PARALLEL_DIR" -j 4)
+
+if [[ ! "$result" == *"Successfully completed 12/12 conversions."* ]]; then
+    echo "FAIL: Parallel run did not report all conversions"
+    echo "Result: $result"
+    exit 1
+fi
+
+# REV holds the wall-clock time, so it is masked before comparing
+for md_file in "$SERIAL_DIR"/*.md; do
+    name="${md_file##*/}"
+    if ! diff <(grep -v '^REV: ' "$md_file") <(grep -v '^REV: ' "$PARALLEL_DIR/$name") > /dev/null; then
+        echo "FAIL: Parallel output differs for $name"
+        exit 1
+    fi
+done
+
+echo "✓ Test 1 passed: Parallel output matches serial output"
+
+# Test 2: Parallel run skips unchanged files
+echo "Test 2: Validating parallel run skips unchanged files..."
+result=$("$VCF_TO_OBSIDIAN" --folder "$SOURCE_DIR" --obsidian "$PARALLEL_DIR" --jobs 3)
+skipped=$(grep -c "^Skipped:" <<< "$result" || true)
+
+if [[ $skipped -ne 12 ]]; then
+    echo "FAIL: Expected 12 skipped files, got $skipped"
+    echo "Result: $result"
+    exit 1
+fi
+
+echo "✓ Test 2 passed: Parallel run skips unchanged files"
+
+# Test 3: Invalid job count is rejected
+echo "Test 3: Validating invalid job count is rejected..."
+if "$VCF_TO_OBSIDIAN" --folder "$SOURCE_DIR" --obsidian "$PARALLEL_DIR" -j 0 2>/dev/null; then
+    echo "FAIL: -j 0 should be rejected"
+    exit 1
+fi
+
+echo "✓ Test 3 passed: Invalid job count is rejected"
+
+echo "All parallel job tests passed! ✅"
@@ -0,0 +1,150 @@
+"""
+Tests for worker autotuning and background note writes.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, Autotuner, WritePool, RunHistory
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Tuned Contact {index:03d}
+UID:tuned-{index}
+END:VCARD
+"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def create_contacts(vcf_dir, count):
+    for index in range(count):
+        create_test_vcf(vcf_dir, f"tuned{index:03d}.vcf", VCF_TEMPLATE.format(index=index))
+
+
+class TestAutotuner:
+    """Test cases for the Autotuner class."""
+
+    def test_latency_bound_stage_gets_threads(self):
+        """A stage that mostly waits gets about wall/CPU threads; a computing stage keeps one."""
+        tuner = Autotuner(sample_size=3)
+        for _ in range(3):
+            tuner.record('parse', 0.004, 0.004)
+            assert not tuner.ready
+            tuner.record('write', 0.010, 0.002)
+
+        assert tuner.ready
+        assert tuner.tune() == (1, 5)
+        assert not tuner.ready and tuner.tuned
+        assert "pin with --parse-workers 1 --write-workers 5" in tuner.describe()
+        assert tuner.to_dict() == {'parse': 1, 'write': 5, 'tuned': True}
+
+    def test_cpu_bound_run_keeps_one_thread(self):
+        """When the process already uses a whole core, waiting is GIL contention, not I/O."""
+        tuner = Autotuner(sample_size=1)
+        tuner.start()
+        deadline = time.process_time() + 0.2
+        while time.process_time() < deadline:
+            pass
+        tuner.record('parse', 0.010, 0.002)
+        tuner.record('write', 0.010, 0.002)
+
+        assert tuner.tune() == (1, 1)
+        assert tuner.utilization > 0.5
+
+    def test_pinned_counts(self):
+        """Pinned counts are used as given, and a fully pinned tuner never samples."""
+        tuner = Autotuner(parse_workers=3, write_workers=2)
+        assert (tuner.parse_workers, tuner.write_workers) == (3, 2)
+        assert not tuner.sampling
+
+        tuner = Autotuner(write_workers=2, sample_size=1)
+        tuner.record('parse', 0.010, 0.005)
+        assert tuner.ready
+        assert tuner.tune() == (2, 2)
+        with pytest.raises(ValueError):
+            Autotuner(parse_workers=0)
+
+
+class TestWorkers:
+    """Test cases for parse and write workers in VCFConverter.iter_convert()."""
+
+    def test_results_stay_in_discovery_order(self, temp_dirs):
+        """Several parse and write threads convert everything and keep the result order."""
+        create_contacts(temp_dirs['test_vcf_dir'], 40)
+        output_dir = temp_dirs['test_output_dir']
+        converter = VCFConverter(parse_workers=3, write_workers=4)
+
+        results = list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], output_dir))
+
+        sources = list(converter.discover_vcf_files([temp_dirs['test_vcf_dir']], []))
+        assert [result.source for result in results] == sources
+        assert {result.status for result in results} == {"converted"}
+        assert len(list(output_dir.glob("*.md"))) == 40
+        assert "FN: Tuned Contact 007" in (output_dir / "Tuned Contact 007.md").read_text(encoding="utf-8")
+        (record,) = RunHistory(output_dir / ".vcf-to-obsidian" / "history.jsonl").load()
+        assert record['workers'] == {'parse': 3, 'write': 4, 'tuned': False}
+
+    def test_choice_is_printed(self, temp_dirs, capsys):
+        """The tuned configuration is printed once, with the options that pin it."""
+        create_contacts(temp_dirs['test_vcf_dir'], 12)
+        converter = VCFConverter()
+        converter.autotuner = Autotuner(sample_size=5)
+
+        successful, total, _ = converter.convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']
+        )
+
+        assert successful == total == 12
+        lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("Autotune:")]
+        assert len(lines) == 1
+        assert "pin with --parse-workers" in lines[0]
+        assert converter.autotuner.tuned
+
+    def test_failed_background_write_fails_the_file(self, temp_dirs):
+        """A note that cannot be written fails and quarantines its file."""
+        create_contacts(temp_dirs['test_vcf_dir'], 3)
+        output_dir = temp_dirs['test_output_dir']
+        (output_dir / "Tuned Contact 001.md").mkdir()
+        converter = VCFConverter(write_workers=2, preload=False)
+
+        results = list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], output_dir))
+
+        assert {result.source.name: result.status for result in results} == {
+            "tuned000.vcf": "converted", "tuned001.vcf": "failed", "tuned002.vcf": "converted",
+        }
+        assert converter.failures[0][0].name == "tuned001.vcf"
+        assert "tuned001.vcf" in (output_dir / ".vcf-to-obsidian" / "quarantine.json").read_text(encoding="utf-8")
+
+    def test_write_pool_orders_writes_to_one_note(self, temp_dirs):
+        """A second write of a note starts only after the first finished."""
+        note = temp_dirs['test_output_dir'] / "note.md"
+        pool = WritePool(4)
+
+        def write(text, delay):
+            def run():
+                time.sleep(delay)
+                note.write_text(text, encoding="utf-8")
+            return run
+
+        pool.submit(note, write("first", 0.1))
+        pool.submit(note, write("second", 0))
+        pool.close()
+
+        assert note.read_text(encoding="utf-8") == "second"
+        assert len(pool.take()) == 2
+
+    def test_cli_rejects_zero_workers(self, temp_dirs):
+        """Worker counts must be at least one."""
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--folder", str(temp_dirs['test_vcf_dir']),
+             "--obsidian", str(temp_dirs['test_output_dir']), "--write-workers", "0"],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 2
+        assert "--write-workers" in result.stderr
@@ -0,0 +1,157 @@
+"""
+Tests for the byte-offset card index used for multi-card VCF files.
+"""
+
+import pytest
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, CardIndex
+
+
+CARD_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:{name}
+UID:{uid}
+EMAIL:{uid}@example.com
+END:VCARD
+"""
+
+
+def make_address_book(*contacts):
+    """Build multi-card VCF text from (name, uid) pairs."""
+    return "".join(CARD_TEMPLATE.format(name=name, uid=uid) for name, uid in contacts)
+
+
+class TestCardIndex:
+    """Test cases for CardIndex and indexed multi-card conversion."""
+
+    def test_scan_finds_card_offsets(self, temp_dirs):
+        """Test that scan reports the byte range and UID of every card."""
+        content = make_address_book(("Alice", "uid-a"), ("Bob", "uid-b"))
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", content)
+
+        cards = CardIndex().scan(vcf_path)
+
+        assert [card['uid'] for card in cards] == ["uid-a", "uid-b"]
+        raw = vcf_path.read_bytes()
+        for card in cards:
+            block = raw[card['offset']:card['offset'] + card['length']]
+            assert block.startswith(b"BEGIN:VCARD")
+            assert block.rstrip().endswith(b"END:VCARD")
+
+    def test_scan_empty_file(self, temp_dirs):
+        """Test that scanning an empty file returns no cards."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "empty.vcf", "")
+        assert CardIndex().scan(vcf_path) == []
+
+    def test_index_round_trip(self, temp_dirs):
+        """Test that the index is persisted and reloaded."""
+        content = make_address_book(("Alice", "uid-a"), ("Bob", "uid-b"))
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", content)
+        index_path = temp_dirs['test_dir'] / "state" / "card-index.json"
+
+        index = CardIndex(index_path)
+        cards = index.scan(vcf_path)
+        for card in cards:
+            card['note'] = f"{card['uid']}.md"
+        index.update(vcf_path, cards)
+        index.save()
+
+        reloaded = CardIndex(index_path)
+        assert reloaded.sources == index.sources
+
+    def test_converts_every_card(self, temp_dirs):
+        """Test that every card of a multi-card file becomes a note."""
+        content = make_address_book(("Alice", "uid-a"), ("Bob", "uid-b"), ("Carol", "uid-c"))
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", content)
+
+        converter = VCFConverter(card_index=True)
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        names = sorted(p.name for p in temp_dirs['test_output_dir'].glob("*.md"))
+        assert names == ["Alice.md", "Bob.md", "Carol.md"]
+        assert (temp_dirs['test_output_dir'] / ".vcf-to-obsidian" / "card-index.json").exists()
+
+    def test_only_changed_cards_are_reconverted(self, temp_dirs, capsys):
+        """Test that an edit to one card re-parses only that card."""
+        contacts = [("Alice", "uid-a"), ("Bob", "uid-b"), ("Carol", "uid-c")]
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", make_address_book(*contacts))
+        output_dir = temp_dirs['test_output_dir']
+
+        VCFConverter(card_index=True).convert_vcf_to_markdown(vcf_path, output_dir)
+        capsys.readouterr()
+
+        contacts[1] = ("Robert", "uid-b")
+        create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", make_address_book(*contacts))
+
+        converter = VCFConverter(card_index=True)
+        parsed = []
+        original_read = converter.reader.read_vcf_content
+        converter.reader.read_vcf_content = lambda content: parsed.append(content) or original_read(content)
+        assert converter.convert_vcf_to_markdown(vcf_path, output_dir)
+
+        assert len(parsed) == 1 and "FN:Robert" in parsed[0]
+        names = sorted(p.name for p in output_dir.glob("*.md"))
+        assert names == ["Alice.md", "Carol.md", "Robert.md"]
+        assert "Skipped: 2 unchanged card(s)" in capsys.readouterr().out
+
+    def test_removed_card_note_is_deleted(self, temp_dirs):
+        """Test that a card deleted from the file has its note removed."""
+        vcf_path = create_test_vcf(
+            temp_dirs['test_vcf_dir'], "book.vcf",
+            make_address_book(("Alice", "uid-a"), ("Bob", "uid-b"), ("Carol", "uid-c")),
+        )
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(card_index=True).convert_vcf_to_markdown(vcf_path, output_dir)
+
+        create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", make_address_book(("Alice", "uid-a"), ("Carol", "uid-c")))
+        VCFConverter(card_index=True).convert_vcf_to_markdown(vcf_path, output_dir)
+
+        names = sorted(p.name for p in output_dir.glob("*.md"))
+        assert names == ["Alice.md", "Carol.md"]
+
+    @pytest.mark.parametrize("remaining", [[("Alice", "uid-a")], []])
+    def test_shrunk_file_removes_orphan_notes(self, temp_dirs, remaining):
+        """Test that a file cut down to one card or none still loses its dropped cards."""
+        vcf_path = create_test_vcf(
+            temp_dirs['test_vcf_dir'], "book.vcf",
+            make_address_book(("Alice", "uid-a"), ("Bob", "uid-b"), ("Carol", "uid-c")),
+        )
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(card_index=True).convert_vcf_to_markdown(vcf_path, output_dir)
+
+        create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", make_address_book(*remaining))
+        VCFConverter(card_index=True).convert_vcf_to_markdown(vcf_path, output_dir)
+
+        names = sorted(p.name for p in output_dir.glob("*.md"))
+        assert names == [f"{name}.md" for name, _ in remaining]
+        index = CardIndex(output_dir / ".vcf-to-obsidian" / "card-index.json")
+        indexed = index.sources.get(index._key(vcf_path), [])
+        assert [card['uid'] for card in indexed] == [uid for _, uid in remaining]
+
+    def test_single_card_files_use_regular_path(self, temp_dirs):
+        """Test that single-card files are still skipped by modification time."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "one.vcf", make_address_book(("Alice", "uid-a")))
+        converter = VCFConverter(card_index=True)
+
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        assert (temp_dirs['test_output_dir'] / "Alice.md").exists()
+        assert not (temp_dirs['test_output_dir'] / ".vcf-to-obsidian").exists()
+
+    def test_failed_card_is_not_reparsed_until_changed(self, temp_dirs):
+        """Test that a card that failed to parse is remembered in the index."""
+        content = make_address_book(("Alice", "uid-a"), ("Broken", "uid-x"))
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "book.vcf", content)
+        output_dir = temp_dirs['test_output_dir']
+
+        first = VCFConverter(card_index=True)
+        original_read = first.reader.read_vcf_content
+        first.reader.read_vcf_content = lambda text: 1 / 0 if "Broken" in text else original_read(text)
+        assert first.convert_vcf_to_markdown(vcf_path, output_dir) is False
+
+        second = VCFConverter(card_index=True)
+        parsed = []
+        second.reader.read_vcf_content = lambda text: parsed.append(text)
+        assert second.convert_vcf_to_markdown(vcf_path, output_dir) is False
+        assert parsed == []
+        assert len(second.failures) == 1
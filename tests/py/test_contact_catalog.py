@@ -0,0 +1,141 @@
+"""
+Tests for the incrementally maintained contact catalog and index note.
+"""
+
+import csv
+import json
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, ContactCatalog, NoteUpdater
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:{fn}
+UID:{uid}
+ORG:{org}
+EMAIL:{email}
+TEL:+1-555-0100
+END:VCARD"""
+
+
+def make_card(directory, name, fn, uid, org="Example Corp", email="someone@example.com"):
+    return create_test_vcf(directory, name, VCF_TEMPLATE.format(fn=fn, uid=uid, org=org, email=email))
+
+
+def load_contacts(output_dir):
+    with open(output_dir / ".vcf-to-obsidian" / "contacts.json", encoding="utf-8") as f:
+        return json.load(f)["contacts"]
+
+
+class TestContactCatalog:
+    """Test cases for the ContactCatalog class."""
+
+    def test_conversion_fills_catalog(self, temp_dirs):
+        """Every converted contact is listed in JSON, CSV, and the index note."""
+        make_card(temp_dirs['test_vcf_dir'], "ada.vcf", "Ada Lovelace", "uid-ada", email="ada@example.com")
+        make_card(temp_dirs['test_vcf_dir'], "alan.vcf", "Alan Turing", "uid-alan", org="Bletchley Park")
+        output_dir = temp_dirs['test_output_dir']
+
+        VCFConverter(catalog=True).convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        contacts = load_contacts(output_dir)
+        assert [entry['uid'] for entry in contacts] == ["uid-ada", "uid-alan"]
+        assert contacts[0]['emails'] == ["ada@example.com"]
+        assert contacts[0]['phones'] == ["+1-555-0100"]
+        assert contacts[1]['org'] == "Bletchley Park"
+        assert contacts[1]['path'] == "Alan Turing.md"
+
+        with open(output_dir / ".vcf-to-obsidian" / "contacts.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]['fn'] == "Ada Lovelace"
+        assert rows[0]['emails'] == "ada@example.com"
+
+        index_note = (output_dir / "Contacts Index.md").read_text(encoding="utf-8")
+        assert "| [[Ada Lovelace]] | Example Corp | ada@example.com | +1-555-0100 | uid-ada |" in index_note
+
+    def test_disabled_by_default(self, temp_dirs):
+        """Without catalog=True no catalog files are written."""
+        make_card(temp_dirs['test_vcf_dir'], "ada.vcf", "Ada Lovelace", "uid-ada")
+        output_dir = temp_dirs['test_output_dir']
+
+        VCFConverter().convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        assert not (output_dir / "Contacts Index.md").exists()
+        assert not (output_dir / ".vcf-to-obsidian" / "contacts.json").exists()
+
+    def test_rename_updates_entry(self, temp_dirs):
+        """A renamed contact keeps one entry, pointing at the new note."""
+        vcf_path = make_card(temp_dirs['test_vcf_dir'], "ada.vcf", "Ada Lovelace", "uid-ada")
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(catalog=True).convert_vcf_to_markdown(vcf_path, output_dir)
+
+        make_card(temp_dirs['test_vcf_dir'], "ada.vcf", "Ada King", "uid-ada")
+        VCFConverter(catalog=True).convert_vcf_to_markdown(vcf_path, output_dir)
+
+        contacts = load_contacts(output_dir)
+        assert len(contacts) == 1
+        assert contacts[0]['fn'] == "Ada King"
+        assert contacts[0]['path'] == "Ada King.md"
+        assert "Ada Lovelace" not in (output_dir / "Contacts Index.md").read_text(encoding="utf-8")
+
+    def test_unchanged_run_leaves_files_untouched(self, temp_dirs):
+        """A run that changes no contact does not rewrite the catalog."""
+        make_card(temp_dirs['test_vcf_dir'], "ada.vcf", "Ada Lovelace", "uid-ada")
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(catalog=True, rev_source="mtime").convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], output_dir
+        )
+        paths = [
+            output_dir / "Contacts Index.md",
+            output_dir / ".vcf-to-obsidian" / "contacts.json",
+            output_dir / ".vcf-to-obsidian" / "contacts.csv",
+        ]
+        before = [path.stat().st_mtime_ns for path in paths]
+
+        VCFConverter(catalog=True, rev_source="mtime").convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], output_dir
+        )
+
+        assert [path.stat().st_mtime_ns for path in paths] == before
+
+    def test_link_alias_and_escaping(self, temp_dirs):
+        """Names that differ from the note name are aliased and pipes are escaped."""
+        catalog = ContactCatalog(temp_dirs['test_output_dir'], temp_dirs['test_output_dir'] / ".state")
+        note = catalog.render_note([{
+            'uid': "uid-1", 'fn': "Smith, Jo", 'org': "A|B", 'emails': [], 'phones': [],
+            'path': "Jo Smith.md",
+        }])
+
+        assert "| [[Jo Smith\\|Smith, Jo]] | A\\|B |  |  | uid-1 |" in note
+
+
+class TestWriteChanges:
+    """Test cases for NoteUpdater.write_changes."""
+
+    def test_writes_only_changed_tail(self, temp_dirs):
+        """Only the bytes from the first difference are written."""
+        path = temp_dirs['test_output_dir'] / "table.md"
+        old = b"header\n" + b"row\n" * 1000
+        path.write_bytes(old)
+        new = old[:-4] + b"new row\n"
+
+        written = NoteUpdater().write_changes(path, new)
+
+        assert path.read_bytes() == new
+        assert written == len(b"new row\n")
+
+    def test_unchanged_content_not_written(self, temp_dirs):
+        """Identical content is not written at all."""
+        path = temp_dirs['test_output_dir'] / "table.md"
+        path.write_bytes(b"same\n")
+
+        assert NoteUpdater().write_changes(path, b"same\n") == 0
+
+    def test_shorter_content_truncates(self, temp_dirs):
+        """A shorter replacement truncates the file."""
+        path = temp_dirs['test_output_dir'] / "table.md"
+        path.write_bytes(b"one\ntwo\nthree\n")
+
+        NoteUpdater().write_changes(path, b"one\n")
+
+        assert path.read_bytes() == b"one\n"
@@ -0,0 +1,91 @@
+"""
+Tests for filtering contacts by category, organization, or field predicates.
+"""
+
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, ContactFilter, Destination
+
+
+WORK_VCF = """BEGIN:VCARD
+VERSION:3.0
+FN:Work Contact
+ORG:Acme Corp;Sales
+CATEGORIES:Work,Priority
+UID:work-1
+END:VCARD"""
+
+HOME_VCF = """BEGIN:VCARD
+VERSION:3.0
+FN:Home Contact
+CATEGORIES:Family
+UID:home-1
+END:VCARD"""
+
+
+class TestContactFilter:
+    """Test cases for the ContactFilter class."""
+
+    def test_raw_equality_on_list_items(self):
+        """Test that CATEGORIES items are matched one by one, ignoring case."""
+        contact_filter = ContactFilter(include=["CATEGORIES=priority"])
+        assert contact_filter.matches_raw(WORK_VCF) is True
+        assert contact_filter.matches_raw(HOME_VCF) is False
+
+    def test_raw_regex_and_exclude(self):
+        """Test regex predicates and that excludes win over includes."""
+        contact_filter = ContactFilter(include=["FN~contact$"], exclude=["ORG~^acme"])
+        assert contact_filter.matches_raw(WORK_VCF) is False
+        assert contact_filter.matches_raw(HOME_VCF) is True
+
+    def test_raw_handles_folding_and_escapes(self):
+        """Test that folded lines and escaped separators are understood."""
+        content = "BEGIN:VCARD\nVERSION:3.0\nFN:X\nCATEGORIES:Friends\\, Old,Ne\n ighbors\nEND:VCARD"
+        contact_filter = ContactFilter(include=["CATEGORIES=Neighbors"])
+        assert contact_filter.matches_raw(content) is True
+        assert ContactFilter(include=["CATEGORIES=Friends, Old"]).matches_raw(content) is True
+
+    def test_structured_field_needs_parse(self, temp_dirs):
+        """Test that predicates on structured fields defer to the parsed card."""
+        contact_filter = ContactFilter(include=["N~Smith"])
+        content = "BEGIN:VCARD\nVERSION:3.0\nFN:Jane Smith\nN:Smith;Jane;;;\nEND:VCARD"
+        assert contact_filter.matches_raw(content) is None
+
+        vcard = VCFConverter().reader.read_vcf_content(content)
+        assert contact_filter.matches(vcard) is True
+
+    def test_invalid_predicate(self):
+        """Test that malformed predicates raise ValueError."""
+        with pytest.raises(ValueError):
+            ContactFilter(include=["no operator"])
+        with pytest.raises(ValueError):
+            ContactFilter(exclude=["FN~("])
+
+
+class TestFilteredConversion:
+    """Test cases for filtering during conversion."""
+
+    def test_excluded_file_is_not_parsed(self, temp_dirs, capsys):
+        """Test that a file rejected by the raw scan is never parsed."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "home.vcf", HOME_VCF)
+        converter = VCFConverter(include=["CATEGORIES=Work"])
+        converter.reader.read_vcf_content = lambda content: pytest.fail("excluded card was parsed")
+
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir']) is True
+        assert "Filtered: home.vcf" in capsys.readouterr().out
+        assert list(temp_dirs['test_output_dir'].glob("*.md")) == []
+
+    def test_per_destination_filters(self, temp_dirs):
+        """Test that destination options route cards to different vaults."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "work.vcf", WORK_VCF.replace("CATEGORIES:Work,Priority\n", ""))
+        create_test_vcf(temp_dirs['test_vcf_dir'], "home.vcf", HOME_VCF.replace("CATEGORIES:Family\n", ""))
+        base = temp_dirs['test_output_dir']
+        destinations = [
+            Destination.parse(f"{base / 'team'}::include=ORG=acme corp,photos=none"),
+            Destination.parse(f"{base / 'personal'}::exclude=ORG~^Acme"),
+        ]
+
+        VCFConverter().process_tasks([temp_dirs['test_vcf_dir']], destinations, [], False, [])
+
+        assert sorted(p.name for p in (base / "team").glob("*.md")) == ["Work Contact.md"]
+        assert sorted(p.name for p in (base / "personal").glob("*.md")) == ["Home Contact.md"]
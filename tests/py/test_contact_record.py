@@ -0,0 +1,96 @@
+"""
+Tests for the ContactRecord interchange format.
+"""
+
+import pickle
+from conftest import create_test_vcf
+from vcf_to_obsidian import (
+    VCFConverter, VCFReader, MarkdownWriter, FilenameGenerator, ContactFilter, ContactRecord,
+)
+
+
+FULL_VCF = """BEGIN:VCARD
+VERSION:3.0
+N:Doe;Jane;;;
+FN:Jane Doe
+ORG:Acme;Research
+EMAIL;TYPE=work,internet:jane@acme.example
+EMAIL:jane@home.example
+TEL;TYPE=cell:+1 555 0100
+URL;TYPE=home:https://jane.example
+ADR;TYPE=home:;Apt 4;1 Main St;Springfield;IL;62701;USA
+BDAY:1990-01-02
+NOTE:Met at the conference
+UID:record-1
+REV:20240102T030405Z
+END:VCARD
+"""
+
+
+class TestContactRecord:
+    """Test cases for the ContactRecord class."""
+
+    def test_from_vcard(self):
+        """Typed multi-valued entries are extracted once from the vobject tree."""
+        record = VCFReader().read_record(content=FULL_VCF)
+
+        assert (record.uid, record.fn, record.family, record.given) == ("record-1", "Jane Doe", "Doe", "Jane")
+        assert [(email.type, email.value) for email in record.emails] == [
+            ("WORK", "jane@acme.example"), ("DEFAULT", "jane@home.example"),
+        ]
+        assert record.tels[0].type == "CELL"
+        (address,) = record.addresses
+        assert (address.type, address.street, address.city, address.code) == ("HOME", "1 Main St", "Springfield", "62701")
+        assert record.values("org") == ("Acme", "Research")
+        assert not hasattr(record, '__dict__')
+
+    def test_renders_like_the_vobject_tree(self):
+        """The writer and filename generator give the same output for a record and a vCard."""
+        reader = VCFReader()
+        vcard = reader.read_vcf_content(FULL_VCF)
+        record = ContactRecord.from_vcard(vcard)
+        rev = reader.get_rev_timestamp(record)
+
+        assert rev == reader.get_rev_timestamp(vcard)
+        writer = MarkdownWriter()
+        assert writer.generate_obsidian_markdown(record, rev) == writer.generate_obsidian_markdown(vcard, rev)
+        generator = FilenameGenerator()
+        assert generator.generate_filename(record, "x.vcf") == generator.generate_filename(vcard, "x.vcf") == "Jane Doe"
+
+    def test_filename_fallbacks(self):
+        """An empty N still takes precedence over the UID, as before."""
+        reader = VCFReader()
+        generator = FilenameGenerator()
+        empty_n = reader.read_record(content="BEGIN:VCARD\nVERSION:3.0\nN:;;;;\nUID:u-1\nEND:VCARD\n")
+        uid_only = reader.read_record(content="BEGIN:VCARD\nVERSION:3.0\nUID:u-2\nEND:VCARD\n")
+
+        assert generator.generate_filename(empty_n, "a.vcf") == "untitled"
+        assert generator.generate_filename(uid_only, "a.vcf") == "u-2"
+
+    def test_pickles_compactly(self):
+        """A record survives pickling and is much smaller than the vobject tree."""
+        vcard = VCFReader().read_vcf_content(FULL_VCF)
+        record = ContactRecord.from_vcard(vcard)
+
+        data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        assert pickle.loads(data) == record
+        assert len(data) * 2 < len(pickle.dumps(vcard, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def test_filter_matches_record(self):
+        """Filters evaluate list properties item by item on a record."""
+        record = VCFReader().read_record(content=FULL_VCF)
+
+        assert ContactFilter(include=["EMAIL=JANE@HOME.example"]).matches(record)
+        assert ContactFilter(include=["ORG=Research"]).matches(record)
+        assert not ContactFilter(exclude=["EMAIL~acme"]).matches(record)
+
+    def test_parse_cache_holds_records(self, temp_dirs):
+        """The parse cache stores records rather than vobject trees."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "jane.vcf", FULL_VCF)
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(parse_cache=True).convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        (entry,) = (output_dir / ".vcf-to-obsidian" / "parse-cache").glob("*.pickle")
+        with open(entry, 'rb') as f:
+            assert isinstance(pickle.load(f), ContactRecord)
+        assert "jane@acme.example" in (output_dir / "Jane Doe.md").read_text(encoding="utf-8")
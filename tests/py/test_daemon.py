@@ -0,0 +1,160 @@
+"""
+Tests for the conversion daemon and deleting the notes of removed sources.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, ConversionDaemon, SourceMap
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Daemon Contact {index}
+UID:daemon-{index}
+END:VCARD
+"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def make_sources(directory, count):
+    return [
+        create_test_vcf(directory, f"daemon_{index}.vcf", VCF_TEMPLATE.format(index=index))
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def daemon(temp_dirs):
+    """Run a daemon on a thread for the duration of a test."""
+    socket_path = temp_dirs['test_dir'] / "daemon.sock"
+    server = ConversionDaemon(
+        VCFConverter(), temp_dirs['test_output_dir'], socket_path,
+        folder_sources=[temp_dirs['test_vcf_dir']], batch_window=0.2,
+    )
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    for _ in range(100):
+        if socket_path.exists():
+            break
+        time.sleep(0.02)
+    yield server
+    ConversionDaemon.request(socket_path, {'op': 'shutdown'}, timeout=10)
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+
+class TestSourceMap:
+    """Test cases for the SourceMap class and VCFConverter.delete_sources()."""
+
+    def test_note_moves_between_sources(self, temp_dirs):
+        """A note belongs to the file that produced it last."""
+        map_path = temp_dirs['test_dir'] / "sources.json"
+        source_map = SourceMap(map_path)
+        source_map.update("old.vcf", ["Alice.md", "Bob.md"])
+        source_map.update("new.vcf", ["Bob.md"])
+        source_map.save()
+
+        reloaded = SourceMap(map_path)
+        assert reloaded.notes_for("old.vcf") == ["Alice.md"]
+        assert reloaded.pop("new.vcf") == ["Bob.md"]
+        assert reloaded.notes_for("new.vcf") == []
+
+    def test_delete_sources_removes_notes(self, temp_dirs):
+        """Notes of a deleted VCF file are removed without reading it."""
+        sources = make_sources(temp_dirs['test_vcf_dir'], 2)
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(source_map=True, catalog=True).convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], output_dir
+        )
+
+        sources[0].unlink()
+        (result,) = VCFConverter(source_map=True, catalog=True).delete_sources([sources[0]], output_dir)
+
+        assert result.status == "deleted"
+        assert result.notes == (output_dir / "Daemon Contact 0.md",)
+        assert not (output_dir / "Daemon Contact 0.md").exists()
+        assert (output_dir / "Daemon Contact 1.md").exists()
+        with open(output_dir / ".vcf-to-obsidian" / "contacts.json", encoding="utf-8") as f:
+            assert [entry['uid'] for entry in json.load(f)["contacts"]] == ["daemon-1"]
+
+    def test_delete_refuses_existing_source(self, temp_dirs):
+        """A file that still exists, or was never converted, is not deleted."""
+        (source,) = make_sources(temp_dirs['test_vcf_dir'], 1)
+        output_dir = temp_dirs['test_output_dir']
+        converter = VCFConverter(source_map=True)
+        converter.convert_vcf_files_from_sources([], [source], output_dir)
+
+        results = converter.delete_sources([source, temp_dirs['test_vcf_dir'] / "unknown.vcf"], output_dir)
+
+        assert [result.status for result in results] == ["failed", "failed"]
+        assert (output_dir / "Daemon Contact 0.md").exists()
+
+
+class TestConversionDaemon:
+    """Test cases for the ConversionDaemon class."""
+
+    def test_convert_and_delete(self, daemon, temp_dirs):
+        """Convert and delete requests are answered with their results."""
+        (source,) = make_sources(temp_dirs['test_vcf_dir'], 1)
+        socket_path = daemon.socket_path
+
+        reply = ConversionDaemon.request(socket_path, {'op': 'convert', 'paths': [str(source)]}, timeout=30)
+        assert reply['ok']
+        assert [result['status'] for result in reply['results']] == ["converted"]
+
+        source.unlink()
+        reply = ConversionDaemon.request(socket_path, {'op': 'delete', 'paths': [str(source)]}, timeout=30)
+        assert reply['ok']
+        assert reply['results'][0]['status'] == "deleted"
+        assert not list(temp_dirs['test_output_dir'].glob("*.md"))
+
+    def test_burst_is_one_batch(self, daemon, temp_dirs):
+        """Requests that arrive together are converted in a single pass."""
+        sources = make_sources(temp_dirs['test_vcf_dir'], 4)
+        replies = [None] * len(sources)
+
+        def send(position):
+            replies[position] = ConversionDaemon.request(
+                daemon.socket_path, {'op': 'convert', 'paths': [str(sources[position])]}, timeout=30
+            )
+
+        threads = [threading.Thread(target=send, args=(position,)) for position in range(len(sources))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert daemon.batches == 1
+        assert [reply['results'][0]['source'] for reply in replies] == [str(source) for source in sources]
+        assert len(list(temp_dirs['test_output_dir'].glob("*.md"))) == 4
+
+    def test_sync_and_invalid_requests(self, daemon, temp_dirs):
+        """Sync converts the configured folders; malformed requests get an error."""
+        make_sources(temp_dirs['test_vcf_dir'], 3)
+
+        reply = ConversionDaemon.request(daemon.socket_path, {'op': 'sync'}, timeout=30)
+        assert reply['ok']
+        assert len(reply['results']) == 3
+
+        reply = ConversionDaemon.request(daemon.socket_path, {'op': 'rename'}, timeout=30)
+        assert not reply['ok']
+        assert "Invalid request" in reply['error']
+        assert ConversionDaemon.request(daemon.socket_path, {'op': 'ping'}, timeout=30)['ok']
+
+    def test_cli_refuses_second_daemon(self, daemon, temp_dirs):
+        """A second daemon on the same socket exits with an error."""
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--obsidian", str(temp_dirs['test_output_dir']),
+             "--daemon", str(daemon.socket_path)],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 1
+        assert "already listening" in result.stderr
@@ -0,0 +1,101 @@
+"""
+Tests for writing several destination vaults from a single parse.
+"""
+
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, Destination
+
+
+VCF_CONTENT = """BEGIN:VCARD
+VERSION:3.0
+FN:Fanout Contact
+UID:fanout-1
+PHOTO;ENCODING=b;TYPE=JPEG:dGVzdA==
+END:VCARD"""
+
+
+class TestDestination:
+    """Test cases for the Destination class."""
+
+    def test_parse_plain_directory(self):
+        """Test that a bare directory uses default options."""
+        destination = Destination.parse("./vault")
+        assert str(destination.path) == "vault"
+        assert destination.photos == "embed"
+
+    def test_parse_options(self):
+        """Test that options after :: are applied."""
+        destination = Destination.parse("./archive::photos=none")
+        assert str(destination.path) == "archive"
+        assert destination.photos == "none"
+
+    def test_parse_rejects_unknown_options(self):
+        """Test that unknown or invalid options raise ValueError."""
+        with pytest.raises(ValueError):
+            Destination.parse("./vault::layout=flat")
+        with pytest.raises(ValueError):
+            Destination.parse("./vault::photos=thumbnail")
+
+
+class TestFanOut:
+    """Test cases for converting into several destinations."""
+
+    def _destinations(self, temp_dirs):
+        base = temp_dirs['test_output_dir']
+        return [
+            Destination(base / "team"),
+            Destination(base / "personal"),
+            Destination(base / "archive", photos="none"),
+        ]
+
+    def test_parse_once_render_once_per_option_set(self, temp_dirs, monkeypatch):
+        """Test that the file is parsed once and rendered once per photo mode."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "fanout.vcf", VCF_CONTENT)
+        destinations = self._destinations(temp_dirs)
+        for destination in destinations:
+            destination.path.mkdir()
+        converter = VCFConverter()
+
+        calls = {'read': 0, 'render': 0}
+        read, render = converter.reader.read_vcf_file, converter.writer.generate_obsidian_markdown
+
+        def counting_read(*args):
+            calls['read'] += 1
+            return read(*args)
+
+        def counting_render(*args):
+            calls['render'] += 1
+            return render(*args)
+
+        monkeypatch.setattr(converter.reader, "read_vcf_file", counting_read)
+        monkeypatch.setattr(converter.writer, "generate_obsidian_markdown", counting_render)
+
+        assert converter.convert_vcf_to_markdown(vcf_path, destinations)
+        assert calls == {'read': 1, 'render': 2}
+
+        team, personal, archive = (d.path / "Fanout Contact.md" for d in destinations)
+        assert team.read_bytes() == personal.read_bytes()
+        assert "PHOTO:" in team.read_text(encoding='utf-8')
+        assert "PHOTO:" not in archive.read_text(encoding='utf-8')
+
+    def test_batch_run_writes_every_destination(self, temp_dirs, capsys):
+        """Test that process_tasks creates and fills every destination."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "fanout.vcf", VCF_CONTENT)
+        destinations = self._destinations(temp_dirs)
+
+        VCFConverter().process_tasks([temp_dirs['test_vcf_dir']], destinations, [], False, [])
+
+        for destination in destinations:
+            assert (destination.path / "Fanout Contact.md").exists()
+        assert "Successfully completed 1/1 conversions." in capsys.readouterr().out
+
+    def test_link_mode_drops_inline_photo(self, temp_dirs):
+        """Test that photos=link keeps URLs but drops inline image data."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "fanout.vcf", VCF_CONTENT)
+        destination = Destination(temp_dirs['test_output_dir'], photos="link")
+
+        VCFConverter().convert_vcf_to_markdown(vcf_path, destination)
+
+        note = temp_dirs['test_output_dir'] / "Fanout Contact.md"
+        assert "base64" not in note.read_text(encoding='utf-8')
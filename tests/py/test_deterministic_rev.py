@@ -0,0 +1,108 @@
+"""
+Tests for deriving the REV of generated notes from source data.
+"""
+
+import os
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, VCFReader
+
+
+VCF_WITH_REV = """BEGIN:VCARD
+VERSION:3.0
+FN:Rev Contact
+UID:rev-contact-1
+REV:2021-03-04T05:06:07Z
+END:VCARD"""
+
+VCF_WITHOUT_REV = """BEGIN:VCARD
+VERSION:3.0
+FN:Plain Contact
+UID:plain-contact-1
+END:VCARD"""
+
+SOURCE_MTIME = datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc).timestamp()
+
+
+class TestDeterministicRev:
+    """Test cases for the rev_source option."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("20210304T050607Z", datetime(2021, 3, 4, 5, 6, 7, tzinfo=timezone.utc)),
+        ("2021-03-04T05:06:07Z", datetime(2021, 3, 4, 5, 6, 7, tzinfo=timezone.utc)),
+        ("2021-03-04T07:06:07+02:00", datetime(2021, 3, 4, 5, 6, 7, tzinfo=timezone.utc)),
+        ("2021-03-04", datetime(2021, 3, 4, tzinfo=timezone.utc)),
+        ("yesterday", None),
+    ])
+    def test_get_rev_timestamp(self, value, expected):
+        """Test parsing of the REV property formats allowed by vCard."""
+        vcard = VCFReader().read_vcf_content(VCF_WITH_REV.replace("2021-03-04T05:06:07Z", value))
+        assert VCFReader().get_rev_timestamp(vcard) == expected
+
+    def test_card_rev_is_written(self, temp_dirs):
+        """Test that rev_source='card' copies the card's REV into the note."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "rev.vcf", VCF_WITH_REV)
+        VCFConverter(rev_source="card").convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        content = (temp_dirs['test_output_dir'] / "Rev Contact.md").read_text(encoding='utf-8')
+        assert "REV: 20210304T050607Z" in content
+
+    def test_card_rev_falls_back_to_mtime(self, temp_dirs):
+        """Test that cards without REV use the source modification time."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "plain.vcf", VCF_WITHOUT_REV)
+        os.utime(vcf_path, (SOURCE_MTIME, SOURCE_MTIME))
+        VCFConverter(rev_source="card").convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        content = (temp_dirs['test_output_dir'] / "Plain Contact.md").read_text(encoding='utf-8')
+        assert "REV: 20200102T030405Z" in content
+
+    def test_repeated_runs_are_byte_identical(self, temp_dirs):
+        """Test that deterministic REV makes output reproducible."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "plain.vcf", VCF_WITHOUT_REV)
+        os.utime(vcf_path, (SOURCE_MTIME, SOURCE_MTIME))
+        note = temp_dirs['test_output_dir'] / "Plain Contact.md"
+
+        VCFConverter(rev_source="mtime").convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        first = note.read_bytes()
+        note.unlink()
+        VCFConverter(rev_source="mtime").convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        assert note.read_bytes() == first
+
+    def test_skip_is_equality_check(self, temp_dirs, capsys):
+        """Test that an older source mtime triggers conversion instead of a skip."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "plain.vcf", VCF_WITHOUT_REV)
+        converter = VCFConverter(rev_source="mtime")
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        assert "REV unchanged" in capsys.readouterr().out
+
+        # A restored backup carries an older mtime than the note's REV
+        os.utime(vcf_path, (SOURCE_MTIME, SOURCE_MTIME))
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        assert "Converted: plain.vcf" in capsys.readouterr().out
+
+    def test_content_change_without_rev_bump_is_converted(self, temp_dirs, capsys):
+        """Test that a card edited without bumping its REV is still reconverted."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "card.vcf", VCF_WITH_REV)
+        output_dir = temp_dirs['test_output_dir']
+        converter = VCFConverter(rev_source="card")
+        converter.convert_vcf_to_markdown(vcf_path, output_dir)
+        note = next(output_dir.glob("*.md"))
+        written = note.stat().st_mtime
+        capsys.readouterr()
+
+        vcf_path.write_text(VCF_WITH_REV.replace("END:VCARD", "EMAIL:new@example.com\nEND:VCARD"), encoding="utf-8")
+        os.utime(vcf_path, (written + 10, written + 10))
+        converter.convert_vcf_to_markdown(vcf_path, output_dir)
+
+        assert "Converted: card.vcf" in capsys.readouterr().out
+        assert "new@example.com" in note.read_text(encoding="utf-8")
+
+    def test_invalid_rev_source(self):
+        """Test that an unknown rev_source is rejected."""
+        with pytest.raises(ValueError):
+            VCFConverter(rev_source="sometimes")
@@ -0,0 +1,142 @@
+"""
+Tests for fuzzy duplicate-contact detection.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, VCFReader, DuplicateFinder
+
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def card(fn, uid, email=None, tel=None):
+    lines = ["BEGIN:VCARD", "VERSION:3.0", f"FN:{fn}", f"UID:{uid}"]
+    if email:
+        lines.append(f"EMAIL:{email}")
+    if tel:
+        lines.append(f"TEL:{tel}")
+    lines.append("END:VCARD")
+    return "\n".join(lines) + "\n"
+
+
+def finder_with(*cards, **options):
+    finder = DuplicateFinder(**options)
+    reader = VCFReader()
+    for position, content in enumerate(cards):
+        finder.add(reader.read_vcf_content(content), f"source_{position}.vcf")
+    return finder
+
+
+class TestDuplicateFinder:
+    """Test cases for the DuplicateFinder class."""
+
+    def test_normalization(self):
+        """Emails, phones and names are normalized before blocking."""
+        assert DuplicateFinder.normalize_email(" MAILTO:Alice+news@Example.com ") == "alice@example.com"
+        assert DuplicateFinder.normalize_email("not an address") == ""
+        assert DuplicateFinder.normalize_phone("+1 (555) 010-2030") == DuplicateFinder.normalize_phone("555.010.2030")
+        assert DuplicateFinder.normalize_phone("112") == ""
+        assert DuplicateFinder.name_tokens("José  O'Brien") == {"jose", "brien"}
+
+    def test_shared_email_is_a_duplicate(self):
+        """Contacts with different UIDs and the same email are grouped."""
+        finder = finder_with(
+            card("Alice Smith", "a-1", email="alice@example.com"),
+            card("A. Smith", "a-2", email="Alice+work@example.com"),
+            card("Bob Jones", "b-1", email="bob@example.com"),
+        )
+
+        (group,) = finder.find()
+
+        assert sorted(contact['uid'] for contact in group['contacts']) == ["a-1", "a-2"]
+        assert "same email alice@example.com" in group['reasons']
+        assert group['score'] >= 0.9
+
+    def test_similar_name_and_phone(self):
+        """A typo in the name is tolerated when the phone number matches, but is not enough alone."""
+        finder = finder_with(
+            card("Jonathan Miller", "j-1", tel="+1 555 010 2030"),
+            card("Jonathon Miller", "j-2", tel="(555) 010-2030"),
+            card("Jonathon Millar", "j-3"),
+        )
+
+        groups = finder.find()
+
+        assert len(groups) == 1
+        assert {contact['uid'] for contact in groups[0]['contacts']} == {"j-1", "j-2"}
+        assert groups[0]['reasons'] == ["same phone", "similar name"]
+
+    def test_identical_full_name_alone(self):
+        """An identical full name alone is suggested; a shared first name alone only below the default threshold."""
+        (group,) = finder_with(card("Carol Danvers", "c-1"), card("carol  DANVERS", "c-2")).find()
+        assert group['reasons'] == ["same name"]
+
+        cards = (card("Carol", "c-1"), card("Carol", "c-2"))
+        assert finder_with(*cards).find() == []
+        assert len(finder_with(*cards, threshold=0.5).find()) == 1
+        with pytest.raises(ValueError):
+            DuplicateFinder(threshold=0)
+
+    def test_oversized_blocks_are_skipped(self):
+        """Common name tokens do not cause pairwise comparisons of everyone."""
+        cards = [card(f"John Person{index:03d}", f"p-{index}") for index in range(30)]
+
+        finder = finder_with(*cards, max_block_size=10)
+        assert finder.find() == []
+        assert finder.skipped_blocks == 1
+        assert finder.comparisons == 0
+
+    def test_full_name_block_survives_skipped_token_block(self):
+        """Duplicates with a common first name still meet in their full-name block."""
+        cards = [card(f"John Person{index:03d}", f"p-{index}") for index in range(30)]
+        cards += [card("John Smith", "s-1"), card("John Smith", "s-2")]
+
+        finder = finder_with(*cards, max_block_size=10)
+        (group,) = finder.find()
+
+        assert {contact['uid'] for contact in group['contacts']} == {"s-1", "s-2"}
+        assert finder.skipped_keys == ["name:john"]
+        assert finder.comparisons == 1
+
+
+class TestDedupe:
+    """Test cases for VCFConverter.report_duplicates() and --dedupe."""
+
+    def test_multi_card_sources(self, temp_dirs):
+        """Cards inside multi-card files are compared with each other and with other files."""
+        create_test_vcf(
+            temp_dirs['test_vcf_dir'], "all.vcf",
+            card("Dana Scully", "d-1", email="dana@fbi.gov") + card("Fox Mulder", "f-1"),
+        )
+        create_test_vcf(temp_dirs['test_vcf_dir'], "phone.vcf", card("Dana K. Scully", "d-2", email="DANA@fbi.gov"))
+        output_dir = temp_dirs['test_output_dir']
+
+        groups = VCFConverter().report_duplicates([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        assert len(groups) == 1
+        assert sorted(contact['note'] for contact in groups[0]['contacts']) == ["Dana K. Scully.md", "Dana Scully.md"]
+        with open(output_dir / ".vcf-to-obsidian" / "duplicates.json", encoding="utf-8") as f:
+            assert json.load(f)["groups"] == groups
+        assert not list(output_dir.glob("*.md"))
+
+    def test_cli(self, temp_dirs):
+        """--dedupe prints suggestions and converts nothing."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "one.vcf", card("Eve Adams", "e-1", email="eve@example.com"))
+        create_test_vcf(temp_dirs['test_vcf_dir'], "two.vcf", card("Eve Adams", "e-2", email="eve@example.com"))
+
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--folder", str(temp_dirs['test_vcf_dir']),
+             "--obsidian", str(temp_dirs['test_output_dir']), "--dedupe"],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "Possible duplicates" in result.stdout
+        assert "[[Eve Adams]]" in result.stdout
+        assert "Found 1 group(s)" in result.stdout
+        assert not list(temp_dirs['test_output_dir'].glob("*.md"))
@@ -0,0 +1,80 @@
+"""
+Tests for projecting vCard properties away before parsing.
+"""
+
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, FieldProjection
+
+
+PHOTO_VCF = """BEGIN:VCARD
+VERSION:3.0
+FN:Projected Contact
+N:Contact;Projected;;;
+EMAIL;TYPE=WORK:projected@example.com
+TEL;TYPE=CELL:+1-555-000-0001
+ORG:Projection Inc
+PHOTO;ENCODING=b;TYPE=JPEG:dGVzdGRhdGF0ZXN0ZGF0YXRlc3RkYXRhdGVzdGRhdGF0ZXN0
+ ZGF0YXRlc3RkYXRhdGVzdGRhdGF0ZXN0ZGF0YQ==
+UID:projected-1
+END:VCARD
+"""
+
+
+class TestFieldProjection:
+    """Test cases for the FieldProjection class."""
+
+    def test_exclude_removes_folded_property(self):
+        """Test that a dropped property goes with all its continuation lines."""
+        projected = FieldProjection(exclude=["PHOTO"]).apply(PHOTO_VCF)
+        assert "PHOTO" not in projected
+        assert "ZGF0YXRlc3Rk" not in projected
+        assert "UID:projected-1\n" in projected
+
+    def test_fields_keep_identity_properties(self):
+        """Test that identity properties survive a field list."""
+        projected = FieldProjection(fields=["email"]).apply(PHOTO_VCF)
+        assert "EMAIL;TYPE=WORK" in projected
+        assert "FN:Projected Contact" in projected
+        assert "TEL" not in projected
+        assert "ORG" not in projected
+
+    def test_bytes_and_text_agree(self):
+        """Test that projecting bytes gives the same result as text."""
+        projection = FieldProjection(fields=["TEL"], exclude=["PHOTO"])
+        assert projection.apply(PHOTO_VCF.encode('utf-8')).decode('utf-8') == projection.apply(PHOTO_VCF)
+
+    def test_empty_projection_is_identity(self):
+        """Test that a projection without options returns the content untouched."""
+        assert not FieldProjection()
+        assert FieldProjection().apply(PHOTO_VCF) is PHOTO_VCF
+
+    def test_keeping_widens_field_list(self):
+        """Test that fields needed by filters are added to the projection."""
+        projection = FieldProjection(fields=["EMAIL"])
+        assert projection.keeping(["EMAIL"]) is projection
+        assert projection.keeping(["org"]).keeps("ORG")
+
+
+class TestProjectedConversion:
+    """Test cases for projection during conversion."""
+
+    def test_no_photos(self, temp_dirs):
+        """Test that --no-photos leaves PHOTO out of the note."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "photo.vcf", PHOTO_VCF)
+        VCFConverter(no_photos=True).convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        content = (temp_dirs['test_output_dir'] / "Projected Contact.md").read_text(encoding='utf-8')
+        assert "PHOTO" not in content
+        assert "projected@example.com" in content
+
+    def test_fields_keep_filter_properties(self, temp_dirs):
+        """Test that a property used by a filter is parsed even if not listed."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "photo.vcf", PHOTO_VCF)
+        converter = VCFConverter(fields=["EMAIL"], include=["ORG=Projection Inc"])
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        content = (temp_dirs['test_output_dir'] / "Projected Contact.md").read_text(encoding='utf-8')
+        assert "ORG: Projection Inc" in content
+        assert "TEL" not in content
+        assert "PHOTO" not in content
@@ -0,0 +1,176 @@
+"""
+Tests for converting the files listed in a change feed.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, ChangeFeed, VaultIndex
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:{name}
+UID:feed-{index}
+END:VCARD
+"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def create_contacts(vcf_dir, count):
+    return [
+        create_test_vcf(vcf_dir, f"feed{index}.vcf", VCF_TEMPLATE.format(name=f"Feed Contact {index}", index=index))
+        for index in range(count)
+    ]
+
+
+def seed(vcf_dir, output_dir, count):
+    """Convert every file through a feed, so the source map knows all of them."""
+    paths = create_contacts(vcf_dir, count)
+    list(VCFConverter().iter_changes(paths, output_dir))
+    return paths
+
+
+class TestChangeFeed:
+    """Test cases for the ChangeFeed class."""
+
+    def test_parse_lines(self):
+        """Lines may end in CRLF; blank lines and repeated paths are dropped."""
+        feed = ChangeFeed.parse(b"a.vcf\r\n\nb.vcf\na.vcf\n")
+
+        assert feed.paths == [Path("a.vcf"), Path("b.vcf")]
+
+    def test_parse_nul_separated(self):
+        """With NUL separators, paths may contain newlines."""
+        feed = ChangeFeed.parse("odd\nname.vcf\0b.vcf\0")
+
+        assert feed.paths == [Path("odd\nname.vcf"), Path("b.vcf")]
+
+    def test_split(self, temp_dirs):
+        """Existing paths are changed, missing ones deleted."""
+        (present,) = create_contacts(temp_dirs['test_vcf_dir'], 1)
+        missing = temp_dirs['test_vcf_dir'] / "gone.vcf"
+
+        assert ChangeFeed([missing, present]).split() == ([present], [missing])
+
+
+class TestIterChanges:
+    """Test cases for VCFConverter.iter_changes()."""
+
+    def test_only_listed_files_are_converted(self, temp_dirs):
+        """Unlisted files are left alone, and deleted files lose their notes."""
+        output_dir = temp_dirs['test_output_dir']
+        paths = seed(temp_dirs['test_vcf_dir'], output_dir, 4)
+        paths[1].write_text(VCF_TEMPLATE.format(name="Feed Contact 1", index=1) + "\n", encoding="utf-8")
+        paths[2].unlink()
+        create_test_vcf(temp_dirs['test_vcf_dir'], "unlisted.vcf", VCF_TEMPLATE.format(name="Unlisted", index=9))
+
+        results = list(VCFConverter().iter_changes([paths[1], paths[2]], output_dir))
+
+        assert [(result.source, result.status) for result in results] == [
+            (paths[2], "deleted"), (paths[1], "converted"),
+        ]
+        assert not (output_dir / "Feed Contact 2.md").exists()
+        assert not (output_dir / "Unlisted.md").exists()
+        assert len(list(output_dir.glob("*.md"))) == 3
+
+    def test_preloads_only_notes_of_listed_files(self, temp_dirs):
+        """Only the listed file's notes are read, and a renamed contact's old note is still removed."""
+        output_dir = temp_dirs['test_output_dir']
+        paths = seed(temp_dirs['test_vcf_dir'], output_dir, 20)
+        paths[5].write_text(VCF_TEMPLATE.format(name="Renamed Contact", index=5), encoding="utf-8")
+        converter = VCFConverter()
+
+        (result,) = converter.iter_changes([paths[5]], output_dir)
+
+        index = converter._get_vault_index(output_dir)
+        assert index.partial and index.note_count == 1
+        assert result.status == "converted"
+        assert (output_dir / "Renamed Contact.md").exists()
+        assert not (output_dir / "Feed Contact 5.md").exists()
+        assert len(list(output_dir.glob("*.md"))) == 20
+
+    def test_folder_run_records_the_source_map(self, temp_dirs):
+        """After a --folder run, a feed renames and deletes notes without reading the vault."""
+        output_dir = temp_dirs['test_output_dir']
+        paths = create_contacts(temp_dirs['test_vcf_dir'], 3)
+        subprocess.run(
+            [sys.executable, str(SCRIPT), "--folder", str(temp_dirs['test_vcf_dir']), "--obsidian", str(output_dir)],
+            capture_output=True, text=True, timeout=60, check=True,
+        )
+        paths[0].write_text(VCF_TEMPLATE.format(name="Moved Name", index=0), encoding="utf-8")
+        paths[1].unlink()
+        converter = VCFConverter()
+
+        results = list(converter.iter_changes([paths[0], paths[1]], output_dir))
+
+        assert {result.status for result in results} == {"converted", "deleted"}
+        assert converter._get_vault_index(output_dir).partial
+        assert sorted(note.name for note in output_dir.glob("*.md")) == ["Feed Contact 2.md", "Moved Name.md"]
+
+    def test_incomplete_source_map_preloads_whole_vault(self, temp_dirs):
+        """Notes no recorded source produced make the whole vault load, so renamed contacts are found."""
+        output_dir = temp_dirs['test_output_dir']
+        paths = create_contacts(temp_dirs['test_vcf_dir'], 3)
+        VCFConverter(source_map=False).convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+        paths[0].write_text(VCF_TEMPLATE.format(name="Moved Name", index=0), encoding="utf-8")
+        converter = VCFConverter()
+
+        list(converter.iter_changes([paths[0]], output_dir))
+
+        assert not converter._get_vault_index(output_dir).partial
+        assert not (output_dir / "Feed Contact 0.md").exists()
+        assert len(list(output_dir.glob("*.md"))) == 3
+        assert not converter._get_source_map(output_dir).complete
+
+    def test_partial_index_reads_notes_on_lookup(self, temp_dirs):
+        """A partial index reads an unloaded note on its first lookup."""
+        output_dir = temp_dirs['test_output_dir']
+        seed(temp_dirs['test_vcf_dir'], output_dir, 2)
+
+        index = VaultIndex().load(output_dir, names=["Feed Contact 0.md"])
+
+        assert index.files_with_uid("feed-1") == []
+        assert index.contains(output_dir / "Feed Contact 1.md")
+        assert index.files_with_uid("feed-1") == [output_dir / "Feed Contact 1.md"]
+        index.remove(output_dir / "Feed Contact 1.md")
+        assert not index.contains(output_dir / "Feed Contact 1.md")
+
+    def test_cli_files_from(self, temp_dirs):
+        """--files-from reads a NUL-separated list and cannot be combined with --folder."""
+        output_dir = temp_dirs['test_output_dir']
+        paths = create_contacts(temp_dirs['test_vcf_dir'], 3)
+        feed = temp_dirs['test_dir'] / "changes.txt"
+        feed.write_bytes(b"\0".join(str(path).encode() for path in paths[:2]))
+
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--files-from", str(feed), "--obsidian", str(output_dir)],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "Successfully completed 2/2 changes." in result.stdout
+        assert sorted(note.name for note in output_dir.glob("*.md")) == ["Feed Contact 0.md", "Feed Contact 1.md"]
+
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--files-from", "-", "--folder", str(temp_dirs['test_vcf_dir']),
+             "--obsidian", str(output_dir)],
+            input="", capture_output=True, text=True, timeout=60,
+        )
+        assert result.returncode == 2
+        assert "--files-from" in result.stderr
+
+    def test_cli_fails_on_unknown_deleted_file(self, temp_dirs):
+        """A deleted file with no recorded notes is reported and fails the run."""
+        output_dir = temp_dirs['test_output_dir']
+        seed(temp_dirs['test_vcf_dir'], output_dir, 1)
+
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--files-from", "-", "--obsidian", str(output_dir)],
+            input=str(temp_dirs['test_vcf_dir'] / "never.vcf"), capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 1
+        assert "no notes are recorded for this source" in result.stdout
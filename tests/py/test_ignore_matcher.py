@@ -0,0 +1,131 @@
+"""
+Tests for pattern-based ignore rules applied during traversal.
+"""
+
+import os
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, IgnoreMatcher
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:{name}
+UID:{name}
+END:VCARD"""
+
+
+def make_tree(root):
+    """Create a small source tree with nested folders."""
+    for relative in ["keep.vcf", "draft.bak.vcf", "team/alice.vcf", "old/bob.vcf", "old/deep/carol.vcf"]:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(VCF_TEMPLATE.format(name=path.stem.replace('.', ' ')), encoding='utf-8')
+
+
+class TestIgnoreMatcher:
+    """Test cases for the IgnoreMatcher class."""
+
+    def test_name_glob_matches_any_depth(self):
+        """Test that a glob without a slash matches names in every folder."""
+        matcher = IgnoreMatcher(["*.bak.vcf"])
+        assert matcher.matches("draft.bak.vcf")
+        assert matcher.matches("team/draft.bak.vcf")
+        assert not matcher.matches("keep.vcf")
+
+    def test_path_glob_and_directory_rules(self):
+        """Test slash globs and directory-only rules."""
+        matcher = IgnoreMatcher(["team/*.vcf", "old/"])
+        assert matcher.matches("team/alice.vcf")
+        assert not matcher.matches("alice.vcf")
+        assert matcher.matches("old", is_dir=True)
+        assert not matcher.matches("old")
+
+    def test_star_stays_within_one_directory(self):
+        """Test that * and ? match one path segment and ** crosses folders."""
+        matcher = IgnoreMatcher(["team/*.vcf", "archive/**/*.vcf", "x?.vcf"])
+        assert matcher.matches("team/alice.vcf")
+        assert not matcher.matches("team/sub/alice.vcf")
+        assert matcher.matches("archive/a.vcf")
+        assert matcher.matches("archive/2019/q1/a.vcf")
+        assert matcher.matches("sub/xa.vcf")
+        assert not matcher.matches("x/.vcf")
+
+    def test_regex_rules(self):
+        """Test re: patterns and invalid expressions."""
+        assert IgnoreMatcher([r"re:^team/a"]).matches("team/alice.vcf")
+        with pytest.raises(ValueError):
+            IgnoreMatcher(["re:("])
+
+    def test_walk_prunes_ignored_directories(self, temp_dirs, monkeypatch):
+        """Test that ignored subtrees are never opened."""
+        root = temp_dirs['test_vcf_dir']
+        make_tree(root)
+        opened = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path):
+            opened.append(os.path.relpath(path, root))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", tracking_scandir)
+        found = sorted(relative for _, relative in IgnoreMatcher(["old/"]).walk(root, recursive=True))
+
+        assert found == ["draft.bak.vcf", "keep.vcf", "team/alice.vcf"]
+        assert sorted(opened) == [".", "team"]
+
+    def test_walk_skips_symlinked_directories(self, temp_dirs):
+        """Test that a symlink cycle does not make the walk loop."""
+        root = temp_dirs['test_vcf_dir']
+        make_tree(root)
+        try:
+            (root / "team" / "loop").symlink_to(root, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not supported")
+
+        found = sorted(relative for _, relative in IgnoreMatcher().walk(root, recursive=True))
+
+        assert found == ["draft.bak.vcf", "keep.vcf", "old/bob.vcf", "old/deep/carol.vcf", "team/alice.vcf"]
+
+
+class TestIgnoreDuringConversion:
+    """Test cases for ignore rules in convert_vcf_files_from_sources."""
+
+    def test_patterns_and_vcfignore(self, temp_dirs):
+        """Test that CLI patterns and .vcfignore rules are combined."""
+        root = temp_dirs['test_vcf_dir']
+        make_tree(root)
+        (root / ".vcfignore").write_text("# drafts\n*.bak.vcf\n\nold/\n", encoding='utf-8')
+
+        converter = VCFConverter(recursive=True)
+        _, total, files = converter.convert_vcf_files_from_sources(
+            [root], [], temp_dirs['test_output_dir'], ignore_files=["re:^team/"]
+        )
+
+        assert total == 1
+        assert [path.name for path in files] == ["keep.vcf"]
+
+    def test_exact_file_ignore_still_works(self, temp_dirs):
+        """Test that an existing file path ignores exactly that file."""
+        keep = create_test_vcf(temp_dirs['test_vcf_dir'], "keep.vcf", VCF_TEMPLATE.format(name="Keep"))
+        drop = create_test_vcf(temp_dirs['test_vcf_dir'], "drop.vcf", VCF_TEMPLATE.format(name="Drop"))
+
+        _, total, files = VCFConverter().convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir'], ignore_files=[drop]
+        )
+
+        assert files == [keep]
+
+    def test_unmatched_path_warns(self, temp_dirs, capsys):
+        """Test that a mistyped path is reported, while matched entries and globs are not."""
+        root = temp_dirs['test_vcf_dir']
+        make_tree(root)
+
+        _, total, _ = VCFConverter(recursive=True).convert_vcf_files_from_sources(
+            [root], [], temp_dirs['test_output_dir'], ignore_files=["team/alise.vcf", "old/", "*.none.vcf"]
+        )
+
+        assert total == 3
+        err = capsys.readouterr().err
+        assert "Warning: --ignore 'team/alise.vcf' is not an existing file and matched no path." in err
+        assert "'old/'" not in err and "*.none.vcf" not in err
@@ -0,0 +1,102 @@
+"""
+Tests for the streaming iter_convert API.
+"""
+
+import threading
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, ConversionResult
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Stream Contact {index}
+UID:stream-{index}
+END:VCARD"""
+
+
+def make_sources(directory, count):
+    """Create count valid VCF files."""
+    return [
+        create_test_vcf(directory, f"stream_{index:03d}.vcf", VCF_TEMPLATE.format(index=index))
+        for index in range(count)
+    ]
+
+
+class TestIterConvert:
+    """Test cases for VCFConverter.iter_convert."""
+
+    def test_yields_typed_results(self, temp_dirs):
+        """Test that each file yields a result with status, notes, and timings."""
+        make_sources(temp_dirs['test_vcf_dir'], 3)
+        create_test_vcf(temp_dirs['test_vcf_dir'], "broken.vcf", "not a vcard")
+
+        results = list(VCFConverter().iter_convert(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']
+        ))
+
+        assert all(isinstance(result, ConversionResult) for result in results)
+        by_name = {result.source.name: result for result in results}
+        assert by_name["broken.vcf"].status == "failed"
+        assert by_name["broken.vcf"].error
+        converted = by_name["stream_000.vcf"]
+        assert converted.status == "converted"
+        assert converted.notes == (temp_dirs['test_output_dir'] / "Stream Contact 0.md",)
+        assert converted.parse_seconds >= 0 and converted.write_seconds >= 0
+
+    def test_second_run_reports_skipped(self, temp_dirs):
+        """Test that unchanged files are reported as skipped with no notes."""
+        make_sources(temp_dirs['test_vcf_dir'], 2)
+        converter = VCFConverter(rev_source="mtime")
+        list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']))
+
+        results = list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']))
+
+        assert [result.status for result in results] == ["skipped", "skipped"]
+        assert all(result.ok and result.notes == () for result in results)
+
+    def test_early_close_stops_stages(self, temp_dirs):
+        """Test that abandoning the generator stops the background threads."""
+        make_sources(temp_dirs['test_vcf_dir'], 20)
+        results = VCFConverter().iter_convert(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir'], queue_size=2
+        )
+
+        first = next(results)
+        results.close()
+
+        assert first.status == "converted"
+        assert not [t for t in threading.enumerate() if t.name in ("vcf-discover", "vcf-parse")]
+        assert len(list(temp_dirs['test_output_dir'].glob("*.md"))) == 1
+
+    def test_parse_worker_error_fails_the_file(self, temp_dirs):
+        """Test that an error escaping the parse stage fails its file instead of stalling the run."""
+        make_sources(temp_dirs['test_vcf_dir'], 3)
+        converter = VCFConverter(parse_workers=2)
+        original = converter._parse_source
+
+        def parse_source(vcf_path, destinations):
+            if vcf_path.name == "stream_001.vcf":
+                raise OSError("stat failed")
+            return original(vcf_path, destinations)
+
+        converter._parse_source = parse_source
+        results = []
+        worker = threading.Thread(target=lambda: results.extend(
+            converter.iter_convert([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir'])
+        ))
+        worker.start()
+        worker.join(timeout=30)
+
+        assert not worker.is_alive()
+        assert {result.source.name: result.status for result in results} == {
+            "stream_000.vcf": "converted", "stream_001.vcf": "failed", "stream_002.vcf": "converted",
+        }
+        assert converter.failures == [(temp_dirs['test_vcf_dir'] / "stream_001.vcf", "stat failed")]
+
+    def test_result_is_compact(self):
+        """Test that results use slots instead of a per-instance dict."""
+        result = ConversionResult("a.vcf", "skipped")
+        assert not hasattr(result, "__dict__")
+        assert result.ok
+        assert not ConversionResult("a.vcf", "quarantined").ok
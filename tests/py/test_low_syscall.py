@@ -0,0 +1,144 @@
+"""
+Tests for low-syscall mode and filesystem call counting.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, DirectoryCache, SyscallCounter
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Remote Contact {index}
+UID:remote-{index}
+EMAIL:remote{index}@example.com
+END:VCARD
+"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def create_contacts(vcf_dir, count):
+    for index in range(count):
+        create_test_vcf(vcf_dir, f"remote{index}.vcf", VCF_TEMPLATE.format(index=index))
+
+
+def convert(vcf_dir, output_dir, **options):
+    converter = VCFConverter(rev_source="mtime", count_syscalls=True, **options)
+    results = list(converter.iter_convert([vcf_dir], [], output_dir))
+    return converter, results
+
+
+class TestDirectoryCache:
+    """Test cases for the DirectoryCache class."""
+
+    def test_lists_each_directory_once(self, temp_dirs):
+        """Existence checks and stats are answered from one listing."""
+        create_contacts(temp_dirs['test_vcf_dir'], 3)
+        counter = SyscallCounter()
+        cache = DirectoryCache(counter)
+        first = temp_dirs['test_vcf_dir'] / "remote0.vcf"
+
+        assert cache.exists(first) and not cache.exists(temp_dirs['test_vcf_dir'] / "missing.vcf")
+        assert cache.stat(first).st_size == first.stat().st_size
+        assert cache.stat(first) is cache.stat(first)
+        assert (cache.listings, counter.counts) == (1, {'stat': 1})
+
+        first.write_text("changed", encoding="utf-8")
+        cache.changed(first)
+        assert cache.stat(first).st_size == len("changed")
+        cache.removed(first)
+        assert not cache.exists(first)
+        assert cache.listings == 1
+
+
+class TestLowSyscall:
+    """Test cases for VCFConverter with low_syscall."""
+
+    def test_same_notes_with_fewer_calls(self, temp_dirs):
+        """Notes are byte-identical to a normal run, and sources are never stat'ed by path."""
+        create_contacts(temp_dirs['test_vcf_dir'], 5)
+        normal_dir = temp_dirs['test_output_dir'] / "normal"
+        low_dir = temp_dirs['test_output_dir'] / "low"
+
+        normal, _ = convert(temp_dirs['test_vcf_dir'], normal_dir, mirror_mtime=True)
+        low, results = convert(temp_dirs['test_vcf_dir'], low_dir, mirror_mtime=True, low_syscall=True)
+
+        assert {result.status for result in results} == {"converted"}
+        for note in normal_dir.glob("*.md"):
+            assert (low_dir / note.name).read_bytes() == note.read_bytes()
+            assert (low_dir / note.name).stat().st_mtime_ns == note.stat().st_mtime_ns
+        assert normal.syscalls.counts['stat'] >= 5
+        assert 'stat' not in low.syscalls.counts
+        assert low.syscalls.counts['scandir'] == 2
+        assert low.syscalls.total < normal.syscalls.total
+
+    def test_skip_checks_from_the_listing(self, temp_dirs):
+        """A second run skips every note, stat'ing each note once for its mtime."""
+        create_contacts(temp_dirs['test_vcf_dir'], 4)
+        output_dir = temp_dirs['test_output_dir']
+        convert(temp_dirs['test_vcf_dir'], output_dir, mirror_mtime=True, low_syscall=True)
+
+        converter, results = convert(temp_dirs['test_vcf_dir'], output_dir, mirror_mtime=True, low_syscall=True)
+
+        assert {result.status for result in results} == {"skipped"}
+        assert converter.syscalls.counts['stat'] == 4
+
+    def test_state_saved_at_end_of_pass(self, temp_dirs):
+        """Quarantine changes are written once the pass ends."""
+        create_contacts(temp_dirs['test_vcf_dir'], 2)
+        create_test_vcf(temp_dirs['test_vcf_dir'], "broken.vcf", "not a vcard")
+        output_dir = temp_dirs['test_output_dir']
+
+        converter, results = convert(temp_dirs['test_vcf_dir'], output_dir, low_syscall=True)
+
+        assert sorted(result.status for result in results) == ["converted", "converted", "failed"]
+        with open(output_dir / ".vcf-to-obsidian" / "quarantine.json", encoding="utf-8") as f:
+            (key,) = json.load(f)["entries"]
+        assert key.endswith("broken.vcf")
+
+    def test_file_sources(self, temp_dirs):
+        """Individual files are checked with one cached stat, and missing ones are reported."""
+        create_contacts(temp_dirs['test_vcf_dir'], 2)
+        vcf_dir = temp_dirs['test_vcf_dir']
+        converter = VCFConverter(low_syscall=True)
+
+        successful, total, _ = converter.convert_vcf_files_from_sources(
+            [], [vcf_dir / "remote0.vcf", vcf_dir / "missing.vcf", vcf_dir], temp_dirs['test_output_dir']
+        )
+
+        assert (successful, total) == (1, 1)
+        assert (temp_dirs['test_output_dir'] / "Remote Contact 0.md").exists()
+
+    def test_counter_sees_opens_while_active(self, temp_dirs):
+        """Opens are counted through the audit hook only between start and stop."""
+        path = temp_dirs['test_dir'] / "counted.txt"
+        counter = SyscallCounter()
+
+        counter.start()
+        path.write_text("x", encoding="utf-8")
+        counter.stop()
+        path.read_text(encoding="utf-8")
+
+        assert counter.counts == {'open': 1}
+        assert counter.describe(2, 1) == "Filesystem calls: 1 (0.5 per file, 1.0 per converted file): open 1"
+
+    def test_cli_count_syscalls(self, temp_dirs):
+        """--count-syscalls prints the calls per converted file and records them in the history."""
+        create_contacts(temp_dirs['test_vcf_dir'], 3)
+        output_dir = temp_dirs['test_output_dir']
+
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--folder", str(temp_dirs['test_vcf_dir']),
+             "--obsidian", str(output_dir), "--low-syscall", "--count-syscalls"],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "per converted file" in result.stdout
+        with open(output_dir / ".vcf-to-obsidian" / "history.jsonl", encoding="utf-8") as f:
+            record = json.loads(f.readline())
+        assert record['syscalls']['open'] >= 6
@@ -0,0 +1,66 @@
+"""
+Tests for mirroring source modification times onto generated notes.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter
+
+
+VCF_CONTENT = """BEGIN:VCARD
+VERSION:3.0
+FN:Mirror Contact
+UID:mirror-contact-1
+END:VCARD"""
+
+SOURCE_MTIME_NS = 1_600_000_000_123_456_789
+
+
+class TestMirrorMtime:
+    """Test cases for the mirror_mtime option."""
+
+    def test_note_gets_source_mtime(self, temp_dirs):
+        """Test that the written note carries the source's mtime."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "mirror.vcf", VCF_CONTENT)
+        os.utime(vcf_path, ns=(SOURCE_MTIME_NS, SOURCE_MTIME_NS))
+
+        VCFConverter(mirror_mtime=True).convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        note = temp_dirs['test_output_dir'] / "Mirror Contact.md"
+        assert note.stat().st_mtime_ns == SOURCE_MTIME_NS
+
+    def test_skip_does_not_read_note(self, temp_dirs, capsys, monkeypatch):
+        """Test that the skip decision is made without opening the note."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "mirror.vcf", VCF_CONTENT)
+        converter = VCFConverter(mirror_mtime=True)
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        capsys.readouterr()
+
+        monkeypatch.setattr(converter, "_extract_rev_timestamp_from_markdown",
+                            lambda path: pytest.fail("note was read"))
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        assert "(mtime unchanged)" in capsys.readouterr().out
+
+    def test_older_source_is_converted(self, temp_dirs, capsys):
+        """Test that any mtime change, even backwards, triggers conversion."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "mirror.vcf", VCF_CONTENT)
+        converter = VCFConverter(mirror_mtime=True)
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        capsys.readouterr()
+
+        os.utime(vcf_path, ns=(SOURCE_MTIME_NS, SOURCE_MTIME_NS))
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        assert "Converted: mirror.vcf" in capsys.readouterr().out
+
+    def test_truncated_mtime_still_matches(self, temp_dirs):
+        """Test that a note filesystem with coarser timestamps still matches."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "mirror.vcf", VCF_CONTENT)
+        note = temp_dirs['test_output_dir'] / "Mirror Contact.md"
+        note.write_text("---\n---\n", encoding='utf-8')
+        os.utime(vcf_path, ns=(SOURCE_MTIME_NS, SOURCE_MTIME_NS))
+        truncated = SOURCE_MTIME_NS - SOURCE_MTIME_NS % 1_000_000_000
+        os.utime(note, ns=(truncated, truncated))
+
+        assert VCFConverter(mirror_mtime=True)._should_skip_conversion(vcf_path, note)
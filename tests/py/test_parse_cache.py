@@ -0,0 +1,135 @@
+"""
+Tests for the on-disk cache of parsed cards.
+"""
+
+import os
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, ParseCache, FieldProjection
+from vcf_to_obsidian import vcf_reader
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:{fn}
+UID:cache-{index}
+EMAIL:contact{index}@example.com
+NOTE:Met at the {index}th meetup
+END:VCARD"""
+
+
+def make_sources(directory, count, fn="Cached Contact {index}"):
+    return [
+        create_test_vcf(directory, f"cached_{index}.vcf", VCF_TEMPLATE.format(fn=fn.format(index=index), index=index))
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """Count the cards parsed by vobject."""
+    calls = []
+    read_one = vcf_reader.vobject.readOne
+
+    def counting_read_one(*args, **kwargs):
+        calls.append(1)
+        return read_one(*args, **kwargs)
+
+    monkeypatch.setattr(vcf_reader.vobject, "readOne", counting_read_one)
+    return calls
+
+
+class TestParseCache:
+    """Test cases for the ParseCache class."""
+
+    def test_rerun_skips_parsing(self, temp_dirs, count_parses):
+        """A second run over unchanged sources parses nothing."""
+        make_sources(temp_dirs['test_vcf_dir'], 3)
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(parse_cache=True).convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+        assert len(count_parses) == 3
+
+        converter = VCFConverter(parse_cache=True)
+        successful, total, _ = converter.convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], output_dir
+        )
+
+        assert (successful, total) == (3, 3)
+        assert len(count_parses) == 3
+        cache = next(iter(converter._parse_caches.values()))
+        assert (cache.hits, cache.misses) == (3, 0)
+
+    def test_cached_notes_match_parsed_notes(self, temp_dirs):
+        """Notes rendered from the cache are identical to freshly parsed ones."""
+        make_sources(temp_dirs['test_vcf_dir'], 2)
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(rev_source="mtime").convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+        expected = {path.name: path.read_text() for path in output_dir.glob("*.md")}
+
+        for path in output_dir.glob("*.md"):
+            path.unlink()
+        for _ in range(2):
+            VCFConverter(rev_source="mtime", parse_cache=True).convert_vcf_files_from_sources(
+                [temp_dirs['test_vcf_dir']], [], output_dir
+            )
+            assert {path.name: path.read_text() for path in output_dir.glob("*.md")} == expected
+            for path in output_dir.glob("*.md"):
+                path.unlink()
+
+    def test_changed_source_is_parsed(self, temp_dirs, count_parses):
+        """A source whose content changed misses the cache."""
+        make_sources(temp_dirs['test_vcf_dir'], 1)
+        output_dir = temp_dirs['test_output_dir']
+        VCFConverter(parse_cache=True).convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        make_sources(temp_dirs['test_vcf_dir'], 1, fn="Renamed Contact {index}")
+        VCFConverter(parse_cache=True).convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        assert len(count_parses) == 2
+        assert (output_dir / "Renamed Contact 0.md").exists()
+
+    def test_key_depends_on_projection(self, temp_dirs):
+        """Different projections of the same data use different entries."""
+        cache = ParseCache(temp_dirs['test_output_dir'] / "cache")
+        data = b"BEGIN:VCARD\nEND:VCARD\n"
+
+        keys = {
+            cache.key(data),
+            cache.key(data, FieldProjection(exclude=["PHOTO"])),
+            cache.key(data, FieldProjection(fields=["EMAIL"])),
+        }
+
+        assert len(keys) == 3
+        assert cache.key(data, FieldProjection()) == cache.key(data)
+
+    def test_evicts_least_recently_used(self, temp_dirs):
+        """Entries not used recently are evicted first once the cache is full."""
+        reader = vcf_reader.VCFReader()
+        cards = make_sources(temp_dirs['test_vcf_dir'], 3)
+        cache = ParseCache(temp_dirs['test_output_dir'] / "cache")
+        keys = []
+        for step, path in enumerate(cards):
+            key = cache.key(path.read_bytes())
+            cache.put(key, reader.read_vcf_file(path))
+            os.utime(cache._path(key), ns=(0, step * 1_000_000_000))
+            keys.append(key)
+        entry_size = cache._path(keys[0]).stat().st_size
+        cache.get(keys[0])
+
+        cache.max_bytes = entry_size * 3 - 1
+        cache.put(keys[2], reader.read_vcf_file(cards[2]))
+
+        assert cache._path(keys[0]).exists()
+        assert not cache._path(keys[1]).exists()
+        assert cache._path(keys[2]).exists()
+
+    def test_unreadable_entry_is_a_miss(self, temp_dirs):
+        """A corrupt entry is removed and reported as a miss."""
+        cache = ParseCache(temp_dirs['test_output_dir'] / "cache")
+        key = cache.key(b"data")
+        cache.cache_dir.mkdir(parents=True)
+        cache._path(key).write_bytes(b"not a pickle")
+
+        assert cache.get(key) is None
+        assert not cache._path(key).exists()
+        assert cache.misses == 1
@@ -0,0 +1,100 @@
+"""
+Tests for frontmatter-only updates that keep user-written note bodies.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, NoteUpdater
+
+
+VCF_CONTENT = """BEGIN:VCARD
+VERSION:3.0
+FN:Body Contact
+UID:body-contact-1
+NOTE:Colleague
+END:VCARD"""
+
+USER_TEXT = "\nMet at the conference; follow up in spring.\n"
+
+
+class TestNoteUpdater:
+    """Test cases for the NoteUpdater class."""
+
+    def test_merge_replaces_frontmatter_and_tag_line(self):
+        """Test that only generated parts are replaced."""
+        existing = "---\nFN: Old\n---\n#### Notes\n\n#Contact #Old\n" + USER_TEXT
+        generated = "---\nFN: New\n---\n#### Notes\n\n#Contact #New\n"
+
+        merged = NoteUpdater().merge(existing, generated)
+
+        assert merged == "---\nFN: New\n---\n#### Notes\n\n#Contact #New\n" + USER_TEXT
+
+    def test_merge_adds_missing_notes_section(self):
+        """Test that a generated notes section is added above the body."""
+        existing = "---\nFN: Old\n---\n" + USER_TEXT
+        generated = "---\nFN: New\n---\n#### Notes\n\n#Contact\n"
+
+        merged = NoteUpdater().merge(existing, generated)
+
+        assert merged == generated + USER_TEXT
+
+    def test_update_equal_length_writes_changed_span(self, temp_dirs):
+        """Test that a same-length change overwrites only the differing bytes."""
+        note = temp_dirs['test_output_dir'] / "note.md"
+        note.write_text("---\nREV: 20240101T000000Z\n---\n" + USER_TEXT, encoding='utf-8')
+
+        written = NoteUpdater().update(note, "---\nREV: 20240101T000009Z\n---\n")
+
+        assert written == 1
+        assert note.read_text(encoding='utf-8') == "---\nREV: 20240101T000009Z\n---\n" + USER_TEXT
+
+    def test_update_unchanged_writes_nothing(self, temp_dirs):
+        """Test that an up-to-date note is not written."""
+        note = temp_dirs['test_output_dir'] / "note.md"
+        note.write_text("---\nFN: Same\n---\n" + USER_TEXT, encoding='utf-8')
+
+        assert NoteUpdater().update(note, "---\nFN: Same\n---\n") == 0
+
+
+class TestPreserveBody:
+    """Test cases for the preserve_body option of VCFConverter."""
+
+    def test_conversion_keeps_user_text(self, temp_dirs):
+        """Test that re-converting keeps text the user added to the note."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "body.vcf", VCF_CONTENT)
+        converter = VCFConverter(preserve_body=True)
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        note = temp_dirs['test_output_dir'] / "Body Contact.md"
+        with open(note, 'a', encoding='utf-8') as f:
+            f.write(USER_TEXT)
+
+        vcf_path.write_text(VCF_CONTENT.replace("NOTE:", "ORG:Acme\nNOTE:"), encoding='utf-8')
+        converter._write_note(
+            converter.reader.read_vcf_file(vcf_path), vcf_path, temp_dirs['test_output_dir'], note,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+        content = note.read_text(encoding='utf-8')
+        assert "ORG: Acme\n" in content
+        assert content.count("#Contact") == 1
+        assert "REV: 20240101T000000Z" in content
+        assert content.endswith(USER_TEXT)
+
+    def test_renamed_contact_moves_note(self, temp_dirs, capsys):
+        """Test that a renamed contact's note keeps its body under the new name."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "body.vcf", VCF_CONTENT)
+        converter = VCFConverter(preserve_body=True)
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        old_note = temp_dirs['test_output_dir'] / "Body Contact.md"
+        with open(old_note, 'a', encoding='utf-8') as f:
+            f.write(USER_TEXT)
+
+        vcf_path.write_text(VCF_CONTENT.replace("FN:Body Contact", "FN:Renamed Contact"), encoding='utf-8')
+        converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        new_note = temp_dirs['test_output_dir'] / "Renamed Contact.md"
+        assert not old_note.exists()
+        assert "FN: Renamed Contact" in new_note.read_text(encoding='utf-8')
+        assert new_note.read_text(encoding='utf-8').endswith(USER_TEXT)
+        assert "Renamed: Body Contact.md -> Renamed Contact.md" in capsys.readouterr().out
@@ -0,0 +1,95 @@
+"""
+Tests for the quarantine cache of VCF files that failed to convert.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, QuarantineCache
+
+
+INVALID_VCF = """This is not a valid VCF file
+END:INVALID"""
+
+VALID_VCF = """BEGIN:VCARD
+VERSION:3.0
+FN:Recovered Contact
+UID:recovered-123
+END:VCARD"""
+
+
+class TestQuarantine:
+    """Test cases for QuarantineCache and its use by VCFConverter."""
+
+    def test_failed_file_is_recorded(self, temp_dirs):
+        """Test that a failed conversion is recorded with its error."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", INVALID_VCF)
+        converter = VCFConverter()
+
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir']) is False
+
+        cache = QuarantineCache(temp_dirs['test_output_dir'] / ".vcf-to-obsidian" / "quarantine.json")
+        entry = cache.lookup(vcf_path)
+        assert entry is not None
+        assert entry['error']
+        assert len(converter.failures) == 1
+
+    def test_unchanged_file_is_skipped(self, temp_dirs, capsys):
+        """Test that a quarantined file is not parsed again while unchanged."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", INVALID_VCF)
+        VCFConverter().convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        capsys.readouterr()
+
+        converter = VCFConverter()
+        converter.reader.read_vcf_file = lambda path: pytest.fail("quarantined file was parsed")
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir']) is False
+        assert "Quarantined: bad.vcf" in capsys.readouterr().out
+
+    def test_touched_but_identical_file_stays_quarantined(self, temp_dirs):
+        """Test that a new mtime alone does not release a file."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", INVALID_VCF)
+        cache = QuarantineCache()
+        cache.record(vcf_path, "parse error")
+
+        stat = vcf_path.stat()
+        os.utime(vcf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert cache.lookup(vcf_path) is not None
+
+    def test_changed_file_is_released(self, temp_dirs):
+        """Test that fixing the file releases it from quarantine."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", INVALID_VCF)
+        VCFConverter().convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", VALID_VCF)
+        assert VCFConverter().convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        cache = QuarantineCache(temp_dirs['test_output_dir'] / ".vcf-to-obsidian" / "quarantine.json")
+        assert cache.entries == {}
+
+    def test_retry_failed_parses_again(self, temp_dirs):
+        """Test that retry_failed bypasses the quarantine."""
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", INVALID_VCF)
+        VCFConverter().convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+
+        converter = VCFConverter(retry_failed=True)
+        parsed = []
+        converter.reader.read_vcf_file = lambda path: parsed.append(path) or 1 / 0
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir']) is False
+        assert parsed == [vcf_path]
+
+    def test_failure_report_in_summary(self, temp_dirs, capsys):
+        """Test that process_tasks reports failed sources."""
+        bad_path = create_test_vcf(temp_dirs['test_vcf_dir'], "bad.vcf", INVALID_VCF)
+        good_path = create_test_vcf(temp_dirs['test_vcf_dir'], "good.vcf", VALID_VCF)
+
+        VCFConverter().process_tasks(
+            folder=[], obsidian=temp_dirs['test_output_dir'],
+            file=[bad_path, good_path], verbose=False, ignore=[],
+        )
+
+        output = capsys.readouterr().out
+        assert "Successfully completed 1/2 conversions." in output
+        assert "Failed: 1 source(s)" in output
+        assert str(bad_path) in output
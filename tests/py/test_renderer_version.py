@@ -0,0 +1,130 @@
+"""
+Tests for renderer versioning and targeted re-rendering after upgrades.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, VaultIndex
+from vcf_to_obsidian import markdown_writer, vcf_converter, vcf_reader
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Versioned Contact {index}
+UID:versioned-{index}
+NOTE:Note {index}
+END:VCARD
+"""
+
+
+BASH_SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf-to-obsidian.sh"
+
+
+def make_sources(directory, count):
+    return [
+        create_test_vcf(directory, f"versioned_{index}.vcf", VCF_TEMPLATE.format(index=index))
+        for index in range(count)
+    ]
+
+
+def convert(temp_dirs, **options):
+    converter = VCFConverter(rev_source="mtime", **options)
+    converter.convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir'])
+    return converter
+
+
+@pytest.fixture
+def upgrade(monkeypatch):
+    """Simulate an upgrade to a renderer with a newer version."""
+    def bump():
+        version = markdown_writer.RENDERER_VERSION + 1
+        monkeypatch.setattr(markdown_writer, "RENDERER_VERSION", version)
+        monkeypatch.setattr(vcf_converter, "RENDERER_VERSION", version)
+        return version
+    return bump
+
+
+class TestRendererVersion:
+    """Test cases for renderer versioning."""
+
+    def test_note_records_version(self, temp_dirs):
+        """Generated notes carry the renderer version as a YAML comment."""
+        make_sources(temp_dirs['test_vcf_dir'], 1)
+        convert(temp_dirs)
+
+        content = (temp_dirs['test_output_dir'] / "Versioned Contact 0.md").read_text(encoding="utf-8")
+        assert f"# vcf-to-obsidian renderer: {markdown_writer.RENDERER_VERSION}\n" in content
+        assert VaultIndex().load(temp_dirs['test_output_dir']).get_renderer_version(
+            temp_dirs['test_output_dir'] / "Versioned Contact 0.md"
+        ) == markdown_writer.RENDERER_VERSION
+
+    def test_bash_script_records_same_version(self, temp_dirs, capsys):
+        """The Bash implementation writes the same marker, so its notes are not re-rendered."""
+        match = re.search(r'^RENDERER_VERSION=(\d+)$', BASH_SCRIPT.read_text(encoding="utf-8"), re.MULTILINE)
+        assert int(match.group(1)) == markdown_writer.RENDERER_VERSION
+        if shutil.which("bash") is None:
+            pytest.skip("bash is not available")
+        (source,) = make_sources(temp_dirs['test_vcf_dir'], 1)
+        # REV has whole seconds, so the source must predate the second the note is written in
+        os.utime(source, (0, 0))
+        subprocess.run(
+            ["bash", str(BASH_SCRIPT), "--file", str(source), "--obsidian", str(temp_dirs['test_output_dir'])],
+            capture_output=True, text=True, timeout=60, check=True,
+        )
+
+        VCFConverter().convert_vcf_to_markdown(source, temp_dirs['test_output_dir'])
+
+        assert "Skipped: versioned_0.vcf" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("preload", [True, False])
+    def test_only_outdated_notes_are_rerendered(self, temp_dirs, capsys, preload):
+        """Notes from an older renderer are re-rendered; current ones are skipped."""
+        make_sources(temp_dirs['test_vcf_dir'], 3)
+        convert(temp_dirs)
+        stale = temp_dirs['test_output_dir'] / "Versioned Contact 1.md"
+        stale.write_text(
+            stale.read_text(encoding="utf-8").replace("# vcf-to-obsidian renderer: ", "# old renderer: "),
+            encoding="utf-8",
+        )
+        capsys.readouterr()
+
+        convert(temp_dirs, preload=preload)
+
+        output = capsys.readouterr().out
+        assert output.count("Skipped:") == 2
+        assert "Converted: versioned_1.vcf" in output
+        assert "# vcf-to-obsidian renderer: " in stale.read_text(encoding="utf-8")
+
+    def test_upgrade_rerenders_from_parse_cache(self, temp_dirs, upgrade, monkeypatch):
+        """After an upgrade every note is re-rendered once, without parsing."""
+        make_sources(temp_dirs['test_vcf_dir'], 2)
+        convert(temp_dirs, parse_cache=True)
+        version = upgrade()
+        calls = []
+        read_one = vcf_reader.vobject.readOne
+        monkeypatch.setattr(vcf_reader.vobject, "readOne", lambda *a, **k: calls.append(1) or read_one(*a, **k))
+
+        convert(temp_dirs, parse_cache=True)
+
+        assert calls == []
+        for path in temp_dirs['test_output_dir'].glob("*.md"):
+            assert f"# vcf-to-obsidian renderer: {version}\n" in path.read_text(encoding="utf-8")
+
+    def test_upgrade_rerenders_indexed_cards(self, temp_dirs, upgrade, capsys):
+        """Unchanged cards of a multi-card file are re-rendered after an upgrade."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "many.vcf", VCF_TEMPLATE.format(index=0) + VCF_TEMPLATE.format(index=1))
+        convert(temp_dirs, card_index=True)
+        convert(temp_dirs, card_index=True)
+        assert "Skipped: 2 unchanged card(s)" in capsys.readouterr().out
+
+        upgrade()
+        convert(temp_dirs, card_index=True)
+
+        output = capsys.readouterr().out
+        assert output.count("Converted: many.vcf [card") == 2
+        assert "unchanged card(s)" not in output
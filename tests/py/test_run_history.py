@@ -0,0 +1,114 @@
+"""
+Tests for the run history and stats reporting.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, RunHistory
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:History Contact {index}
+UID:history-{index}
+END:VCARD
+"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def history_path(output_dir):
+    return output_dir / ".vcf-to-obsidian" / "history.jsonl"
+
+
+def synthetic_runs(seconds_list, files=100):
+    return [
+        {'version': 1, 'at': f"20260101T0000{index:02d}Z", 'seconds': seconds, 'files': files,
+         'counts': {'skipped': files}, 'stages': {'parse': seconds / 2}, 'peak_rss_kb': 40000}
+        for index, seconds in enumerate(seconds_list)
+    ]
+
+
+class TestRunHistory:
+    """Test cases for the RunHistory class and VCFConverter run records."""
+
+    def test_every_run_is_recorded(self, temp_dirs):
+        """Each run appends its counts, stage times, I/O and peak memory."""
+        for index in range(3):
+            create_test_vcf(temp_dirs['test_vcf_dir'], f"h{index}.vcf", VCF_TEMPLATE.format(index=index))
+        output_dir = temp_dirs['test_output_dir']
+        for _ in range(2):
+            VCFConverter(rev_source="mtime").convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+
+        first, second = RunHistory(history_path(output_dir)).load()
+
+        assert first['counts'] == {'converted': 3}
+        assert second['counts'] == {'skipped': 3}
+        assert second['files'] == 3 and second['complete'] and second['passes'] == 1
+        assert set(second['stages']) == {'discover', 'parse', 'write'}
+        assert second['peak_rss_kb'] > 0
+        if RunHistory.io_counters() is not None:
+            assert first['bytes_written'] > 0
+
+    def test_history_can_be_disabled(self, temp_dirs):
+        """No record is written with history=False."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "h.vcf", VCF_TEMPLATE.format(index=0))
+        VCFConverter(history=False).convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']
+        )
+
+        assert not history_path(temp_dirs['test_output_dir']).exists()
+
+    def test_flags_regression_against_moving_baseline(self, temp_dirs):
+        """A run much slower than the median of earlier runs is flagged; noise is not."""
+        history = RunHistory(history_path(temp_dirs['test_output_dir']))
+        runs = synthetic_runs([2.0, 2.2, 1.9, 2.1, 2.0, 2.4, 6.0, 2.0])
+
+        flags = history.regressions(runs, window=5)
+
+        assert [bool(found) for found in flags] == [False] * 6 + [True, False]
+        assert flags[6] == ["time per file 2.9x"]
+        assert not any(history.regressions(synthetic_runs([0.01, 0.01, 0.01, 0.05]), window=3))
+
+    def test_report(self, temp_dirs):
+        """The report lists runs, the trend, and whether the latest run regressed."""
+        history = RunHistory(history_path(temp_dirs['test_output_dir']))
+        for record in synthetic_runs([1.0] * 10 + [1.5] * 9 + [4.0]):
+            history.append(record)
+
+        lines, latest_regressed = history.report(limit=5)
+
+        assert latest_regressed
+        assert len([line for line in lines if line.startswith("2026")]) == 5
+        assert "REGRESSED: time per file" in lines[5]
+        assert "Median time per file over the last 10 run(s): 15.0 ms (previous 10: 10.0 ms, +50%)" in lines
+        assert lines[-1].startswith("Median stage times: parse")
+
+    def test_trims_old_runs(self, temp_dirs):
+        """The file keeps at most twice max_runs records."""
+        history = RunHistory(history_path(temp_dirs['test_output_dir']), max_runs=2)
+        for record in synthetic_runs([1.0] * 5):
+            record['padding'] = "x" * 400
+            history.append(record)
+
+        assert [record['at'] for record in history.load()] == ["20260101T000003Z", "20260101T000004Z"]
+
+    def test_cli_stats_exit_status(self, temp_dirs):
+        """--stats exits with status 1 when the latest run regressed."""
+        output_dir = temp_dirs['test_output_dir']
+        history_path(output_dir).parent.mkdir()
+        with open(history_path(output_dir), 'w', encoding='utf-8') as f:
+            for record in synthetic_runs([1.0, 1.0, 1.0, 1.0, 5.0]):
+                f.write(json.dumps(record) + "\n")
+
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--obsidian", str(output_dir), "--stats"],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode == 1
+        assert "REGRESSED" in result.stdout
+        assert "latest run regressed" in result.stderr
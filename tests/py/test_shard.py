@@ -0,0 +1,129 @@
+"""
+Tests for sharded runs and merging per-shard state.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, Shard
+
+
+CARD_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Shard Contact {index}
+UID:shard-{index}
+END:VCARD
+"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def make_sources(directory, count):
+    return [
+        create_test_vcf(directory, f"shard_{index}.vcf", CARD_TEMPLATE.format(index=index))
+        for index in range(count)
+    ]
+
+
+def run_shards(temp_dirs, count, **options):
+    for index in range(1, count + 1):
+        VCFConverter(shard=f"{index}/{count}", **options).convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']
+        )
+
+
+class TestShard:
+    """Test cases for the Shard class."""
+
+    def test_parse(self):
+        """Specifications are parsed and validated."""
+        assert Shard.parse("2/4") == Shard(2, 4)
+        assert str(Shard.parse(" 1 / 3 ")) == "1/3"
+        for spec in ("0/4", "5/4", "2", "a/b", "1/0"):
+            with pytest.raises(ValueError):
+                Shard.parse(spec)
+
+    def test_assignment_is_stable(self):
+        """Cards go to the same shard on every machine and every run."""
+        shard = Shard(1, 4)
+
+        assert [shard.shard_of(f"uid-{index}") for index in range(6)] == [3, 1, 2, 3, 4, 1]
+        assert shard.state_name("card-index.json") == "card-index.shard-1-of-4.json"
+        assert Shard.from_state_file(Path("contacts.shard-3-of-4.json")) == Shard(3, 4)
+        assert Shard.from_state_file(Path("contacts.json")) is None
+
+    def test_shards_partition_the_work(self, temp_dirs):
+        """Every card is converted by exactly one shard."""
+        make_sources(temp_dirs['test_vcf_dir'], 12)
+        converted = []
+        for index in range(1, 4):
+            converter = VCFConverter(shard=f"{index}/3")
+            results = list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']))
+            assert len(results) == 12
+            assert converter.unowned == sum(result.status == "unowned" for result in results)
+            converted.extend(result.source.name for result in results if result.status == "converted")
+
+        assert sorted(converted) == sorted(f"shard_{index}.vcf" for index in range(12))
+        assert len(list(temp_dirs['test_output_dir'].glob("*.md"))) == 12
+
+    def test_indexed_cards_are_owned_by_uid(self, temp_dirs):
+        """Shards index only their own cards of a multi-card file, and merging combines them."""
+        content = "".join(CARD_TEMPLATE.format(index=index) for index in range(8))
+        create_test_vcf(temp_dirs['test_vcf_dir'], "many.vcf", content)
+        output_dir = temp_dirs['test_output_dir']
+        run_shards(temp_dirs, 2, card_index=True)
+
+        state_dir = output_dir / ".vcf-to-obsidian"
+        per_shard = []
+        for index in (1, 2):
+            with open(state_dir / f"card-index.shard-{index}-of-2.json", encoding="utf-8") as f:
+                sources = json.load(f)["sources"]
+            per_shard.append({card['uid'] for cards in sources.values() for card in cards})
+        assert not per_shard[0] & per_shard[1]
+        assert per_shard[0] | per_shard[1] == {f"shard-{index}" for index in range(8)}
+        assert len(list(output_dir.glob("*.md"))) == 8
+
+        assert VCFConverter().merge_shards(output_dir)
+        with open(state_dir / "card-index.json", encoding="utf-8") as f:
+            (cards,) = json.load(f)["sources"].values()
+        assert [card['uid'] for card in cards] == [f"shard-{index}" for index in range(8)]
+
+    def test_merge_catalogs(self, temp_dirs):
+        """Merging writes the combined catalog and the index note."""
+        make_sources(temp_dirs['test_vcf_dir'], 6)
+        output_dir = temp_dirs['test_output_dir']
+        run_shards(temp_dirs, 2, catalog=True)
+        assert not (output_dir / "Contacts Index.md").exists()
+
+        assert VCFConverter().merge_shards(output_dir)
+
+        with open(output_dir / ".vcf-to-obsidian" / "contacts.json", encoding="utf-8") as f:
+            contacts = json.load(f)["contacts"]
+        assert len(contacts) == 6
+        assert "[[Shard Contact 5]]" in (output_dir / "Contacts Index.md").read_text(encoding="utf-8")
+
+    def test_merge_reports_missing_shard(self, temp_dirs, capsys):
+        """A merge with a shard's state missing is reported as incomplete."""
+        make_sources(temp_dirs['test_vcf_dir'], 6)
+        VCFConverter(shard="1/3", catalog=True).convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']
+        )
+
+        assert not VCFConverter().merge_shards(temp_dirs['test_output_dir'])
+        assert "No state from shard(s) 2/3, 3/3" in capsys.readouterr().err
+
+    def test_cli_rejects_invalid_shard(self, temp_dirs):
+        """An invalid --shard is rejected before anything is converted."""
+        make_sources(temp_dirs['test_vcf_dir'], 1)
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), "--folder", str(temp_dirs['test_vcf_dir']),
+             "--obsidian", str(temp_dirs['test_output_dir']), "--shard", "5/4"],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert result.returncode != 0
+        assert "Invalid shard" in result.stderr
+        assert not list(temp_dirs['test_output_dir'].glob("*.md"))
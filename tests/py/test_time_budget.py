@@ -0,0 +1,103 @@
+"""
+Tests for time-budgeted runs with recency-prioritized scheduling.
+"""
+
+import itertools
+import os
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, WorkScheduler
+from vcf_to_obsidian import vcf_converter
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Budget Contact {index}
+UID:budget-{index}
+END:VCARD"""
+
+
+def make_sources(directory, count):
+    """Create count VCF files, each newer than the one before."""
+    paths = []
+    for index in range(count):
+        path = create_test_vcf(directory, f"budget_{index}.vcf", VCF_TEMPLATE.format(index=index))
+        os.utime(path, ns=(0, (1_600_000_000 + index) * 1_000_000_000))
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Make every clock reading one second later than the last."""
+    ticks = itertools.count()
+    monkeypatch.setattr(vcf_converter.time, "monotonic", lambda: float(next(ticks)))
+
+
+class TestWorkScheduler:
+    """Test cases for the WorkScheduler class."""
+
+    def test_orders_newest_first(self, temp_dirs):
+        """Test that more recently modified files are scheduled first."""
+        paths = make_sources(temp_dirs['test_vcf_dir'], 3)
+        assert WorkScheduler().order(paths) == list(reversed(paths))
+
+    def test_deferred_files_come_first(self, temp_dirs):
+        """Test that deferred files are scheduled before newer work, across a save and load."""
+        paths = make_sources(temp_dirs['test_vcf_dir'], 3)
+        state_path = temp_dirs['test_output_dir'] / "deferred.json"
+        scheduler = WorkScheduler(state_path)
+        scheduler.defer([paths[0]])
+        scheduler.save()
+
+        assert WorkScheduler(state_path).order(paths) == [paths[0], paths[2], paths[1]]
+
+        scheduler.defer([])
+        scheduler.save()
+        assert not state_path.exists()
+
+
+class TestTimeBudget:
+    """Test cases for max_seconds in batch runs."""
+
+    def test_budget_defers_oldest_files(self, temp_dirs, fake_clock):
+        """Test that the newest files are converted and the rest are deferred."""
+        paths = make_sources(temp_dirs['test_vcf_dir'], 4)
+        converter = VCFConverter(max_seconds=2.5)
+
+        results = list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']))
+
+        assert [result.source for result in results] == [paths[3], paths[2]]
+        assert converter.deferred == [paths[1], paths[0]]
+
+    def test_next_run_starts_with_deferred(self, temp_dirs, fake_clock):
+        """Test that a following run converts the deferred files first."""
+        paths = make_sources(temp_dirs['test_vcf_dir'], 4)
+        VCFConverter(max_seconds=2.5).convert_vcf_files_from_sources(
+            [temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']
+        )
+
+        converter = VCFConverter(max_seconds=100)
+        results = list(converter.iter_convert([temp_dirs['test_vcf_dir']], [], temp_dirs['test_output_dir']))
+
+        assert [result.source for result in results][:2] == [paths[1], paths[0]]
+        assert converter.deferred == []
+        assert not (temp_dirs['test_output_dir'] / ".vcf-to-obsidian" / "deferred.json").exists()
+
+    def test_summary_reports_deferred(self, temp_dirs, fake_clock, capsys):
+        """Test that process_tasks ends cleanly with a deferral summary."""
+        make_sources(temp_dirs['test_vcf_dir'], 4)
+
+        VCFConverter(max_seconds=1.5).process_tasks(
+            [temp_dirs['test_vcf_dir']], temp_dirs['test_output_dir'], [], False, []
+        )
+
+        output = capsys.readouterr().out
+        assert "Found 4 VCF file(s) to process" in output
+        assert "Successfully completed 1/1 conversions." in output
+        assert "Deferred: 3 file(s)" in output
+
+    def test_invalid_budget(self):
+        """Test that a non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            VCFConverter(max_seconds=0)
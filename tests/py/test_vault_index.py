@@ -0,0 +1,96 @@
+"""
+Tests for preloading existing note metadata from the vault.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, VaultIndex
+
+
+NOTE_CONTENT = """---
+FN: Indexed Contact
+UID: indexed-1
+REV: 20240102T030405Z
+---
+
+#### Notes
+
+UID: not-in-frontmatter
+"""
+
+VCF_CONTENT = """BEGIN:VCARD
+VERSION:3.0
+FN:Renamed Contact
+UID:indexed-1
+END:VCARD"""
+
+
+class TestVaultIndex:
+    """Test cases for the VaultIndex class and its use by VCFConverter."""
+
+    def test_load_reads_frontmatter(self, temp_dirs):
+        """Test that UID and REV are read from each note's frontmatter."""
+        note = temp_dirs['test_output_dir'] / "Indexed Contact.md"
+        note.write_text(NOTE_CONTENT, encoding='utf-8')
+
+        index = VaultIndex().load(temp_dirs['test_output_dir'], max_workers=2)
+
+        assert index.note_count == 1
+        assert index.bytes_read == note.stat().st_size
+        assert index.files_with_uid("indexed-1") == [note]
+        assert index.files_with_uid("not-in-frontmatter") == []
+        assert index.get_rev(note) == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    def test_load_missing_directory(self, temp_dirs):
+        """Test that a missing directory loads as an empty index."""
+        index = VaultIndex().load(temp_dirs['test_output_dir'] / "missing")
+        assert index.note_count == 0
+        assert "Preloaded 0 note(s)" in index.throughput()
+
+    def test_update_and_remove(self, temp_dirs):
+        """Test that written and deleted notes keep the UID map consistent."""
+        index = VaultIndex()
+        first = temp_dirs['test_output_dir'] / "First.md"
+        second = temp_dirs['test_output_dir'] / "Second.md"
+        index.update(first, "uid-1", None)
+        index.update(second, "uid-1", None)
+        index.remove(first)
+
+        assert index.files_with_uid("uid-1") == [second]
+        assert not index.contains(first)
+        index.remove(second)
+        assert "uid-1" not in index.by_uid
+
+    def test_converter_uses_preloaded_index(self, temp_dirs, monkeypatch):
+        """Test that renames are resolved from the index without scanning the vault."""
+        old_note = temp_dirs['test_output_dir'] / "Indexed Contact.md"
+        old_note.write_text(NOTE_CONTENT, encoding='utf-8')
+        vcf_path = create_test_vcf(temp_dirs['test_vcf_dir'], "renamed.vcf", VCF_CONTENT)
+
+        converter = VCFConverter()
+        index = converter.preload_vault(temp_dirs['test_output_dir'])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("vault should not be scanned")
+        monkeypatch.setattr(converter.filename_gen, "find_existing_files_with_uid", fail)
+
+        assert converter.convert_vcf_to_markdown(vcf_path, temp_dirs['test_output_dir'])
+        new_note = temp_dirs['test_output_dir'] / "Renamed Contact.md"
+        assert not old_note.exists()
+        assert index.files_with_uid("indexed-1") == [new_note]
+        assert index.get_rev(new_note) is not None
+
+    def test_batch_run_reports_throughput(self, temp_dirs, capsys):
+        """Test that a verbose batch run preloads the vault and reports throughput."""
+        create_test_vcf(temp_dirs['test_vcf_dir'], "renamed.vcf", VCF_CONTENT)
+        (temp_dirs['test_output_dir'] / "Indexed Contact.md").write_text(NOTE_CONTENT, encoding='utf-8')
+
+        VCFConverter(vault_workers=2).process_tasks(
+            [temp_dirs['test_vcf_dir']], temp_dirs['test_output_dir'], [], True, []
+        )
+
+        output = capsys.readouterr().out
+        assert "Preloaded 1 note(s)" in output
+        assert "notes/s" in output
+        assert "Removed old file: Indexed Contact.md" in output
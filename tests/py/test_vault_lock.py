@@ -0,0 +1,134 @@
+"""
+Tests for the advisory vault lock.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+import pytest
+from conftest import create_test_vcf
+from vcf_to_obsidian import VCFConverter, VaultLock, VaultLocked
+
+
+VCF_TEMPLATE = """BEGIN:VCARD
+VERSION:3.0
+FN:Locked Contact {index}
+UID:locked-{index}
+END:VCARD"""
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "vcf_to_obsidian.py"
+
+
+def make_sources(directory, count):
+    return [
+        create_test_vcf(directory, f"locked_{index}.vcf", VCF_TEMPLATE.format(index=index))
+        for index in range(count)
+    ]
+
+
+def lock_path(output_dir):
+    return output_dir / ".vcf-to-obsidian" / "vault.lock"
+
+
+class TestVaultLock:
+    """Test cases for the VaultLock class."""
+
+    def test_excludes_second_holder(self, temp_dirs):
+        """A held lock cannot be taken again until it is released."""
+        first = VaultLock(lock_path(temp_dirs['test_output_dir']))
+        second = VaultLock(lock_path(temp_dirs['test_output_dir']), mode="fail")
+
+        assert first.acquire()
+        assert not second.try_acquire()
+        with pytest.raises(VaultLocked, match=f"process {os.getpid()}"):
+            second.acquire()
+
+        first.release()
+        assert second.acquire()
+        second.release()
+
+    def test_wait_mode_waits_for_release(self, temp_dirs):
+        """In wait mode the lock is taken as soon as the holder releases it."""
+        holder = VaultLock(lock_path(temp_dirs['test_output_dir']))
+        waiter = VaultLock(lock_path(temp_dirs['test_output_dir']), poll_interval=0.01)
+        holder.acquire()
+        releaser = threading.Timer(0.1, holder.release)
+        releaser.start()
+
+        start = time.monotonic()
+        assert waiter.acquire()
+        assert time.monotonic() - start >= 0.05
+        releaser.join()
+        waiter.release()
+
+    def test_breaks_stale_lock(self, temp_dirs):
+        """A lock still held for a process that has exited is broken."""
+        path = lock_path(temp_dirs['test_output_dir'])
+        path.parent.mkdir(parents=True)
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        # Simulate a descriptor that outlived the process that took the lock
+        leaked = VaultLock(path)
+        leaked.acquire()
+        path.write_text(json.dumps({'pid': dead.pid, 'host': socket.gethostname()}))
+
+        fresh = VaultLock(path, mode="fail")
+        assert fresh.acquire()
+        assert fresh.holder()['pid'] == os.getpid()
+        fresh.release()
+        leaked.release()
+
+    def test_fail_mode_exit_status(self, temp_dirs):
+        """The CLI exits with status 75 when the vault is locked."""
+        make_sources(temp_dirs['test_vcf_dir'], 1)
+        holder = VaultLock(lock_path(temp_dirs['test_output_dir']))
+        holder.acquire()
+        try:
+            result = subprocess.run(
+                [sys.executable, str(SCRIPT), "--folder", str(temp_dirs['test_vcf_dir']),
+                 "--obsidian", str(temp_dirs['test_output_dir']), "--lock", "fail"],
+                capture_output=True, text=True, timeout=60,
+            )
+        finally:
+            holder.release()
+
+        assert result.returncode == 75
+        assert "Vault is locked by process" in result.stderr
+        assert not list(temp_dirs['test_output_dir'].glob("*.md"))
+
+    def test_coalesced_run_gets_another_pass(self, temp_dirs, capsys):
+        """A coalesced run converts nothing; the running instance makes one more pass."""
+        make_sources(temp_dirs['test_vcf_dir'], 2)
+        output_dir = temp_dirs['test_output_dir']
+        running = VCFConverter(lock="coalesce").iter_convert([temp_dirs['test_vcf_dir']], [], output_dir)
+        first = next(running)
+
+        late = VCFConverter(lock="coalesce")
+        successful, total, _ = late.convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+        assert late.coalesced
+        assert (successful, total) == (0, 0)
+        make_sources(temp_dirs['test_vcf_dir'], 3)
+
+        results = [first] + list(running)
+
+        assert len(results) == 2 + 3
+        assert "Starting another pass" in capsys.readouterr().out
+        assert (output_dir / "Locked Contact 2.md").exists()
+        assert not VaultLock(lock_path(output_dir)).requested
+
+    def test_shards_do_not_block_each_other(self, temp_dirs):
+        """Each shard takes its own lock."""
+        make_sources(temp_dirs['test_vcf_dir'], 4)
+        output_dir = temp_dirs['test_output_dir']
+        running = VCFConverter(shard="1/2", lock="fail").iter_convert([temp_dirs['test_vcf_dir']], [], output_dir)
+        next(running)
+
+        VCFConverter(shard="2/2", lock="fail").convert_vcf_files_from_sources([temp_dirs['test_vcf_dir']], [], output_dir)
+        list(running)
+
+        assert len(list(output_dir.glob("*.md"))) == 4
@@ -12,8 +12,39 @@ from .vcf_reader import VCFReader
 from .markdown_writer import MarkdownWriter
 from .filename_generator import FilenameGenerator
 from .vcf_converter import VCFConverter
+from .card_index import CardIndex
+from .quarantine import QuarantineCache
+from .vault_index import VaultIndex
+from .note_updater import NoteUpdater
+from .destination import Destination
+from .contact_filter import ContactFilter
+from .field_projection import FieldProjection
+from .ignore_matcher import IgnoreMatcher
+from .conversion_result import ConversionResult
+from .work_scheduler import WorkScheduler
+from .contact_catalog import ContactCatalog
+from .parse_cache import ParseCache
+from .shard import Shard
+from .vault_lock import VaultLock, VaultLocked
+from .source_map import SourceMap
+from .daemon import ConversionDaemon
+from .duplicate_finder import DuplicateFinder
+from .contact_record import ContactRecord
+from .run_history import RunHistory
+from .autotuner import Autotuner
+from .write_pool import WritePool
+from .directory_cache import DirectoryCache
+from .syscall_counter import SyscallCounter
+from .change_feed import ChangeFeed
 
 
 __all__ = [
     'VCFReader', 'MarkdownWriter', 'FilenameGenerator', 'VCFConverter',
+    'CardIndex', 'QuarantineCache', 'VaultIndex', 'NoteUpdater',
+    'Destination', 'ContactFilter', 'FieldProjection',
+    'IgnoreMatcher', 'ConversionResult', 'WorkScheduler',
+    'ContactCatalog', 'ParseCache', 'Shard', 'VaultLock', 'VaultLocked',
+    'SourceMap', 'ConversionDaemon', 'DuplicateFinder',
+    'ContactRecord', 'RunHistory', 'Autotuner', 'WritePool',
+    'DirectoryCache', 'SyscallCounter', 'ChangeFeed',
 ]
@@ -0,0 +1,164 @@
+"""
+Autotuner module for choosing worker counts from measured stage latencies.
+"""
+
+import time
+
+
+# Files measured before worker counts are chosen
+DEFAULT_SAMPLE_SIZE = 200
+
+# Upper bounds on the worker counts the tuner chooses
+MAX_PARSE_WORKERS = 8
+MAX_WRITE_WORKERS = 16
+
+# Share of one core the process used while sampling above which the run is
+# CPU-bound; threads share one interpreter, so more of them would only wait
+CPU_BOUND_UTILIZATION = 0.85
+
+# Stage names, in pipeline order
+STAGES = ("parse", "write")
+
+
+class Autotuner:
+    """Class responsible for choosing parse and write worker counts from the first files of a run."""
+
+    def __init__(self, parse_workers=None, write_workers=None, sample_size=DEFAULT_SAMPLE_SIZE):
+        """
+        Initialize the tuner.
+
+        A stage that spends most of its time waiting for the filesystem
+        needs several threads to keep the pipeline busy, roughly its wall
+        time divided by its CPU time. A stage that computes gains nothing
+        from more threads, so it keeps one.
+
+        Args:
+            parse_workers (int, optional): Pinned number of parse threads;
+                chosen from measurements if None
+            write_workers (int, optional): Pinned number of threads writing
+                notes; chosen from measurements if None
+            sample_size (int): Files measured before choosing
+
+        Raises:
+            ValueError: If a worker count or the sample size is not positive
+        """
+        for name, value in (("parse_workers", parse_workers), ("write_workers", write_workers)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1")
+        if sample_size < 1:
+            raise ValueError("sample_size must be at least 1")
+        self.pinned = {'parse': parse_workers, 'write': write_workers}
+        self.parse_workers = parse_workers or 1
+        self.write_workers = write_workers or 1
+        self.sample_size = sample_size
+        self.sampling = parse_workers is None or write_workers is None
+        self.tuned = False
+        self.utilization = None
+        self._samples = {stage: [0, 0.0, 0.0] for stage in STAGES}
+        self._elapsed = [0.0, 0.0]
+        self._clock = None
+
+    def start(self):
+        """Start the sampling clock at the beginning of a pass, unless sampling is over."""
+        if self.sampling and self._clock is None:
+            self._clock = (time.perf_counter(), time.process_time())
+
+    def stop(self):
+        """Stop the sampling clock at the end of a pass, so idle time between passes is not measured."""
+        if self._clock is not None:
+            self._elapsed[0] += time.perf_counter() - self._clock[0]
+            self._elapsed[1] += time.process_time() - self._clock[1]
+            self._clock = None
+
+    def record(self, stage, wall_seconds, cpu_seconds):
+        """
+        Add the measured latency of one file in a stage.
+
+        Args:
+            stage (str): "parse" or "write"
+            wall_seconds (float): Elapsed time of the file in the stage
+            cpu_seconds (float): CPU time of the thread that handled it
+        """
+        if not self.sampling:
+            return
+        sample = self._samples[stage]
+        sample[0] += 1
+        sample[1] += wall_seconds
+        sample[2] += cpu_seconds
+
+    @property
+    def ready(self):
+        """bool: True once enough files went through every stage being tuned."""
+        return self.sampling and all(
+            self._samples[stage][0] >= self.sample_size for stage in STAGES if self.pinned[stage] is None
+        )
+
+    def latency(self, stage):
+        """
+        Get the mean latency of a stage over the sampled files.
+
+        Args:
+            stage (str): "parse" or "write"
+
+        Returns:
+            tuple: (wall seconds per file, CPU seconds per file)
+        """
+        count, wall, cpu = self._samples[stage]
+        return (wall / count, cpu / count) if count else (0.0, 0.0)
+
+    def tune(self):
+        """
+        Choose the worker counts that were not pinned and stop sampling.
+
+        Returns:
+            tuple: (parse_workers, write_workers)
+        """
+        self.stop()
+        wall, cpu = self._elapsed
+        if wall > 0:
+            self.utilization = cpu / wall
+        cpu_bound = self.utilization is not None and self.utilization >= CPU_BOUND_UTILIZATION
+        for stage, limit in (("parse", MAX_PARSE_WORKERS), ("write", MAX_WRITE_WORKERS)):
+            if self.pinned[stage] is not None:
+                continue
+            workers = 1 if cpu_bound else self._workers_for(*self.latency(stage), limit)
+            setattr(self, f"{stage}_workers", workers)
+        self.sampling = False
+        self.tuned = True
+        return self.parse_workers, self.write_workers
+
+    def describe(self):
+        """
+        Describe the chosen worker counts and the measurements behind them.
+
+        Returns:
+            str: One line that also shows how to pin the choice
+        """
+        details = []
+        for stage in STAGES:
+            wall, cpu = self.latency(stage)
+            share = f"{cpu / wall:.0%} CPU" if wall else "no time"
+            details.append(f"{stage} {wall * 1000:.2f} ms/file, {share}")
+        if self.utilization is not None:
+            details.append(f"process {self.utilization:.2f} core(s)")
+        return (
+            f"Autotune: {self.parse_workers} parse worker(s), {self.write_workers} write worker(s) "
+            f"({'; '.join(details)}); pin with --parse-workers {self.parse_workers} "
+            f"--write-workers {self.write_workers}"
+        )
+
+    def to_dict(self):
+        """
+        Get the worker counts for a run record.
+
+        Returns:
+            dict: parse and write worker counts, and whether they were tuned
+        """
+        return {'parse': self.parse_workers, 'write': self.write_workers, 'tuned': self.tuned}
+
+    @staticmethod
+    def _workers_for(wall, cpu, limit):
+        """Get the threads that keep a stage busy: its wall time per unit of CPU time, bounded."""
+        if wall <= 0:
+            return 1
+        return max(1, min(limit, round(wall / max(cpu, wall / limit))))
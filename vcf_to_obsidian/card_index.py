@@ -0,0 +1,210 @@
+"""
+Card Index module for tracking individual vCards inside multi-card VCF files.
+"""
+
+import hashlib
+import json
+import mmap
+import re
+from pathlib import Path
+
+
+class CardIndex:
+    """Class responsible for locating and fingerprinting vCards by byte offset."""
+
+    # Matches one BEGIN:VCARD ... END:VCARD block, including its line ending
+    CARD_PATTERN = re.compile(
+        rb"^BEGIN:VCARD\b.*?^END:VCARD[^\n]*(?:\n|\Z)",
+        re.DOTALL | re.MULTILINE | re.IGNORECASE,
+    )
+    UID_PATTERN = re.compile(
+        rb"^UID(?:;[^:\r\n]*)?:([^\r\n]*)", re.MULTILINE | re.IGNORECASE
+    )
+
+    def __init__(self, index_path=None):
+        """
+        Initialize the card index.
+
+        Args:
+            index_path (Path, optional): JSON file the index is persisted to
+        """
+        self.index_path = Path(index_path) if index_path else None
+        self.sources = {}
+        self._dirty = False
+        if self.index_path:
+            self.load()
+
+    def scan(self, vcf_path):
+        """
+        Locate every vCard block in a VCF file without decoding it.
+
+        The file is memory-mapped and searched as raw bytes, so only the
+        bytes of each block are hashed and nothing is handed to vobject.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            list: One dict per card with offset, length, hash and uid keys
+        """
+        cards = []
+        with open(vcf_path, 'rb') as f:
+            # mmap refuses zero-length files
+            if f.seek(0, 2) == 0:
+                return cards
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in self.CARD_PATTERN.finditer(mm):
+                    block = match.group(0)
+                    uid_match = self.UID_PATTERN.search(block)
+                    uid = uid_match.group(1).decode('utf-8', 'replace').strip() if uid_match else ''
+                    cards.append({
+                        'offset': match.start(),
+                        'length': match.end() - match.start(),
+                        'hash': hashlib.sha256(block).hexdigest(),
+                        'uid': uid,
+                    })
+        return cards
+
+    def read_card(self, vcf_path, card):
+        """
+        Read the text of a single indexed card.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            card (dict): Card entry as returned by scan()
+
+        Returns:
+            str: Decoded text of the card
+        """
+        with open(vcf_path, 'rb') as f:
+            f.seek(card['offset'])
+            return f.read(card['length']).decode('utf-8')
+
+    def diff(self, vcf_path, cards, output_dir, retry_failed=False):
+        """
+        Compare freshly scanned cards against the stored index.
+
+        A card is unchanged when a card with the same content hash was
+        indexed before and its note still exists. Note names of unchanged
+        cards are carried over onto the new entries. Cards that failed to
+        convert keep their error and are left alone until their content
+        changes, unless retry_failed is set.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            cards (list): Card entries as returned by scan()
+            output_dir (Path): Directory holding the generated notes
+            retry_failed (bool): Treat previously failed cards as changed
+
+        Returns:
+            tuple: (changed_cards, removed_cards)
+        """
+        previous = self.sources.get(self._key(vcf_path), [])
+        previous_by_hash = {card['hash']: card for card in previous}
+
+        changed = []
+        for card in cards:
+            old = previous_by_hash.get(card['hash'])
+            if old and old.get('error') and not retry_failed:
+                card['error'] = old['error']
+            elif old and old.get('note') and (Path(output_dir) / old['note']).exists():
+                card['note'] = old['note']
+            else:
+                changed.append(card)
+
+        current_hashes = {card['hash'] for card in cards}
+        current_uids = {card['uid'] for card in cards if card['uid']}
+        removed = [
+            card for card in previous
+            if card['hash'] not in current_hashes
+            and not (card['uid'] and card['uid'] in current_uids)
+        ]
+        return changed, removed
+
+    def contains(self, vcf_path):
+        """
+        Check whether the cards of a VCF file are indexed.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            bool: True if the file has an entry in the index
+        """
+        return self._key(vcf_path) in self.sources
+
+    def update(self, vcf_path, cards):
+        """
+        Store the card entries for a VCF file.
+
+        A file left without cards is dropped from the index.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            cards (list): Card entries, with note names filled in
+        """
+        if cards:
+            self.sources[self._key(vcf_path)] = cards
+        else:
+            self.sources.pop(self._key(vcf_path), None)
+        self._dirty = True
+
+    def merge(self, indexes):
+        """
+        Replace the stored entries with the union of other indexes.
+
+        Used to reconcile the indexes written by the shards of a run: each
+        shard indexes only the cards it owns, so the cards of a file are the
+        combination of every shard's cards for it.
+
+        Args:
+            indexes (iterable): CardIndex objects to combine
+        """
+        sources = {}
+        for index in indexes:
+            for key, cards in index.sources.items():
+                merged = sources.setdefault(key, [])
+                hashes = {card['hash'] for card in merged}
+                merged.extend(card for card in cards if card['hash'] not in hashes)
+        for cards in sources.values():
+            cards.sort(key=lambda card: card['offset'])
+        self.sources = sources
+        self._dirty = True
+
+    def remove(self, vcf_path):
+        """
+        Forget the cards of a VCF file.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            bool: True if the file was indexed
+        """
+        if self.sources.pop(self._key(vcf_path), None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def load(self):
+        """Load the index from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.sources = json.load(f).get('sources', {})
+        except Exception:
+            self.sources = {}
+        self._dirty = False
+
+    def save(self):
+        """Write the index to disk if it has changed since it was loaded."""
+        if not self.index_path or not self._dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'sources': self.sources}, f)
+        tmp_path.replace(self.index_path)
+        self._dirty = False
+
+    def _key(self, vcf_path):
+        return str(Path(vcf_path).resolve())
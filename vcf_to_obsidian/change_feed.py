@@ -0,0 +1,72 @@
+"""
+Change Feed module for reading lists of changed and deleted VCF files.
+"""
+
+import os
+from pathlib import Path
+
+
+class ChangeFeed:
+    """Class responsible for holding the source paths a sync tool reported as changed or deleted."""
+
+    def __init__(self, paths=()):
+        """
+        Initialize a feed.
+
+        A path named more than once is kept once, at its first position.
+
+        Args:
+            paths (iterable): Paths of VCF files that changed or were deleted
+        """
+        self.paths = list(dict.fromkeys(Path(path) for path in paths))
+
+    @classmethod
+    def parse(cls, data):
+        """
+        Parse a list of paths, one per line or separated by NUL characters.
+
+        The list is NUL-separated if it contains a NUL, as written by
+        find -print0, so paths may then contain newlines. Otherwise each
+        line is a path; line endings, including CRLF, and blank lines are
+        dropped.
+
+        Args:
+            data (bytes or str): The list; bytes are decoded like file names
+
+        Returns:
+            ChangeFeed: Feed of the listed paths
+        """
+        if isinstance(data, bytes):
+            data = os.fsdecode(data)
+        if "\0" in data:
+            entries = data.split("\0")
+        else:
+            entries = [line.rstrip("\r") for line in data.split("\n")]
+        return cls(entry for entry in entries if entry)
+
+    @classmethod
+    def read(cls, stream):
+        """
+        Read a list of paths from an open file, such as standard input.
+
+        Args:
+            stream: Binary or text file object
+
+        Returns:
+            ChangeFeed: Feed of the listed paths
+        """
+        return cls.parse(stream.read())
+
+    def split(self):
+        """
+        Sort the paths into files to convert and files that were deleted.
+
+        Returns:
+            tuple: (changed, deleted) lists of Path objects; paths that still
+            exist are changed, even if they are not regular files
+        """
+        changed = []
+        deleted = []
+        for path in self.paths:
+            (changed if os.path.lexists(path) else deleted).append(path)
+        return changed, deleted
@@ -3,8 +3,59 @@ CLI module for command-line interface handling.
 """
 
 import click
+import sys
 from pathlib import Path
-from .vcf_converter import VCFConverter
+from .vcf_converter import VCFConverter, REV_SOURCES
+from .destination import Destination
+from .contact_filter import ContactFilter
+from .ignore_matcher import IgnoreMatcher
+from .shard import Shard
+from .vault_lock import LOCK_MODES
+from .daemon import ConversionDaemon
+from .change_feed import ChangeFeed
+
+
+def parse_destinations(ctx, param, value):
+    """Parse --obsidian specifications into Destination objects."""
+    try:
+        return tuple(Destination.parse(spec) for spec in value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def validate_predicates(ctx, param, value):
+    """Check --include and --exclude predicates before any file is read."""
+    try:
+        ContactFilter(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return value
+
+
+def validate_ignore_patterns(ctx, param, value):
+    """Check --ignore regular expressions before any folder is traversed."""
+    try:
+        IgnoreMatcher(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return value
+
+
+def parse_shard(ctx, param, value):
+    """Parse --shard into a Shard object."""
+    if value is None:
+        return None
+    try:
+        return Shard.parse(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def read_change_feed(ctx, param, value):
+    """Read the --files-from list of changed and deleted VCF files."""
+    if value is None:
+        return None
+    return ChangeFeed.read(value)
 
 
 # Create the click command
@@ -14,9 +65,11 @@ from .vcf_converter import VCFConverter
               multiple=True,
               help="Source directory containing VCF files (can be specified multiple times)")
 @click.option('--obsidian',
-              type=click.Path(path_type=Path),
+              multiple=True,
               required=True,
-              help="Destination directory for Markdown files")
+              callback=parse_destinations,
+              help="Destination directory for Markdown files, optionally followed by "
+                   "::photos=embed|link|none,include=PREDICATE,exclude=PREDICATE (can be specified multiple times)")
 @click.option('--file',
               type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
               multiple=True,
@@ -25,18 +78,204 @@ from .vcf_converter import VCFConverter
               is_flag=True,
               help="Enable verbose output")
 @click.option('--ignore',
-              type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
               multiple=True,
-              help="Specific VCF file to ignore (can be specified multiple times)")
-def main_cli(folder, obsidian, file, verbose, ignore):
+              callback=validate_ignore_patterns,
+              help="VCF file, glob (e.g. '*.bak.vcf', 'old/') or re:REGEX to ignore "
+                   "(can be specified multiple times)")
+@click.option('--recursive', '-r',
+              is_flag=True,
+              help="Also convert VCF files in subdirectories of --folder sources")
+@click.option('--card-index',
+              is_flag=True,
+              help="Convert every card in multi-card VCF files, re-parsing only cards that changed")
+@click.option('--retry-failed',
+              is_flag=True,
+              help="Retry VCF files that previously failed even if they have not changed")
+@click.option('--rev-source',
+              type=click.Choice(REV_SOURCES),
+              default="now",
+              show_default=True,
+              help="Where the note's REV comes from: conversion time, the card's own REV, or the VCF file's mtime")
+@click.option('--mirror-mtime',
+              is_flag=True,
+              help="Give each note its source VCF's mtime and skip notes whose mtime matches, without reading them")
+@click.option('--vault-workers',
+              type=click.IntRange(min=1),
+              default=None,
+              help="Threads used to preload existing notes' metadata (default: automatic)")
+@click.option('--preserve-body',
+              is_flag=True,
+              help="Update only the frontmatter and tag line of existing notes, keeping text written below them")
+@click.option('--include',
+              multiple=True,
+              callback=validate_predicates,
+              help="Only convert cards matching FIELD=VALUE or FIELD~REGEX (can be specified multiple times)")
+@click.option('--exclude',
+              multiple=True,
+              callback=validate_predicates,
+              help="Skip cards matching FIELD=VALUE or FIELD~REGEX (can be specified multiple times)")
+@click.option('--fields',
+              default=None,
+              help="Comma-separated vCard properties to convert, e.g. EMAIL,TEL; others are never parsed")
+@click.option('--no-photos',
+              is_flag=True,
+              help="Drop PHOTO before parsing so photo data is never decoded")
+@click.option('--max-seconds',
+              type=click.FloatRange(min=0, min_open=True),
+              default=None,
+              help="Stop converting after this many seconds, newest files first; the rest wait for the next run")
+@click.option('--catalog',
+              is_flag=True,
+              help="Maintain contacts.json, contacts.csv and a 'Contacts Index' note, updated only where contacts changed")
+@click.option('--parse-cache',
+              is_flag=True,
+              help="Cache parsed cards on disk so unchanged sources are rendered without parsing")
+@click.option('--parse-cache-mb',
+              type=click.IntRange(min=1),
+              default=64,
+              show_default=True,
+              help="Size limit of the parse cache in MB; least recently used cards are evicted")
+@click.option('--shard',
+              default=None,
+              callback=parse_shard,
+              help="Convert only shard i of N (e.g. 2/4), assigning cards by UID hash; run each shard on its own machine")
+@click.option('--merge-shards',
+              is_flag=True,
+              help="Combine the state written by --shard runs in each --obsidian destination, then exit")
+@click.option('--lock',
+              type=click.Choice(LOCK_MODES),
+              default="wait",
+              show_default=True,
+              help="When another run holds the vault: wait for it, fail with exit status 75, "
+                   "or coalesce into its next pass and exit")
+@click.option('--dedupe',
+              is_flag=True,
+              help="Report contacts that likely describe the same person instead of converting")
+@click.option('--dedupe-threshold',
+              type=click.FloatRange(min=0, max=1, min_open=True),
+              default=0.8,
+              show_default=True,
+              help="Minimum score for --dedupe to suggest a merge; lower finds more, less certain duplicates")
+@click.option('--no-history',
+              is_flag=True,
+              help="Do not append this run's record to the vault's history.jsonl")
+@click.option('--stats',
+              is_flag=True,
+              help="Show recent runs from each --obsidian destination's history and flag regressions, then exit")
+@click.option('--parse-workers',
+              type=click.IntRange(min=1),
+              default=None,
+              help="Threads reading and parsing VCF files (default: chosen from the first files of each run)")
+@click.option('--write-workers',
+              type=click.IntRange(min=1),
+              default=None,
+              help="Threads writing notes; more help on high-latency vaults such as SMB mounts (default: automatic)")
+@click.option('--low-syscall',
+              is_flag=True,
+              help="List each directory once and answer file checks from the listing; for vaults on NFS or SMB")
+@click.option('--count-syscalls',
+              is_flag=True,
+              help="Print how many filesystem calls the run made per converted file")
+@click.option('--files-from',
+              type=click.File('rb'),
+              default=None,
+              callback=read_change_feed,
+              help="Convert only the changed VCF files listed in this file, or - for stdin, one per line "
+                   "or NUL-separated; listed files that no longer exist have their notes removed")
+@click.option('--daemon',
+              type=click.Path(dir_okay=False, path_type=Path),
+              default=None,
+              help="Stay running and serve convert, delete and sync requests on this Unix socket")
+def main_cli(folder, obsidian, file, verbose, ignore, recursive, card_index, retry_failed, rev_source,
+             mirror_mtime, vault_workers, preserve_body, include, exclude, fields, no_photos,
+             max_seconds, catalog, parse_cache, parse_cache_mb, shard, merge_shards, lock, dedupe,
+             dedupe_threshold, no_history, stats, parse_workers, write_workers, low_syscall,
+             count_syscalls, files_from, daemon):
     """Convert VCF files to Markdown format for obsidian-vcf-contacts plugin
 
     Use --folder to specify source directories containing VCF files
-    Use --obsidian to specify the destination directory for Markdown files
+    Use --obsidian to specify the destination directory for Markdown files;
+    repeat it to write several vaults from a single parse
     Use --file to specify individual VCF files to process
-    Use --ignore to specify individual VCF files to skip
+    Use --ignore to skip VCF files by path, glob, or re:REGEX pattern;
+    a .vcfignore file in a source folder adds more patterns
+    Use --recursive to descend into subdirectories of source folders
+    Use --card-index to convert multi-card VCF files card by card
+    Use --retry-failed to retry files that failed on an earlier run
+    Use --rev-source card or mtime for deterministic, reproducible notes
+    Use --mirror-mtime for stat-only skip checks on slow network filesystems
+    Use --vault-workers to tune how many threads preload existing notes
+    Use --preserve-body to keep notes written below the generated content
+    Use --include/--exclude to select cards, e.g. --include CATEGORIES=Work
+    Use --fields or --no-photos to skip parsing properties you do not need
+    Use --max-seconds to bound the run time of hooks
+    Use --catalog to maintain contacts.json/CSV and a Contacts Index note
+    Use --parse-cache to re-render notes after an upgrade without reparsing
+    Use --shard i/N to split a run across machines, then --merge-shards
+    Use --lock fail or --lock coalesce for cron jobs that may overlap
+    Use --dedupe to list likely duplicate contacts across sources
+    Use --stats to show how recent runs performed and flag slow ones
+    Use --parse-workers/--write-workers to pin the worker counts autotune prints
+    Use --low-syscall to cut filesystem round trips on network vaults
+    Use --files-from to convert only the files a sync tool reports as changed
+    Use --daemon SOCKET to keep a warm converter for frequent small updates
 
-    --folder, --file, and --ignore options can be specified multiple times.
+    --folder, --obsidian, --file, and --ignore options can be specified multiple times.
     """
-    converter = VCFConverter()
+    if merge_shards and shard is not None:
+        raise click.UsageError("--merge-shards cannot be combined with --shard")
+    if daemon is not None and merge_shards:
+        raise click.UsageError("--daemon cannot be combined with --merge-shards")
+    if dedupe and (merge_shards or daemon is not None):
+        raise click.UsageError("--dedupe cannot be combined with --merge-shards or --daemon")
+    if stats and (merge_shards or dedupe or daemon is not None):
+        raise click.UsageError("--stats cannot be combined with --merge-shards, --dedupe or --daemon")
+    if files_from is not None and (folder or file):
+        raise click.UsageError("--files-from cannot be combined with --folder or --file")
+    if files_from is not None and (merge_shards or dedupe or stats or daemon is not None):
+        raise click.UsageError("--files-from cannot be combined with --merge-shards, --dedupe, --stats or --daemon")
+    if dedupe and not folder and not file:
+        raise click.UsageError("--dedupe needs at least one --folder or --file source")
+    converter = VCFConverter(
+        card_index=card_index,
+        retry_failed=retry_failed,
+        rev_source=rev_source,
+        mirror_mtime=mirror_mtime,
+        vault_workers=vault_workers,
+        preserve_body=preserve_body,
+        include=include,
+        exclude=exclude,
+        fields=fields.split(",") if fields else None,
+        no_photos=no_photos,
+        recursive=recursive,
+        max_seconds=max_seconds,
+        catalog=catalog,
+        parse_cache=parse_cache,
+        parse_cache_bytes=parse_cache_mb * 1024 * 1024,
+        shard=shard,
+        lock=lock,
+        source_map=True,
+        history=not no_history,
+        parse_workers=parse_workers,
+        write_workers=write_workers,
+        low_syscall=low_syscall,
+        count_syscalls=count_syscalls,
+    )
+    if stats:
+        sys.exit(1 if converter.show_stats(obsidian) else 0)
+    if merge_shards:
+        sys.exit(0 if converter.merge_shards(obsidian, verbose) else 1)
+    if dedupe:
+        converter.report_duplicates(folder, file, obsidian, ignore, verbose, dedupe_threshold)
+        return
+    if daemon is not None:
+        try:
+            ConversionDaemon(converter, obsidian, daemon, folder, file, ignore).serve_forever()
+        except OSError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        return
+    if files_from is not None:
+        converter.process_changes(files_from, obsidian, verbose, ignore)
+        return
     converter.process_tasks(folder, obsidian, file, verbose, ignore)
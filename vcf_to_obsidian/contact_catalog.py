@@ -0,0 +1,186 @@
+"""
+Contact Catalog module for maintaining a table of all converted contacts.
+"""
+
+import csv
+import io
+import json
+from pathlib import Path
+from .note_updater import NoteUpdater
+from .contact_record import ContactRecord
+
+
+INDEX_NOTE_NAME = "Contacts Index.md"
+CSV_COLUMNS = ('uid', 'fn', 'org', 'emails', 'phones', 'path')
+
+
+class ContactCatalog:
+    """Class responsible for the contacts.json/CSV catalog and the index note of a vault."""
+
+    def __init__(self, output_dir, state_dir, suffix=""):
+        """
+        Initialize the catalog, loading the entries of earlier runs.
+
+        Args:
+            output_dir (Path): Vault directory the index note is written to
+            state_dir (Path): Directory holding contacts.json and contacts.csv
+            suffix (str): Suffix added to the stem of the JSON and CSV files,
+                such as ".shard-2-of-4". The catalog of a shard covers only
+                part of the vault, so it writes no index note
+        """
+        self.output_dir = Path(output_dir)
+        self.json_path = Path(state_dir) / f"contacts{suffix}.json"
+        self.csv_path = Path(state_dir) / f"contacts{suffix}.csv"
+        self.note_path = None if suffix else self.output_dir / INDEX_NOTE_NAME
+        self.entries = {}
+        self._keys_by_path = {}
+        self.updater = NoteUpdater()
+        self._dirty = False
+        self.load()
+
+    def update(self, vcard, note_path):
+        """
+        Record the contact written to a note.
+
+        Entries are keyed by UID, or by note name for cards without one.
+        Nothing is marked as changed if the entry is already up to date.
+
+        Args:
+            vcard: ContactRecord, or vobject vCard object to extract one from
+            note_path (Path): Path of the note the card was written to
+        """
+        record = ContactRecord.coerce(vcard)
+        uid = record.uid or ''
+        org = ''
+        if record.org:
+            org = record.org[0] if isinstance(record.org, list) else str(record.org)
+        entry = {
+            'uid': uid,
+            'fn': record.fn or '',
+            'org': org,
+            'emails': [email.value for email in record.emails],
+            'phones': [tel.value for tel in record.tels],
+            'path': Path(note_path).name,
+        }
+        key = uid or entry['path']
+        old = self.entries.get(key)
+        if old != entry:
+            if old is not None:
+                self._keys_by_path.pop(old['path'], None)
+            # Another contact may still be listed under this note name
+            self.remove(note_path)
+            self.entries[key] = entry
+            self._keys_by_path[entry['path']] = key
+            self._dirty = True
+
+    def remove(self, note_path):
+        """
+        Drop the entries of a note that was removed.
+
+        Args:
+            note_path (Path): Path of the removed note
+        """
+        key = self._keys_by_path.pop(Path(note_path).name, None)
+        if key is not None:
+            del self.entries[key]
+            self._dirty = True
+
+    def merge(self, catalogs):
+        """
+        Replace the entries with the union of other catalogs.
+
+        Args:
+            catalogs (iterable): ContactCatalog objects to combine, such as
+                those written by the shards of a run
+
+        Returns:
+            list: Keys listed by more than one catalog with different
+            entries; the entry of the last catalog is kept
+        """
+        entries = {}
+        conflicts = set()
+        for catalog in catalogs:
+            for key, entry in catalog.entries.items():
+                if key in entries and entries[key] != entry:
+                    conflicts.add(key)
+                entries[key] = entry
+        self.entries = entries
+        self._keys_by_path = {entry['path']: key for key, entry in entries.items()}
+        self._dirty = True
+        return sorted(conflicts)
+
+    def load(self):
+        """Load the entries from contacts.json, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                contacts = json.load(f).get('contacts', [])
+            self.entries = {entry['uid'] or entry['path']: entry for entry in contacts}
+        except Exception:
+            self.entries = {}
+        self._keys_by_path = {entry['path']: key for key, entry in self.entries.items()}
+        self._dirty = False
+
+    def save(self):
+        """
+        Write contacts.json, contacts.csv, and the index note if anything changed.
+
+        The index note is rewritten from its first changed row only.
+        """
+        if not self._dirty:
+            return
+        contacts = sorted(self.entries.values(), key=lambda entry: (entry['fn'].casefold(), entry['path']))
+
+        self.json_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.json_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'contacts': contacts}, f, indent=1)
+        tmp_path.replace(self.json_path)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+        for entry in contacts:
+            writer.writerow([
+                '; '.join(entry[column]) if isinstance(entry[column], list) else entry[column]
+                for column in CSV_COLUMNS
+            ])
+        self.updater.write_changes(self.csv_path, buffer.getvalue().encode('utf-8'))
+
+        if self.note_path is not None:
+            self.updater.write_changes(self.note_path, self.render_note(contacts).encode('utf-8'))
+        self._dirty = False
+
+    def render_note(self, contacts):
+        """
+        Render the index note as a Markdown table.
+
+        Args:
+            contacts (list): Catalog entries in display order
+
+        Returns:
+            str: Markdown content of the index note
+        """
+        lines = [
+            "# Contacts",
+            "",
+            "| Name | Organization | Email | Phone | UID |",
+            "| --- | --- | --- | --- | --- |",
+        ]
+        for entry in contacts:
+            stem = entry['path'][:-3] if entry['path'].endswith('.md') else entry['path']
+            if entry['fn'] and entry['fn'] != stem:
+                link = f"[[{stem}\\|{self._escape(entry['fn'])}]]"
+            else:
+                link = f"[[{stem}]]"
+            cells = [
+                self._escape(entry['org']),
+                self._escape(', '.join(entry['emails'])),
+                self._escape(', '.join(entry['phones'])),
+                self._escape(entry['uid']),
+            ]
+            lines.append("| " + " | ".join([link] + cells) + " |")
+        return '\n'.join(lines) + '\n'
+
+    def _escape(self, cell):
+        """Escape a value for use in a Markdown table cell."""
+        return cell.replace('|', '\\|').replace('\n', ' ')
@@ -0,0 +1,151 @@
+"""
+Contact Filter module for selecting which vCards are converted.
+"""
+
+import re
+from .contact_record import ContactRecord
+
+
+# Properties whose parsed value is a list, and the separator used in raw text
+LIST_SEPARATORS = {
+    'CATEGORIES': ',',
+    'NICKNAME': ',',
+    'ORG': ';',
+}
+
+# Properties whose parsed value is a structured object rather than text
+STRUCTURED_FIELDS = {'N', 'ADR'}
+
+PREDICATE_PATTERN = re.compile(r'^([A-Za-z][A-Za-z0-9-]*)(=|~)(.*)$', re.DOTALL)
+LINE_NAME_PATTERN = re.compile(r'^(?:[A-Za-z0-9-]+\.)?([A-Za-z0-9-]+)([;:])')
+ESCAPE_PATTERN = re.compile(r'\\(.)')
+
+
+class ContactFilter:
+    """Class responsible for evaluating include and exclude predicates on vCards."""
+
+    def __init__(self, include=(), exclude=()):
+        """
+        Initialize the filter.
+
+        Predicates have the form ``FIELD=VALUE``, which matches when any value
+        of the property equals VALUE ignoring case, or ``FIELD~REGEX``, which
+        matches when the regular expression is found in any value. Values of
+        list properties such as CATEGORIES and ORG are matched item by item.
+
+        A card passes when it matches at least one include predicate (or
+        there are none) and no exclude predicate.
+
+        Args:
+            include (iterable): Predicates a card must match
+            exclude (iterable): Predicates a card must not match
+
+        Raises:
+            ValueError: If a predicate is malformed
+        """
+        self.include = [self._compile(predicate) for predicate in include]
+        self.exclude = [self._compile(predicate) for predicate in exclude]
+        self.fields = {field for field, _ in self.include + self.exclude}
+
+    def __bool__(self):
+        return bool(self.include or self.exclude)
+
+    def matches_raw(self, content):
+        """
+        Evaluate the predicates on unparsed vCard text.
+
+        Only the property lines the predicates refer to are unfolded and
+        unescaped, so a card can be rejected without being parsed. If a
+        referenced property is encoded or structured, the raw text cannot
+        be trusted and the decision is left to matches().
+
+        Args:
+            content (str): Text of a single vCard
+
+        Returns:
+            bool or None: True or False if decided, None if the card has to
+            be parsed first
+        """
+        if not self:
+            return True
+
+        values = {field: [] for field in self.fields}
+        for line in self._unfold(content):
+            if line.upper().startswith('END:VCARD'):
+                break
+            match = LINE_NAME_PATTERN.match(line)
+            if not match:
+                continue
+            field = match.group(1).upper()
+            if field not in values:
+                continue
+            if field in STRUCTURED_FIELDS:
+                return None
+            params, _, value = line[match.end(1):].partition(':')
+            if 'ENCODING=' in params.upper() or 'QUOTED-PRINTABLE' in params.upper():
+                return None
+            separator = LIST_SEPARATORS.get(field)
+            if separator:
+                items = re.split(r'(?<!\\)' + re.escape(separator), value)
+            else:
+                items = [value]
+            values[field].extend(self._unescape(item) for item in items)
+        return self._decide(values)
+
+    def matches(self, vcard):
+        """
+        Evaluate the predicates on a parsed vCard.
+
+        Args:
+            vcard: ContactRecord, or vobject vCard object to extract one from
+
+        Returns:
+            bool: True if the card passes the filter
+        """
+        if not self:
+            return True
+
+        record = ContactRecord.coerce(vcard)
+        values = {field: list(record.values(field)) for field in self.fields}
+        return self._decide(values)
+
+    def _decide(self, values):
+        """Apply include and exclude predicates to field values."""
+        if self.include and not any(test(values[field]) for field, test in self.include):
+            return False
+        return not any(test(values[field]) for field, test in self.exclude)
+
+    def _compile(self, predicate):
+        """Turn a predicate string into a (field, test) pair."""
+        match = PREDICATE_PATTERN.match(predicate.strip())
+        if not match:
+            raise ValueError(f"Invalid filter '{predicate}' (expected FIELD=VALUE or FIELD~REGEX)")
+        field, operator, expected = match.groups()
+        field = field.upper()
+
+        if operator == '~':
+            try:
+                pattern = re.compile(expected, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression in filter '{predicate}': {e}")
+            return field, lambda items: any(pattern.search(item) for item in items)
+
+        expected = expected.strip().casefold()
+        return field, lambda items: any(item.strip().casefold() == expected for item in items)
+
+    def _unfold(self, content):
+        """Yield logical lines of vCard text, joining folded continuation lines."""
+        current = None
+        for line in content.splitlines():
+            if line[:1] in (' ', '\t') and current is not None:
+                current += line[1:]
+                continue
+            if current is not None:
+                yield current
+            current = line
+        if current is not None:
+            yield current
+
+    def _unescape(self, value):
+        """Undo vCard text escaping."""
+        return ESCAPE_PATTERN.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
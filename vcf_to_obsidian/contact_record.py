@@ -0,0 +1,170 @@
+"""
+Contact Record module for a compact, picklable form of a parsed vCard.
+"""
+
+from collections import namedtuple
+
+
+# One EMAIL, TEL or URL: the first TYPE parameter, uppercased, and the value
+TypedValue = namedtuple('TypedValue', ('type', 'value'))
+
+# One ADR with its first TYPE parameter and the structured address fields
+Address = namedtuple('Address', ('type', 'box', 'extended', 'street', 'city', 'region', 'code', 'country'))
+
+# Properties whose values are not kept for filtering
+UNFILTERED_PROPERTIES = frozenset({'photo'})
+
+
+class ContactRecord:
+    """Class holding the properties of one contact that conversion uses."""
+
+    __slots__ = (
+        'version', 'uid', 'fn', 'family', 'given', 'photo', 'emails', 'tels', 'bday',
+        'urls', 'org', 'addresses', 'categories', 'note', 'rev', 'properties',
+    )
+
+    def __init__(self, version=None, uid=None, fn=None, family=None, given=None, photo=None,
+                 emails=(), tels=(), bday=None, urls=(), org=None, addresses=(),
+                 categories=None, note=None, rev=None, properties=None):
+        """
+        Initialize a contact record.
+
+        Single-valued properties hold the value vobject parsed, or None if
+        the card does not have the property. family and given are None
+        only if the card has no N property.
+
+        Args:
+            version: VERSION value
+            uid: UID value
+            fn: FN value
+            family: Family name from N
+            given: Given name from N
+            photo (bytes or str): Decoded PHOTO data, or its URL
+            emails (tuple): TypedValue per EMAIL
+            tels (tuple): TypedValue per TEL
+            bday: BDAY value
+            urls (tuple): TypedValue per URL
+            org: ORG value
+            addresses (tuple): Address per ADR
+            categories: CATEGORIES value
+            note: NOTE value
+            rev: REV value, unparsed
+            properties (dict, optional): Lowercased property name to a tuple
+                of its values as text, for ContactFilter
+        """
+        self.version = version
+        self.uid = uid
+        self.fn = fn
+        self.family = family
+        self.given = given
+        self.photo = photo
+        self.emails = tuple(emails)
+        self.tels = tuple(tels)
+        self.bday = bday
+        self.urls = tuple(urls)
+        self.org = org
+        self.addresses = tuple(addresses)
+        self.categories = categories
+        self.note = note
+        self.rev = rev
+        self.properties = properties or {}
+
+    @classmethod
+    def from_vcard(cls, vcard):
+        """
+        Extract a record from a vobject vCard.
+
+        Args:
+            vcard: vobject vCard object
+
+        Returns:
+            ContactRecord: Record holding no references to the vCard
+        """
+        contents = vcard.contents
+
+        def first(name):
+            lines = contents.get(name)
+            return lines[0].value if lines else None
+
+        name = first('n')
+        properties = {}
+        for key, lines in contents.items():
+            if key in UNFILTERED_PROPERTIES:
+                continue
+            values = []
+            for line in lines:
+                value = line.value
+                if isinstance(value, list):
+                    values.extend(str(item) for item in value)
+                else:
+                    values.append(value if isinstance(value, str) else str(value))
+            properties[key] = tuple(values)
+
+        return cls(
+            version=first('version'),
+            uid=first('uid'),
+            fn=first('fn'),
+            family=(getattr(name, 'family', '') or '') if name else None,
+            given=(getattr(name, 'given', '') or '') if name else None,
+            photo=first('photo'),
+            emails=(TypedValue(cls._type_label(line), line.value) for line in contents.get('email', [])),
+            tels=(TypedValue(cls._type_label(line), line.value) for line in contents.get('tel', [])),
+            bday=first('bday'),
+            urls=(TypedValue(cls._type_label(line), line.value) for line in contents.get('url', [])),
+            org=first('org'),
+            addresses=(
+                Address(
+                    cls._type_label(line),
+                    *(getattr(line.value, field, '') for field in Address._fields[1:]),
+                )
+                for line in contents.get('adr', [])
+            ),
+            categories=first('categories'),
+            note=first('note'),
+            rev=first('rev'),
+            properties=properties,
+        )
+
+    @classmethod
+    def coerce(cls, card):
+        """
+        Get a record for a card that may already be one.
+
+        Args:
+            card: ContactRecord or vobject vCard object
+
+        Returns:
+            ContactRecord: The record
+        """
+        return card if isinstance(card, cls) else cls.from_vcard(card)
+
+    def values(self, name):
+        """
+        Get the values of a property as text.
+
+        Args:
+            name (str): Property name, in any case
+
+        Returns:
+            tuple: One string per value; list values such as CATEGORIES
+            contribute one string per item
+        """
+        return self.properties.get(name.lower(), ())
+
+    def __eq__(self, other):
+        if not isinstance(other, ContactRecord):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        return f"ContactRecord(uid={self.uid!r}, fn={self.fn!r})"
+
+    @staticmethod
+    def _type_label(line):
+        """Get the first TYPE parameter of a property line, uppercased, or DEFAULT."""
+        type_values = line.params.get('TYPE') if hasattr(line, 'params') else None
+        if isinstance(type_values, list) and type_values:
+            return type_values[0].upper()
+        if isinstance(type_values, str):
+            return type_values.upper()
+        return 'DEFAULT'
@@ -0,0 +1,54 @@
+"""
+Conversion Result module for reporting the outcome of converting one VCF file.
+"""
+
+
+class ConversionResult:
+    """Class holding the outcome, notes, timings, and error of one conversion."""
+
+    __slots__ = ('source', 'status', 'notes', 'error', 'parse_seconds', 'write_seconds')
+
+    STATUSES = ("converted", "skipped", "filtered", "unowned", "deleted", "quarantined", "failed")
+
+    def __init__(self, source, status, notes=(), error=None, parse_seconds=0.0, write_seconds=0.0):
+        """
+        Initialize a conversion result.
+
+        Args:
+            source (Path): Path to the VCF file
+            status (str): One of STATUSES
+            notes (tuple): Paths of the notes that were written
+            error (str, optional): Error message if the conversion failed
+            parse_seconds (float): Time spent reading and parsing the file
+            write_seconds (float): Time spent rendering and writing notes
+        """
+        self.source = source
+        self.status = status
+        self.notes = tuple(notes)
+        self.error = error
+        self.parse_seconds = parse_seconds
+        self.write_seconds = write_seconds
+
+    @property
+    def ok(self):
+        """bool: True unless the file failed or is quarantined."""
+        return self.status not in ("failed", "quarantined")
+
+    def to_dict(self):
+        """
+        Get the result as a JSON-serializable dict.
+
+        Returns:
+            dict: source, status, notes, error, and timings
+        """
+        return {
+            'source': str(self.source),
+            'status': self.status,
+            'notes': [str(note) for note in self.notes],
+            'error': self.error,
+            'parse_seconds': self.parse_seconds,
+            'write_seconds': self.write_seconds,
+        }
+
+    def __repr__(self):
+        return f"ConversionResult({str(self.source)!r}, {self.status!r}, notes={len(self.notes)})"
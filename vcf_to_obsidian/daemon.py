@@ -0,0 +1,261 @@
+"""
+Daemon module for serving conversion requests over a Unix domain socket.
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from .conversion_result import ConversionResult
+from .vault_lock import VaultLocked
+
+
+# Operations a client can request
+OPERATIONS = ("convert", "delete", "sync", "ping", "shutdown")
+
+
+class ConversionDaemon:
+    """Class responsible for keeping a converter warm and serving requests on a socket."""
+
+    def __init__(self, converter, output_dir, socket_path, folder_sources=(), file_sources=(),
+                 ignore_files=None, batch_window=0.05):
+        """
+        Initialize the daemon without binding the socket.
+
+        The protocol is one JSON object per line: a client connects, sends
+        a request such as {"op": "convert", "paths": ["a.vcf"]}, and reads
+        one reply line before the connection is closed. Requests that
+        arrive within batch_window of each other are handled in one pass,
+        so the vault lock is taken once for a burst of updates.
+
+        Args:
+            converter (VCFConverter): Converter kept in memory between requests;
+                its source map is switched on so deleted files can be handled
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            socket_path (Path): Unix domain socket to listen on
+            folder_sources (iterable): Folders converted by "sync" requests
+            file_sources (iterable): Files converted by "sync" requests
+            ignore_files (list, optional): Files to ignore, or ignore patterns
+            batch_window (float): Seconds to wait for more requests before
+                starting a pass
+        """
+        self.converter = converter
+        self.converter.source_map = True
+        if self.converter.lock == "coalesce":
+            # A batch is never coalesced: it waits and replies with its own results
+            self.converter.lock = "wait"
+        self.output_dir = output_dir
+        self.socket_path = Path(socket_path)
+        self.folder_sources = [Path(path) for path in folder_sources]
+        self.file_sources = [Path(path) for path in file_sources]
+        self.ignore_files = list(ignore_files) if ignore_files else []
+        self.batch_window = batch_window
+        self.batches = 0
+        self._requests = queue.Queue()
+        self._server = None
+        self._warm = False
+
+    def serve_forever(self):
+        """
+        Serve requests until a "shutdown" request arrives.
+
+        Raises:
+            OSError: If another daemon is already listening on the socket
+        """
+        self._bind()
+        worker = threading.Thread(target=self._work, daemon=True)
+        worker.start()
+        print(f"Listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._requests.put(None)
+            worker.join()
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self):
+        """Stop serving; serve_forever() returns once pending requests are answered."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    @staticmethod
+    def request(socket_path, payload, timeout=None):
+        """
+        Send one request to a running daemon and wait for its reply.
+
+        Args:
+            socket_path (Path): Socket the daemon listens on
+            payload (dict): Request, such as {"op": "delete", "paths": [...]}
+            timeout (float, optional): Seconds to wait for the reply
+
+        Returns:
+            dict: The daemon's reply
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(payload).encode('utf-8') + b"\n")
+            with client.makefile('rb') as reply:
+                return json.loads(reply.readline())
+
+    def _bind(self):
+        """Bind the socket, replacing a socket file left behind by a daemon that died."""
+        if self.socket_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.socket_path.unlink(missing_ok=True)
+            else:
+                raise OSError(f"A daemon is already listening on {self.socket_path}")
+            finally:
+                probe.close()
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                reply = daemon._handle(self.rfile.readline())
+                self.wfile.write(json.dumps(reply).encode('utf-8') + b"\n")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+
+    def _handle(self, line):
+        """
+        Validate a request line and wait for the worker to answer it.
+
+        Args:
+            line (bytes): One JSON request
+
+        Returns:
+            dict: Reply sent back to the client
+        """
+        try:
+            request = json.loads(line)
+            op = request.get('op')
+            paths = request.get('paths', [])
+            if op not in OPERATIONS:
+                raise ValueError(f"op must be one of {', '.join(OPERATIONS)}")
+            if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+                raise ValueError("paths must be a list of strings")
+            if op in ("convert", "delete") and not paths:
+                raise ValueError(f"{op} needs at least one path")
+        except (ValueError, AttributeError) as e:
+            return {'ok': False, 'error': f"Invalid request: {e}"}
+
+        if op == "ping":
+            return {'ok': True, 'pid': os.getpid(), 'batches': self.batches}
+        if op == "shutdown":
+            self.shutdown()
+            return {'ok': True}
+
+        pending = {'op': op, 'paths': [Path(path) for path in paths], 'done': threading.Event()}
+        self._requests.put(pending)
+        pending['done'].wait()
+        return pending['reply']
+
+    def _work(self):
+        """Take batches of requests off the queue until serve_forever() stops."""
+        while True:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.batch_window
+            stopping = False
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    pending = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+
+            try:
+                self._run_batch(batch)
+            except VaultLocked as e:
+                self._reply_all(batch, {'ok': False, 'error': str(e)})
+            except Exception as e:
+                print(f"Error handling batch: {e}")
+                self._reply_all(batch, {'ok': False, 'error': str(e)})
+            if stopping:
+                return
+
+    def _run_batch(self, batch):
+        """
+        Handle a batch of requests in one deletion pass and one conversion pass.
+
+        When a path is named by several requests, the last one decides
+        whether it is converted or deleted.
+
+        Args:
+            batch (list): Pending requests, in arrival order
+        """
+        self.batches += 1
+        self.converter.failures.clear()
+        sync = any(pending['op'] == "sync" for pending in batch)
+        latest = {}
+        for pending in batch:
+            for path in pending['paths']:
+                latest[self._key(path)] = (pending['op'], path)
+        to_delete = [path for op, path in latest.values() if op == "delete"]
+        to_convert = [path for op, path in latest.values() if op == "convert"]
+
+        results = {}
+        missing = [path for path in to_convert if not path.is_file()]
+        for path in missing:
+            results[self._key(path)] = ConversionResult(path, "failed", error="file does not exist")
+        to_convert = [path for path in to_convert if path.is_file()]
+
+        if sync:
+            # Pick up changes other processes made to the vault and its state
+            self.converter.forget_state()
+            self._warm = False
+        if to_delete:
+            for result in self.converter.delete_sources(to_delete, self.output_dir):
+                results[self._key(result.source)] = result
+        synced = []
+        if to_convert or sync:
+            self.converter.preload = not self._warm
+            folder_sources = self.folder_sources if sync else []
+            file_sources = (self.file_sources if sync else []) + to_convert
+            for result in self.converter.iter_convert(
+                folder_sources, file_sources, self.output_dir, self.ignore_files
+            ):
+                results[self._key(result.source)] = result
+                synced.append(result)
+            self._warm = True
+
+        for pending in batch:
+            if pending['op'] == "sync":
+                chosen = synced
+            else:
+                chosen = [results[self._key(path)] for path in pending['paths'] if self._key(path) in results]
+            pending['reply'] = {
+                'ok': all(result.ok for result in chosen),
+                'results': [result.to_dict() for result in chosen],
+            }
+            pending['done'].set()
+
+    def _reply_all(self, batch, reply):
+        for pending in batch:
+            if not pending['done'].is_set():
+                pending['reply'] = reply
+                pending['done'].set()
+
+    def _key(self, path):
+        return os.path.abspath(path)
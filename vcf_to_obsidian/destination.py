@@ -0,0 +1,81 @@
+"""
+Destination module for describing output vaults and their rendering options.
+"""
+
+import re
+from pathlib import Path
+from .markdown_writer import PHOTO_MODES
+from .contact_filter import ContactFilter
+
+
+# Options are comma-separated, but filter predicates may contain commas
+OPTION_SPLIT_PATTERN = re.compile(r',(?=\s*(?:photos|include|exclude)=)')
+
+
+class Destination:
+    """Class responsible for holding one output directory and its per-vault options."""
+
+    SEPARATOR = "::"
+
+    def __init__(self, path, photos="embed", include=(), exclude=()):
+        """
+        Initialize a destination.
+
+        Args:
+            path (Path): Output directory for Markdown files
+            photos (str): How photos are written, one of PHOTO_MODES
+            include (iterable): Filter predicates a card must match to be
+                written to this destination
+            exclude (iterable): Filter predicates that keep a card out of
+                this destination
+
+        Raises:
+            ValueError: If the photo mode or a filter predicate is invalid
+        """
+        if photos not in PHOTO_MODES:
+            raise ValueError(f"photos must be one of {', '.join(PHOTO_MODES)}")
+        self.path = Path(path)
+        self.photos = photos
+        self.filter = ContactFilter(include, exclude)
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Build a destination from a command-line specification.
+
+        The specification is a directory, optionally followed by ``::`` and
+        comma-separated ``key=value`` options, e.g. ``./vault::photos=none``
+        or ``./team::include=CATEGORIES=Work,exclude=ORG~^Acme``. The
+        include and exclude options may be repeated.
+
+        Args:
+            spec (str or Path): Destination specification
+
+        Returns:
+            Destination: The parsed destination
+
+        Raises:
+            ValueError: If an option is unknown or malformed
+        """
+        if isinstance(spec, Destination):
+            return spec
+        path, _, option_text = str(spec).partition(cls.SEPARATOR)
+        if not path:
+            raise ValueError(f"Missing directory in destination '{spec}'")
+
+        options = {'include': [], 'exclude': []}
+        for item in filter(None, OPTION_SPLIT_PATTERN.split(option_text)):
+            key, sep, value = item.partition("=")
+            key = key.strip()
+            if not sep or key not in ("photos", "include", "exclude"):
+                raise ValueError(
+                    f"Unknown destination option '{item}' (expected photos=, include= or exclude=)"
+                )
+            if key == "photos":
+                options[key] = value.strip()
+            else:
+                options[key].append(value)
+        return cls(path, **options)
+
+    def __repr__(self):
+        return f"Destination({str(self.path)!r}, photos={self.photos!r})"
@@ -0,0 +1,149 @@
+"""
+Directory Cache module for answering file checks from one listing per directory.
+"""
+
+import os
+import threading
+
+
+# Marks a file that was written during the run and has not been stat'ed since
+_CHANGED = object()
+
+
+class DirectoryCache:
+    """Class responsible for listing each directory once and answering existence and stat checks from it."""
+
+    def __init__(self, counter=None):
+        """
+        Initialize an empty cache.
+
+        A directory is listed with os.scandir the first time a path in it is
+        checked. Existence checks are then answered from the listing, and a
+        file is stat'ed at most once; on network filesystems the stat is
+        usually served from the attributes the listing brought along.
+
+        Args:
+            counter (SyscallCounter, optional): Counts the stat calls made
+        """
+        self.counter = counter
+        self.listings = 0
+        self._directories = {}
+        self._lock = threading.Lock()
+
+    def store(self, directory, entries):
+        """
+        Use entries listed elsewhere as the listing of a directory.
+
+        Args:
+            directory (str or Path): Directory that was listed
+            entries (iterable): os.DirEntry objects from os.scandir
+        """
+        with self._lock:
+            self._directories[os.fspath(directory)] = {entry.name: entry for entry in entries}
+            self.listings += 1
+
+    def names(self, directory):
+        """
+        Get the names of the entries of a directory.
+
+        Args:
+            directory (str or Path): Directory to list
+
+        Returns:
+            list: Entry names, in listing order
+        """
+        return list(self._listing(os.fspath(directory)))
+
+    def exists(self, path):
+        """
+        Check whether a file or directory exists, as of its directory's listing.
+
+        Args:
+            path (str or Path): Path to check
+
+        Returns:
+            bool: True if the path is in the listing
+        """
+        directory, name = os.path.split(os.fspath(path))
+        return name in self._listing(directory)
+
+    def stat(self, path):
+        """
+        Stat a file, at most once per run.
+
+        Args:
+            path (str or Path): Path of the file
+
+        Returns:
+            os.stat_result: Status of the file, following symlinks
+
+        Raises:
+            FileNotFoundError: If the path is not in its directory's listing
+        """
+        path = os.fspath(path)
+        directory, name = os.path.split(path)
+        listing = self._listing(directory)
+        with self._lock:
+            entry = listing.get(name)
+        if entry is None:
+            raise FileNotFoundError(2, "No such file or directory", path)
+        if isinstance(entry, os.stat_result):
+            return entry
+        if self.counter is not None:
+            self.counter.add('stat')
+        result = os.stat(path) if entry is _CHANGED else entry.stat()
+        with self._lock:
+            listing[name] = result
+        return result
+
+    def update(self, path, status):
+        """
+        Record the status of a file that was stat'ed through an open file.
+
+        Args:
+            path (str or Path): Path of the file
+            status (os.stat_result): Its status, e.g. from os.fstat
+        """
+        directory, name = os.path.split(os.fspath(path))
+        listing = self._listing(directory)
+        with self._lock:
+            listing[name] = status
+
+    def changed(self, path):
+        """
+        Record that a file was written, so its next stat is fresh.
+
+        Args:
+            path (str or Path): Path of the file
+        """
+        directory, name = os.path.split(os.fspath(path))
+        listing = self._listing(directory)
+        with self._lock:
+            listing[name] = _CHANGED
+
+    def removed(self, path):
+        """
+        Record that a file was removed.
+
+        Args:
+            path (str or Path): Path of the file
+        """
+        directory, name = os.path.split(os.fspath(path))
+        listing = self._listing(directory)
+        with self._lock:
+            listing.pop(name, None)
+
+    def _listing(self, directory):
+        """Get the entries of a directory by name, listing it on first use."""
+        with self._lock:
+            listing = self._directories.get(directory)
+        if listing is not None:
+            return listing
+        try:
+            with os.scandir(directory or ".") as entries:
+                listing = {entry.name: entry for entry in entries}
+        except OSError:
+            listing = {}
+        with self._lock:
+            self.listings += 1
+            return self._directories.setdefault(directory, listing)
@@ -0,0 +1,283 @@
+"""
+Duplicate Finder module for suggesting contacts that describe the same person.
+"""
+
+import difflib
+import functools
+import re
+import unicodedata
+from .contact_record import ContactRecord
+
+
+# Properties a card is reduced to before it is parsed for duplicate detection
+DEDUPE_FIELDS = ('EMAIL', 'TEL')
+
+# Suggest a merge when two contacts score at least this much
+DEFAULT_THRESHOLD = 0.8
+
+# Blocks with more members than this are too unspecific to compare pairwise
+DEFAULT_MAX_BLOCK_SIZE = 100
+
+# How much a shared email, a shared phone, and an identical name each count;
+# an identical name of two or more tokens alone reaches DEFAULT_THRESHOLD
+EMAIL_WEIGHT = 0.9
+PHONE_WEIGHT = 0.7
+NAME_WEIGHT = 0.8
+
+# How much an identical one-token name, such as a first name only, counts
+SHORT_NAME_WEIGHT = 0.5
+
+# Name tokens less similar than this do not count as the same token
+TOKEN_SIMILARITY = 0.8
+
+
+@functools.lru_cache(maxsize=65536)
+def _token_similarity(first, second):
+    matcher = difflib.SequenceMatcher(None, first, second)
+    if matcher.real_quick_ratio() < TOKEN_SIMILARITY or matcher.quick_ratio() < TOKEN_SIMILARITY:
+        return 0.0
+    return matcher.ratio()
+
+
+class DuplicateFinder:
+    """Class responsible for finding likely duplicate contacts with blocking indexes."""
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, max_block_size=DEFAULT_MAX_BLOCK_SIZE):
+        """
+        Initialize an empty finder.
+
+        Contacts are compared only with contacts that share a block: the
+        same normalized email, the same phone digits, a name token, or the
+        same full name. A block larger than max_block_size, such as
+        everyone named "John", is skipped and listed in skipped_keys, so
+        the number of comparisons grows linearly with the number of
+        contacts; two "John Smith" cards still meet in their full-name
+        block.
+
+        Args:
+            threshold (float): Minimum score, from 0 to 1, for suggesting a merge
+            max_block_size (int): Largest block that is compared pairwise
+
+        Raises:
+            ValueError: If the threshold is not between 0 and 1
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be greater than 0 and at most 1")
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+        self.contacts = []
+        self.blocks = {}
+        self.comparisons = 0
+        self.skipped_blocks = 0
+        self.skipped_keys = []
+
+    def add(self, vcard, source, note=None):
+        """
+        Add a parsed card and index it under its blocking keys.
+
+        Args:
+            vcard: ContactRecord, or vobject vCard object to extract one from
+            source (Path): VCF file the card came from
+            note (str, optional): Name of the note the card is written to
+        """
+        record = ContactRecord.coerce(vcard)
+        fn = record.fn or ''
+        if not fn and record.family is not None:
+            fn = f"{record.given} {record.family}".strip()
+        contact = {
+            'uid': record.uid or '',
+            'fn': fn,
+            'source': str(source),
+            'note': note,
+            'emails': {
+                email for email in (self.normalize_email(e.value) for e in record.emails)
+                if email
+            },
+            'phones': {
+                phone for phone in (self.normalize_phone(t.value) for t in record.tels)
+                if phone
+            },
+            'tokens': self.name_tokens(fn),
+        }
+        position = len(self.contacts)
+        self.contacts.append(contact)
+        keys = {f"email:{email}" for email in contact['emails']}
+        keys.update(f"phone:{phone}" for phone in contact['phones'])
+        keys.update(f"name:{token}" for token in contact['tokens'] if len(token) >= 3)
+        if len(contact['tokens']) > 1:
+            keys.add(f"fullname:{' '.join(sorted(contact['tokens']))}")
+        for key in keys:
+            self.blocks.setdefault(key, []).append(position)
+
+    def find(self):
+        """
+        Compare the contacts within each block and group likely duplicates.
+
+        Returns:
+            list: One dict per group with score (the best pair score),
+            reasons, and contacts (uid, fn, source, and note of each),
+            best groups first
+        """
+        self.comparisons = 0
+        self.skipped_blocks = 0
+        self.skipped_keys = []
+        seen = set()
+        parent = list(range(len(self.contacts)))
+        scores = {}
+        reasons = {}
+
+        def root(position):
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        for key, members in self.blocks.items():
+            if len(members) < 2:
+                continue
+            if len(members) > self.max_block_size:
+                self.skipped_blocks += 1
+                self.skipped_keys.append(key)
+                continue
+            for offset, first in enumerate(members):
+                for second in members[offset + 1:]:
+                    pair = (first, second)
+                    if pair in seen:
+                        continue
+                    seen.add(pair)
+                    self.comparisons += 1
+                    score, why = self.score(self.contacts[first], self.contacts[second])
+                    if score >= self.threshold:
+                        parent[root(second)] = root(first)
+                        scores[pair] = score
+                        reasons[pair] = why
+
+        groups = {}
+        for position in range(len(self.contacts)):
+            groups.setdefault(root(position), []).append(position)
+        pairs_by_group = {}
+        for pair in scores:
+            pairs_by_group.setdefault(root(pair[0]), []).append(pair)
+        result = []
+        for group, members in groups.items():
+            if len(members) < 2:
+                continue
+            pairs = pairs_by_group[group]
+            result.append({
+                'score': round(max(scores[pair] for pair in pairs), 3),
+                'reasons': sorted({reason for pair in pairs for reason in reasons[pair]}),
+                'contacts': [
+                    {key: self.contacts[position][key] for key in ('uid', 'fn', 'source', 'note')}
+                    for position in members
+                ],
+            })
+        result.sort(key=lambda group: (-group['score'], group['contacts'][0]['fn']))
+        return result
+
+    def score(self, first, second):
+        """
+        Score how likely two contacts are to describe the same person.
+
+        Each kind of evidence independently raises the score towards 1.
+
+        Args:
+            first (dict): Contact added by add()
+            second (dict): Contact added by add()
+
+        Returns:
+            tuple: (score from 0 to 1, list of reasons)
+        """
+        why = []
+        doubt = 1.0
+        shared_emails = first['emails'] & second['emails']
+        if shared_emails:
+            doubt *= 1 - EMAIL_WEIGHT
+            why.append(f"same email {min(shared_emails)}")
+        if first['phones'] & second['phones']:
+            doubt *= 1 - PHONE_WEIGHT
+            why.append("same phone")
+        if 1 - doubt * (1 - NAME_WEIGHT) < self.threshold:
+            # Even identical names could not reach the threshold
+            return 1 - doubt, why
+        similarity = self.name_similarity(first['tokens'], second['tokens'])
+        if similarity:
+            weight = NAME_WEIGHT if min(len(first['tokens']), len(second['tokens'])) > 1 else SHORT_NAME_WEIGHT
+            doubt *= 1 - weight * similarity
+            why.append("same name" if similarity == 1 else "similar name")
+        return 1 - doubt, why
+
+    @staticmethod
+    def name_similarity(first, second):
+        """
+        Compare two sets of name tokens, tolerating typos.
+
+        Args:
+            first (frozenset): Tokens of one name
+            second (frozenset): Tokens of the other name
+
+        Returns:
+            float: 1 for the same tokens, 0 for no similar tokens
+        """
+        if not first or not second:
+            return 0.0
+        shorter, longer = sorted((first, second), key=len)
+        total = 0.0
+        for token in shorter:
+            if token in longer:
+                total += 1
+                continue
+            best = max(_token_similarity(token, other) for other in longer)
+            if best >= TOKEN_SIMILARITY:
+                total += best
+        return total / len(longer)
+
+    @staticmethod
+    def normalize_email(value):
+        """
+        Normalize an email address for comparison.
+
+        Args:
+            value (str): Email address as written in the card
+
+        Returns:
+            str: Lowercased address without a mailto: prefix or +tag, or ''
+        """
+        email = str(value).strip().lower()
+        if email.startswith('mailto:'):
+            email = email[len('mailto:'):]
+        local, at, domain = email.partition('@')
+        if not at or not local or not domain:
+            return ''
+        return f"{local.split('+', 1)[0]}@{domain}"
+
+    @staticmethod
+    def normalize_phone(value):
+        """
+        Normalize a phone number for comparison.
+
+        Only the last ten digits are kept, so a number with and without its
+        country code compares equal.
+
+        Args:
+            value (str): Phone number as written in the card
+
+        Returns:
+            str: Digits of the number, or '' if it is too short to be one
+        """
+        digits = re.sub(r'\D', '', str(value))
+        return digits[-10:] if len(digits) >= 7 else ''
+
+    @staticmethod
+    def name_tokens(name):
+        """
+        Split a name into comparable tokens.
+
+        Args:
+            name (str): Formatted name
+
+        Returns:
+            frozenset: Casefolded tokens with accents removed
+        """
+        decomposed = unicodedata.normalize('NFKD', name)
+        plain = ''.join(char for char in decomposed if not unicodedata.combining(char))
+        return frozenset(token for token in re.findall(r'\w+', plain.casefold()) if len(token) >= 2)
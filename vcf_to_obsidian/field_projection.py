@@ -0,0 +1,98 @@
+"""
+Field Projection module for dropping unused vCard properties before parsing.
+"""
+
+import re
+
+
+# Properties needed for structure, filenames, and REV; never projected away
+ALWAYS_KEPT = frozenset({'BEGIN', 'END', 'VERSION', 'FN', 'N', 'UID', 'REV'})
+
+# One property line (optionally group-prefixed) with its folded continuation lines
+PROPERTY_PATTERN = r'^(?:[A-Za-z0-9-]+\.)?([A-Za-z0-9-]+)[;:][^\n]*\n?(?:[ \t][^\n]*\n?)*'
+
+
+class FieldProjection:
+    """Class responsible for removing unwanted properties from raw vCard text."""
+
+    TEXT_PATTERN = re.compile(PROPERTY_PATTERN, re.MULTILINE)
+    BYTES_PATTERN = re.compile(PROPERTY_PATTERN.encode('ascii'), re.MULTILINE)
+
+    def __init__(self, fields=None, exclude=()):
+        """
+        Initialize the projection.
+
+        Args:
+            fields (iterable, optional): Property names to keep; None keeps
+                every property. BEGIN, END, VERSION, FN, N, UID and REV are
+                always kept.
+            exclude (iterable): Property names to drop even if listed in fields
+        """
+        self.fields = None if fields is None else frozenset(f.strip().upper() for f in fields) | ALWAYS_KEPT
+        self.exclude = frozenset(f.strip().upper() for f in exclude) - ALWAYS_KEPT
+
+    def __bool__(self):
+        return self.fields is not None or bool(self.exclude)
+
+    def keeps(self, name):
+        """
+        Check whether a property survives the projection.
+
+        Args:
+            name (str): Property name
+
+        Returns:
+            bool: True if the property is kept
+        """
+        name = name.upper()
+        if name in self.exclude:
+            return False
+        return self.fields is None or name in self.fields
+
+    def keeping(self, names):
+        """
+        Get a projection that also keeps the given properties.
+
+        Args:
+            names (iterable): Property names that must be kept, e.g. the
+                fields referenced by filters
+
+        Returns:
+            FieldProjection: This projection if it already keeps them,
+            otherwise a widened copy
+        """
+        names = frozenset(name.upper() for name in names)
+        if self.fields is None or names <= self.fields:
+            return self
+        return FieldProjection(self.fields | names, self.exclude)
+
+    def apply(self, content):
+        """
+        Remove dropped properties from vCard text.
+
+        Dropped properties, including all their folded continuation lines,
+        are cut out by offset so their values are never copied or decoded.
+
+        Args:
+            content (str or bytes): Raw vCard text
+
+        Returns:
+            str or bytes: Text with only the kept properties, of the same type
+        """
+        if not self:
+            return content
+        is_bytes = isinstance(content, bytes)
+        pattern = self.BYTES_PATTERN if is_bytes else self.TEXT_PATTERN
+
+        pieces = []
+        last = 0
+        for match in pattern.finditer(content):
+            name = match.group(1)
+            if self.keeps(name.decode('ascii') if is_bytes else name):
+                continue
+            pieces.append(content[last:match.start()])
+            last = match.end()
+        if not pieces:
+            return content
+        pieces.append(content[last:])
+        return content[:0].join(pieces)
@@ -4,10 +4,11 @@ Filename Generator module for creating output filenames from VCF data.
 
 import re
 from pathlib import Path
+from .contact_record import ContactRecord
 
 
 class FilenameGenerator:
-    """Class responsible for generating output filenames from vCard objects."""
+    """Class responsible for generating output filenames from contact records."""
     
     def __init__(self):
         """Initialize the filename generator."""
@@ -24,27 +25,25 @@ class FilenameGenerator:
         4. Original VCF filename
         
         Args:
-            vcard: vobject vCard object
+            vcard: ContactRecord, or vobject vCard object to extract one from
             vcf_path (Path): Original VCF file path
             
         Returns:
             str: Safe filename (without extension)
         """
+        record = ContactRecord.coerce(vcard)
         contact_name = ''
         
         # Priority 1: Use FN (Full Name) if available
-        if hasattr(vcard, 'fn') and vcard.fn.value:
-            contact_name = vcard.fn.value
+        if record.fn:
+            contact_name = record.fn
         # Priority 2: Construct name from N fields (Given + Family)
-        elif hasattr(vcard, 'n') and vcard.n.value:
-            n = vcard.n.value
-            given_name = getattr(n, 'given', '') or ''
-            family_name = getattr(n, 'family', '') or ''
-            if given_name or family_name:
-                contact_name = f"{given_name} {family_name}".strip()
+        elif record.family is not None:
+            if record.given or record.family:
+                contact_name = f"{record.given} {record.family}".strip()
         # Priority 3: Use UID if no name is available
-        elif hasattr(vcard, 'uid') and vcard.uid.value:
-            contact_name = vcard.uid.value
+        elif record.uid:
+            contact_name = record.uid
         # Priority 4: Use VCF filename as final fallback
         else:
             contact_name = Path(vcf_path).stem
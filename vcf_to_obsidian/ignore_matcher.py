@@ -0,0 +1,255 @@
+"""
+Ignore Matcher module for skipping VCF files and directories by pattern.
+"""
+
+import os
+import re
+from pathlib import Path
+
+
+IGNORE_FILE_NAME = ".vcfignore"
+REGEX_PREFIX = "re:"
+VCF_SUFFIXES = (".vcf", ".VCF")
+# Characters that make an ignore pattern a glob rather than a literal path
+GLOB_CHARACTERS = "*?["
+
+
+class IgnoreMatcher:
+    """Class responsible for matching relative paths against compiled ignore rules."""
+
+    def __init__(self, patterns=()):
+        """
+        Initialize the matcher.
+
+        Patterns are matched against paths relative to the source directory,
+        using forward slashes:
+
+        - ``re:REGEX`` matches when the regular expression is found in the path
+        - a glob without a slash, such as ``*.bak.vcf``, matches the name at
+          any depth
+        - a glob with a slash, such as ``archive/*.vcf``, matches the whole
+          relative path
+        - a trailing slash, such as ``old/``, matches directories only
+
+        In globs ``*`` and ``?`` never match ``/``, so ``archive/*.vcf`` does
+        not match files in subfolders of ``archive``; ``**`` matches across
+        folders, as in ``archive/**/*.vcf``.
+
+        All globs are compiled into one regular expression and all regular
+        expressions into another, so a path is tested with at most two
+        regex calls regardless of the number of rules.
+
+        Args:
+            patterns (iterable): Ignore patterns
+
+        Raises:
+            ValueError: If a regular expression is invalid
+        """
+        self.patterns = []
+        self.matched = set()  # literal patterns that ignored at least one path
+        self._literals = {}
+        self._file_regex = None
+        self._dir_regex = None
+        self._search_regex = None
+        self.add(patterns)
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def add(self, patterns):
+        """
+        Add patterns and recompile the matcher.
+
+        Args:
+            patterns (iterable): Ignore patterns
+        """
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if pattern and not pattern.startswith('#'):
+                self.patterns.append(pattern)
+        self._compile()
+
+    def with_file(self, ignore_file):
+        """
+        Get a matcher that also applies the rules of an ignore file.
+
+        The file lists one pattern per line; blank lines and lines starting
+        with ``#`` are ignored.
+
+        Args:
+            ignore_file (Path): Path to a .vcfignore file
+
+        Returns:
+            IgnoreMatcher: This matcher if the file does not exist, otherwise
+            a new matcher with the combined rules
+        """
+        try:
+            with open(ignore_file, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return self
+        matcher = IgnoreMatcher(self.patterns)
+        matcher.matched = self.matched
+        matcher.add(lines)
+        return matcher
+
+    def unmatched(self):
+        """
+        List the literal patterns that have not ignored any path yet.
+
+        Literal patterns contain no glob characters and no ``re:`` prefix,
+        such as a mistyped file path; they are only tracked in the matcher
+        they were added to and the matchers derived from it by with_file.
+
+        Returns:
+            list: Literal patterns in the order they were added
+        """
+        return [pattern for pattern in self._literals if pattern not in self.matched]
+
+    def matches(self, relative_path, is_dir=False):
+        """
+        Check whether a relative path is ignored.
+
+        Args:
+            relative_path (str): Path relative to the source directory, with
+                forward slashes
+            is_dir (bool): Whether the path is a directory
+
+        Returns:
+            bool: True if the path is ignored
+        """
+        glob_regex = self._dir_regex if is_dir else self._file_regex
+        if glob_regex is not None and glob_regex.match(relative_path):
+            self._record(relative_path, is_dir)
+            return True
+        return self._search_regex is not None and self._search_regex.search(relative_path) is not None
+
+    def _record(self, relative_path, is_dir):
+        """Note which literal patterns ignored a path; only runs for ignored paths."""
+        for pattern, (regex, dir_only) in self._literals.items():
+            if pattern not in self.matched and (is_dir or not dir_only) and regex.match(relative_path):
+                self.matched.add(pattern)
+
+    def walk(self, root, recursive=False, directory_cache=None):
+        """
+        List the VCF files under a directory that are not ignored.
+
+        The directory is traversed with os.scandir. Ignored files are
+        rejected by name without a stat call, and ignored directories are
+        never opened. Symlinked directories are not followed, so a link
+        cycle cannot make the walk loop.
+
+        Args:
+            root (Path): Source directory
+            recursive (bool): Descend into subdirectories
+            directory_cache (DirectoryCache, optional): Receives each
+                listing, so later checks of the files need no calls
+
+        Yields:
+            tuple: (path, relative_path) for each VCF file
+        """
+        pending = [(str(root), "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as scan:
+                    entries = scan
+                    if directory_cache is not None:
+                        entries = list(scan)
+                        directory_cache.store(directory, entries)
+                    for entry in entries:
+                        relative = prefix + entry.name
+                        if entry.name.endswith(VCF_SUFFIXES):
+                            if not self.matches(relative) and entry.is_file():
+                                yield Path(entry.path), relative
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            if not self.matches(relative, is_dir=True):
+                                pending.append((entry.path, relative + "/"))
+            except OSError:
+                continue
+
+    def _compile(self):
+        """Combine the patterns into the glob and regex matchers."""
+        file_globs = []
+        dir_globs = []
+        searches = []
+        self._literals = {}
+        for pattern in self.patterns:
+            if pattern.startswith(REGEX_PREFIX):
+                expression = pattern[len(REGEX_PREFIX):]
+                try:
+                    re.compile(expression)
+                except re.error as e:
+                    raise ValueError(f"Invalid ignore pattern '{pattern}': {e}")
+                searches.append(f"(?:{expression})")
+                continue
+
+            dir_only = pattern.endswith('/')
+            glob = pattern.rstrip('/')
+            if '/' in glob:
+                expression = _translate(glob.lstrip('/'))
+            else:
+                expression = r'(?:.*/)?' + _translate(glob)
+            if not any(char in glob for char in GLOB_CHARACTERS):
+                self._literals[pattern] = (re.compile(expression), dir_only)
+            dir_globs.append(expression)
+            if not dir_only:
+                file_globs.append(expression)
+
+        self._file_regex = re.compile('|'.join(file_globs)) if file_globs else None
+        self._dir_regex = re.compile('|'.join(dir_globs)) if dir_globs else None
+        self._search_regex = re.compile('|'.join(searches)) if searches else None
+
+
+def _translate(glob):
+    """
+    Translate a glob into a regular expression, matching one path segment per ``*``.
+
+    Unlike fnmatch.translate, ``*``, ``?`` and ``[...]`` never match ``/``;
+    ``**`` matches across folders, and ``**/`` also matches no folder at all.
+
+    Args:
+        glob (str): Glob using forward slashes
+
+    Returns:
+        str: Regular expression that matches the whole path
+    """
+    parts = []
+    i, n = 0, len(glob)
+    while i < n:
+        char = glob[i]
+        i += 1
+        if char == '*':
+            if i < n and glob[i] == '*':
+                while i < n and glob[i] == '*':
+                    i += 1
+                if i < n and glob[i] == '/':
+                    i += 1
+                    parts.append('(?:.*/)?')
+                else:
+                    parts.append('.*')
+            else:
+                parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            j = i
+            if j < n and glob[j] == '!':
+                j += 1
+            if j < n and glob[j] == ']':
+                j += 1
+            while j < n and glob[j] != ']':
+                j += 1
+            if j >= n:
+                parts.append(r'\[')
+                continue
+            members = glob[i:j].replace('\\', r'\\')
+            i = j + 1
+            if members.startswith('!'):
+                members = '^' + members[1:]
+            elif members.startswith('^'):
+                members = '\\' + members
+            parts.append(f'(?!/)[{members}]')
+        else:
+            parts.append(re.escape(char))
+    return rf"(?s:{''.join(parts)})\Z"
@@ -3,169 +3,145 @@ Markdown Writer module for generating Markdown content from VCF data.
 """
 
 import base64
+import re
 from datetime import datetime, timezone
+from .contact_record import ContactRecord
+
+
+# How PHOTO is written: inline data and URLs, URLs only, or not at all
+PHOTO_MODES = ("embed", "link", "none")
+
+# Version of the generated note format. Bump it whenever a change to
+# generate_obsidian_markdown() changes the output for an unchanged card, so
+# existing notes are re-rendered once instead of skipped as up to date.
+RENDERER_VERSION = 1
+
+# YAML comment in the frontmatter recording RENDERER_VERSION; notes without it
+# predate versioning and count as version 0
+RENDERER_MARKER = "# vcf-to-obsidian renderer: "
+RENDERER_PATTERN = re.compile(r'^# vcf-to-obsidian renderer: (\d+)\s*$', re.MULTILINE)
 
 
 class MarkdownWriter:
-    """Class responsible for generating Markdown content from vCard objects."""
+    """Class responsible for generating Markdown content from contact records."""
     
     def __init__(self):
         """Initialize the Markdown writer."""
         pass
     
-    def generate_obsidian_markdown(self, vcard):
+    def generate_obsidian_markdown(self, vcard, rev=None, photos="embed"):
         """
         Generate Markdown content compatible with obsidian-vcf-contacts plugin.
-        Works directly with vobject instead of intermediate representation.
         
         Args:
-            vcard: vobject vCard object
+            vcard: ContactRecord, or vobject vCard object to extract one from
+            rev (datetime, optional): Timestamp written as REV; defaults to
+                the current time
+            photos (str): One of PHOTO_MODES; "link" drops inline image
+                data and "none" omits PHOTO entirely
             
         Returns:
             str: Markdown content with frontmatter
         """
-        # Build the markdown content directly from vobject
+        record = ContactRecord.coerce(vcard)
         lines = ["---"]
         
         # Extract structured name
-        if hasattr(vcard, 'n') and vcard.n.value:
-            n = vcard.n.value
-            if hasattr(n, 'family') and n.family:
-                lines.append(f"N.FN: {n.family}")
-            if hasattr(n, 'given') and n.given:
-                lines.append(f"N.GN: {n.given}")
+        if record.family:
+            lines.append(f"N.FN: {record.family}")
+        if record.given:
+            lines.append(f"N.GN: {record.given}")
         
         # Extract Full Name
-        if hasattr(vcard, 'fn') and vcard.fn.value:
-            lines.append(f"FN: {vcard.fn.value}")
+        if record.fn:
+            lines.append(f"FN: {record.fn}")
         
         # Extract photo
-        if hasattr(vcard, 'photo') and vcard.photo.value:
-            # if vcard.photo.value data type is bytes
-            if isinstance(vcard.photo.value, bytes):
+        if photos != "none" and record.photo:
+            # if the photo data type is bytes
+            if isinstance(record.photo, bytes) and photos == "embed":
                 # convert bytes to base64
-                photo_data = base64.b64encode(vcard.photo.value).decode('utf-8')
+                photo_data = base64.b64encode(record.photo).decode('utf-8')
                 lines.append(f"PHOTO: data:image/jpeg;base64,{photo_data}")
 
-            elif isinstance(vcard.photo.value, str):
+            elif isinstance(record.photo, str):
                 # write if PHOTO is a URL
-                if vcard.photo.value.startswith("http"):
-                    lines.append(f"PHOTO: {vcard.photo.value}")
+                if record.photo.startswith("http"):
+                    lines.append(f"PHOTO: {record.photo}")
 
         # Extract email addresses with type information
-        if hasattr(vcard, 'email_list'):
-            for email in vcard.email_list:
-                type_label = 'DEFAULT'
-                if hasattr(email, 'params') and 'TYPE' in email.params:
-                    type_values = email.params['TYPE']
-                    if isinstance(type_values, list) and type_values:
-                        type_label = type_values[0].upper()
-                    elif isinstance(type_values, str):
-                        type_label = type_values.upper()
-                
-                field_key = f"EMAIL[{type_label}]"
-                lines.append(f'"{field_key}": {email.value}')
+        for email in record.emails:
+            lines.append(f'"EMAIL[{email.type}]": {email.value}')
         
         # Extract phone numbers with type information
-        if hasattr(vcard, 'tel_list'):
-            for tel in vcard.tel_list:
-                type_label = 'DEFAULT'
-                if hasattr(tel, 'params') and 'TYPE' in tel.params:
-                    type_values = tel.params['TYPE']
-                    if isinstance(type_values, list) and type_values:
-                        type_label = type_values[0].upper()
-                    elif isinstance(type_values, str):
-                        type_label = type_values.upper()
-                
-                field_key = f"TEL[{type_label}]"
-                lines.append(f'"{field_key}": "{tel.value}"')
+        for tel in record.tels:
+            lines.append(f'"TEL[{tel.type}]": "{tel.value}"')
         
         # Extract birthday
-        if hasattr(vcard, 'bday') and vcard.bday.value:
-            lines.append(f"BDAY: {vcard.bday.value}")
-        
-        # Extract URLs with type information
-        if hasattr(vcard, 'url') and vcard.url.value:
-            type_label = 'DEFAULT'
-            if hasattr(vcard.url, 'params') and 'TYPE' in vcard.url.params:
-                type_values = vcard.url.params['TYPE']
-                if isinstance(type_values, list) and type_values:
-                    type_label = type_values[0].upper()
-                elif isinstance(type_values, str):
-                    type_label = type_values.upper()
-            
-            field_key = f"URL[{type_label}]"
-            lines.append(f'"{field_key}": {vcard.url.value}')
+        if record.bday:
+            lines.append(f"BDAY: {record.bday}")
+        
+        # Extract the first URL with type information
+        if record.urls and record.urls[0].value:
+            url = record.urls[0]
+            lines.append(f'"URL[{url.type}]": {url.value}')
         
         # Extract organization
-        if hasattr(vcard, 'org') and vcard.org.value:
-            org_value = vcard.org.value
-            if isinstance(org_value, list) and org_value:
-                lines.append(f"ORG: {org_value[0]}")
-            elif isinstance(org_value, str):
-                lines.append(f"ORG: {org_value}")
+        if record.org:
+            if isinstance(record.org, list):
+                lines.append(f"ORG: {record.org[0]}")
+            elif isinstance(record.org, str):
+                lines.append(f"ORG: {record.org}")
         
         # Extract addresses with type information
-        if hasattr(vcard, 'adr_list'):
-            for adr in vcard.adr_list:
-                adr_value = adr.value
-                type_label = 'DEFAULT'
-                if hasattr(adr, 'params') and 'TYPE' in adr.params:
-                    type_values = adr.params['TYPE']
-                    if isinstance(type_values, list) and type_values:
-                        type_label = type_values[0].upper()
-                    elif isinstance(type_values, str):
-                        type_label = type_values.upper()
-                
-                base_key = f"ADR[{type_label}]"
-                
-                if hasattr(adr_value, 'box') and adr_value.box:
-                    lines.append(f'"{base_key}.POBOX": {adr_value.box}')
-                if hasattr(adr_value, 'extended') and adr_value.extended:
-                    lines.append(f'"{base_key}.EXTENDED": {adr_value.extended}')
-                if hasattr(adr_value, 'street') and adr_value.street:
-                    lines.append(f'"{base_key}.STREET": {adr_value.street}')
-                if hasattr(adr_value, 'city') and adr_value.city:
-                    lines.append(f'"{base_key}.LOCALITY": {adr_value.city}')
-                if hasattr(adr_value, 'region') and adr_value.region:
-                    lines.append(f'"{base_key}.REGION": {adr_value.region}')
-                if hasattr(adr_value, 'code') and adr_value.code:
-                    lines.append(f'"{base_key}.POSTAL": "{adr_value.code}"')
-                if hasattr(adr_value, 'country') and adr_value.country:
-                    lines.append(f'"{base_key}.COUNTRY": {adr_value.country}')
+        for adr in record.addresses:
+            base_key = f"ADR[{adr.type}]"
+            
+            if adr.box:
+                lines.append(f'"{base_key}.POBOX": {adr.box}')
+            if adr.extended:
+                lines.append(f'"{base_key}.EXTENDED": {adr.extended}')
+            if adr.street:
+                lines.append(f'"{base_key}.STREET": {adr.street}')
+            if adr.city:
+                lines.append(f'"{base_key}.LOCALITY": {adr.city}')
+            if adr.region:
+                lines.append(f'"{base_key}.REGION": {adr.region}')
+            if adr.code:
+                lines.append(f'"{base_key}.POSTAL": "{adr.code}"')
+            if adr.country:
+                lines.append(f'"{base_key}.COUNTRY": {adr.country}')
         
         # Extract categories
-        if hasattr(vcard, 'categories') and vcard.categories.value:
-            lines.append(f"CATEGORIES: {vcard.categories.value}")
+        if record.categories:
+            lines.append(f"CATEGORIES: {record.categories}")
         
         # Extract UID
-        if hasattr(vcard, 'uid') and vcard.uid.value:
-            lines.append(f"UID: {vcard.uid.value}")
+        if record.uid:
+            lines.append(f"UID: {record.uid}")
         
         # Extract version
-        if hasattr(vcard, 'version') and vcard.version.value:
-            lines.append(f'VERSION: "{vcard.version.value}"')
+        if record.version:
+            lines.append(f'VERSION: "{record.version}"')
         
-        # Add REV timestamp - always current time when markdown is created/updated
-        current_time = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        lines.append(f"REV: {current_time}")
+        # Add REV timestamp - current time unless the caller derived one from the source
+        if rev is None:
+            rev = datetime.now(timezone.utc)
+        lines.append(f"REV: {rev.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}")
+        lines.append(f"{RENDERER_MARKER}{RENDERER_VERSION}")
         
         lines.append("")
         lines.append("---")
         
         # Add notes section if available
-        notes_added = False
-        if hasattr(vcard, 'note') and vcard.note.value:
-            notes_added = True
-        if hasattr(vcard, 'categories') and vcard.categories.value:
-            notes_added = True
+        notes_added = bool(record.note or record.categories)
         
         if notes_added:
             lines.append("#### Notes")
             lines.append("")
             
-            if hasattr(vcard, 'categories') and vcard.categories.value:
-                category_list = vcard.categories.value.split(',')
+            if record.categories:
+                category_list = record.categories.split(',')
                 contact_line = "#Contact"
                 for category in category_list:
                     contact_line += f" #{category.strip()}"
@@ -173,4 +149,4 @@ class MarkdownWriter:
             else:
                 lines.append("#Contact")
         
-        return '\n'.join(lines) + '\n'
\ No newline at end of file
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,129 @@
+"""
+Note Updater module for refreshing generated parts of existing Markdown notes.
+"""
+
+import re
+
+
+class NoteUpdater:
+    """Class responsible for updating generated sections while keeping note bodies."""
+
+    NOTES_HEADING = "#### Notes"
+    TAG_LINE_PATTERN = re.compile(r'^#Contact\b[^\n]*$', re.MULTILINE)
+
+    def merge(self, existing, generated):
+        """
+        Combine freshly generated Markdown with an existing note.
+
+        The frontmatter block of the existing note is replaced by the
+        generated one, and so is the ``#Contact`` tag line under the
+        ``#### Notes`` heading that directly follows it. Everything else in
+        the body is kept as the user left it.
+
+        Args:
+            existing (str): Current content of the note
+            generated (str): Content generated from the vCard
+
+        Returns:
+            str: Merged note content
+        """
+        generated_end = self._frontmatter_end(generated)
+        generated_frontmatter = generated[:generated_end]
+        generated_notes = generated[generated_end:]
+
+        existing_end = self._frontmatter_end(existing)
+        if existing_end == 0:
+            # Not a generated note; keep all of it below the new content
+            return generated + existing
+        body = existing[existing_end:]
+
+        tag_match = self.TAG_LINE_PATTERN.search(generated_notes)
+        if tag_match is None:
+            return generated_frontmatter + body
+
+        if body.startswith(self.NOTES_HEADING):
+            section_end = body.find("\n#### ", len(self.NOTES_HEADING))
+            if section_end == -1:
+                section_end = len(body)
+            old_tag = self.TAG_LINE_PATTERN.search(body, 0, section_end)
+            if old_tag:
+                body = body[:old_tag.start()] + tag_match.group(0) + body[old_tag.end():]
+                return generated_frontmatter + body
+
+        return generated_frontmatter + generated_notes + body
+
+    def update(self, note_path, generated):
+        """
+        Update an existing note in place, keeping its body.
+
+        Args:
+            note_path (Path): Path to the existing note
+            generated (str): Content generated from the vCard
+
+        Returns:
+            int: Number of bytes written
+        """
+        with open(note_path, 'rb') as f:
+            old = f.read()
+        new = self.merge(old.decode('utf-8'), generated).encode('utf-8')
+        return self.write_changes(note_path, new, old)
+
+    def write_changes(self, path, new, old=None):
+        """
+        Write new content over a file, writing as few bytes as possible.
+
+        The new content is compared with the file byte for byte. Only the
+        range starting at the first differing byte is written: when the
+        length is unchanged (such as a new REV) just the differing span is
+        overwritten, otherwise the file is rewritten from that point on and
+        truncated. A file that is already up to date is not written at all.
+
+        Args:
+            path (Path): Path to the file; created if it does not exist
+            new (bytes): New content
+            old (bytes, optional): Current content, if already read
+
+        Returns:
+            int: Number of bytes written
+        """
+        try:
+            f = open(path, 'r+b')
+        except FileNotFoundError:
+            with open(path, 'wb') as f:
+                return f.write(new)
+
+        with f:
+            if old is None:
+                old = f.read()
+            if new == old:
+                return 0
+
+            start = self._common_prefix_length(old, new)
+            f.seek(start)
+            if len(new) == len(old):
+                end = len(new) - self._common_prefix_length(old[start:][::-1], new[start:][::-1])
+                f.write(new[start:end])
+                return end - start
+
+            f.write(new[start:])
+            f.truncate()
+            return len(new) - start
+
+    def _common_prefix_length(self, old, new, block=4096):
+        """Length of the common prefix of two byte strings, compared a block at a time."""
+        limit = min(len(old), len(new))
+        start = 0
+        while start + block <= limit and old[start:start + block] == new[start:start + block]:
+            start += block
+        while start < limit and old[start] == new[start]:
+            start += 1
+        return start
+
+    def _frontmatter_end(self, content):
+        """Offset just past the closing --- line of the frontmatter, or 0 if there is none."""
+        if not content.startswith("---\n"):
+            return 0
+        match = re.search(r'^---[ \t]*(?:\n|\Z)', content[4:], re.MULTILINE)
+        if match is None:
+            return 0
+        return 4 + match.end()
@@ -0,0 +1,166 @@
+"""
+Parse Cache module for reusing parsed vCards across runs.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+
+import vobject
+
+
+CACHE_FORMAT = 2
+CACHE_SUFFIX = ".pickle"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ParseCache:
+    """Class responsible for an on-disk, size-bounded LRU cache of parsed contact records."""
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Each entry is a pickled ContactRecord in its own file, named after the hash
+        of the raw card. The file mtime records when the entry was last used,
+        so eviction needs no separate bookkeeping file.
+
+        Args:
+            cache_dir (Path): Directory holding the cache entries
+            max_bytes (int): Total size the entries are trimmed to, oldest
+                used first
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+        self._lock = threading.Lock()
+
+    def key(self, data, projection=None):
+        """
+        Compute the cache key of raw card data.
+
+        The key covers everything that changes the parse result: the raw
+        bytes, the field projection, the vobject version, and the cache
+        format.
+
+        Args:
+            data (bytes): Raw vCard data
+            projection (FieldProjection, optional): Projection applied before parsing
+
+        Returns:
+            str: Hex digest identifying the parsed card
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{CACHE_FORMAT}\0{vobject.VERSION}\0".encode('utf-8'))
+        if projection:
+            fields = sorted(projection.fields) if projection.fields is not None else None
+            digest.update(repr((fields, sorted(projection.exclude))).encode('utf-8'))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Load a parsed card, marking it as recently used.
+
+        The hit and miss counters are updated under the cache lock, so
+        parse threads sharing the cache are all counted.
+
+        Args:
+            key (str): Key from key()
+
+        Returns:
+            ContactRecord or None: A fresh copy of the card, or None on a
+            miss or an unreadable entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                vcard = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception:
+            # Written by an incompatible version or truncated; parse again
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._size = None
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return vcard
+
+    def put(self, key, vcard):
+        """
+        Store a parsed card, evicting the least recently used entries if
+        the cache grows past its size limit.
+
+        Args:
+            key (str): Key from key()
+            vcard (ContactRecord): Parsed card
+        """
+        try:
+            data = pickle.dumps(vcard, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        tmp_path.replace(path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._measure()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def _entries(self):
+        """List (mtime_ns, size, path) for every cache entry."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as scan:
+                for entry in scan:
+                    if entry.name.endswith(CACHE_SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _measure(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache is at 90% of its limit."""
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 9 // 10
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
@@ -0,0 +1,138 @@
+"""
+Quarantine module for remembering VCF files that failed to convert.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class QuarantineCache:
+    """Class responsible for tracking known-bad VCF files until they change."""
+
+    def __init__(self, cache_path=None):
+        """
+        Initialize the quarantine cache.
+
+        Args:
+            cache_path (Path, optional): JSON file the cache is persisted to
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.entries = {}
+        self._dirty = False
+        if self.cache_path:
+            self.load()
+
+    def lookup(self, vcf_path):
+        """
+        Get the quarantine entry for a VCF file if the file is unchanged.
+
+        The stored size and modification time are compared first, so an
+        unchanged bad file costs a single stat call. If they differ the
+        content hash decides: a touched but identical file stays quarantined,
+        while a file with new content is released.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            dict or None: Entry with error and fingerprint, or None if the
+            file is not quarantined
+        """
+        # Resolving the key costs a call per path component; skip it when nothing is quarantined
+        if not self.entries:
+            return None
+        key = self._key(vcf_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            stat = Path(vcf_path).stat()
+        except OSError:
+            return None
+        if stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']:
+            return entry
+
+        if stat.st_size == entry['size'] and self._hash_file(vcf_path) == entry['sha256']:
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self._dirty = True
+            return entry
+
+        del self.entries[key]
+        self._dirty = True
+        return None
+
+    def record(self, vcf_path, error):
+        """
+        Quarantine a VCF file that failed to convert.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            error (Exception or str): Error raised while converting
+        """
+        try:
+            stat = Path(vcf_path).stat()
+            digest = self._hash_file(vcf_path)
+        except OSError:
+            return
+        self.entries[self._key(vcf_path)] = {
+            'error': str(error),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+            'failed_at': datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        }
+        self._dirty = True
+
+    def clear(self, vcf_path):
+        """
+        Release a VCF file from quarantine.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+        """
+        if self.entries and self.entries.pop(self._key(vcf_path), None) is not None:
+            self._dirty = True
+
+    def merge(self, caches):
+        """
+        Replace the stored entries with the union of other caches.
+
+        Args:
+            caches (iterable): QuarantineCache objects to combine, such as
+                those written by the shards of a run
+        """
+        entries = {}
+        for cache in caches:
+            entries.update(cache.entries)
+        self.entries = entries
+        self._dirty = True
+
+    def load(self):
+        """Load the cache from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+        except Exception:
+            self.entries = {}
+        self._dirty = False
+
+    def save(self):
+        """Write the cache to disk if it has changed since it was loaded."""
+        if not self.cache_path or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': self.entries}, f, indent=1)
+        tmp_path.replace(self.cache_path)
+        self._dirty = False
+
+    def _hash_file(self, vcf_path):
+        with open(vcf_path, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+    def _key(self, vcf_path):
+        return str(Path(vcf_path).resolve())
@@ -0,0 +1,229 @@
+"""
+Run History module for recording how each run performed and spotting regressions.
+"""
+
+import json
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+# Runs kept in the history file; older runs are dropped when it is rewritten
+DEFAULT_MAX_RUNS = 1000
+
+# Number of earlier runs whose median is the baseline of a run
+DEFAULT_WINDOW = 10
+
+# A run regressed if it is this many times slower or larger than its baseline
+DEFAULT_FACTOR = 1.5
+
+# Differences smaller than these are noise, however large the ratio
+MIN_SECONDS_DELTA = 0.5
+MIN_RSS_DELTA_KB = 32 * 1024
+
+
+class RunHistory:
+    """Class responsible for the history.jsonl file of a vault and the trends in it."""
+
+    def __init__(self, history_path, max_runs=DEFAULT_MAX_RUNS):
+        """
+        Initialize the history without reading it.
+
+        Args:
+            history_path (Path): JSON Lines file with one record per run
+            max_runs (int): Runs kept when the file grows past twice this many
+        """
+        self.history_path = Path(history_path)
+        self.max_runs = max_runs
+
+    @staticmethod
+    def io_counters():
+        """
+        Read the bytes this process has read and written so far.
+
+        Returns:
+            tuple or None: (bytes read, bytes written) through read and
+            write calls, or None where the platform does not report them
+        """
+        try:
+            with open('/proc/self/io', 'r', encoding='ascii') as f:
+                counters = dict(line.split(':', 1) for line in f if ':' in line)
+            return int(counters['rchar']), int(counters['wchar'])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def peak_rss_kb():
+        """
+        Get the peak resident set size of this process.
+
+        Returns:
+            int or None: Peak RSS in KiB, or None where it is not available
+        """
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports KiB
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+    @staticmethod
+    def timestamp():
+        """str: The current UTC time in the format used by the history."""
+        return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    def append(self, record):
+        """
+        Append the record of one run.
+
+        Args:
+            record (dict): JSON-serializable run record
+        """
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, separators=(',', ':'), sort_keys=True) + "\n")
+        self._trim()
+
+    def load(self):
+        """
+        Read every run record, skipping lines that cannot be parsed.
+
+        Returns:
+            list: Run records, oldest first
+        """
+        records = []
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    @staticmethod
+    def seconds_per_file(record):
+        """
+        Get the wall time of a run per file it looked at.
+
+        Args:
+            record (dict): Run record
+
+        Returns:
+            float: Seconds per file, or the run's seconds if it saw no files
+        """
+        files = record.get('files') or 0
+        return record.get('seconds', 0.0) / files if files else record.get('seconds', 0.0)
+
+    def regressions(self, records, window=DEFAULT_WINDOW, factor=DEFAULT_FACTOR):
+        """
+        Compare every run with the median of the runs before it.
+
+        Args:
+            records (list): Run records, oldest first
+            window (int): Number of earlier runs in the baseline
+            factor (float): Ratio to the baseline that counts as a regression
+
+        Returns:
+            list: One list per record naming what regressed, e.g.
+            ["time per file 3.1x"]; empty for runs without enough history
+        """
+        flags = []
+        for position, record in enumerate(records):
+            earlier = records[max(0, position - window):position]
+            found = []
+            if len(earlier) >= min(window, 3):
+                baseline = statistics.median(self.seconds_per_file(run) for run in earlier)
+                current = self.seconds_per_file(record)
+                files = record.get('files') or 1
+                if current > baseline * factor and (current - baseline) * files >= MIN_SECONDS_DELTA:
+                    found.append(f"time per file {current / baseline:.1f}x" if baseline else "time per file")
+                rss = [run['peak_rss_kb'] for run in earlier if run.get('peak_rss_kb')]
+                if rss and record.get('peak_rss_kb'):
+                    baseline = statistics.median(rss)
+                    current = record['peak_rss_kb']
+                    if current > baseline * factor and current - baseline >= MIN_RSS_DELTA_KB:
+                        found.append(f"peak RSS {current / baseline:.1f}x")
+            flags.append(found)
+        return flags
+
+    def report(self, limit=20, window=DEFAULT_WINDOW, factor=DEFAULT_FACTOR):
+        """
+        Describe the recent runs, their trend, and any regressions.
+
+        Args:
+            limit (int): Number of most recent runs listed
+            window (int): Number of earlier runs in each run's baseline
+            factor (float): Ratio to the baseline that counts as a regression
+
+        Returns:
+            tuple: (list of report lines, True if the latest run regressed)
+        """
+        records = self.load()
+        if not records:
+            return [f"No runs recorded in '{self.history_path}'"], False
+
+        flags = self.regressions(records, window, factor)
+        lines = [
+            f"{'Run':<17} {'Files':>6} {'Conv':>5} {'Fail':>5} {'Seconds':>8} "
+            f"{'ms/file':>8} {'MB read':>8} {'MB written':>10} {'Peak MB':>8}"
+        ]
+        for record, found in list(zip(records, flags))[-limit:]:
+            counts = record.get('counts', {})
+            line = (
+                f"{record.get('at', '?'):<17} {record.get('files', 0):>6} "
+                f"{counts.get('converted', 0):>5} {counts.get('failed', 0) + counts.get('quarantined', 0):>5} "
+                f"{record.get('seconds', 0.0):>8.2f} {self.seconds_per_file(record) * 1000:>8.1f} "
+                f"{self._megabytes(record.get('bytes_read')):>8} {self._megabytes(record.get('bytes_written')):>10} "
+                f"{self._megabytes(record.get('peak_rss_kb'), 1024):>8}"
+            )
+            if found:
+                line += "  REGRESSED: " + ", ".join(found)
+            lines.append(line)
+
+        recent = records[-window:]
+        previous = records[-2 * window:-window]
+        if previous:
+            now = statistics.median(self.seconds_per_file(run) for run in recent) * 1000
+            before = statistics.median(self.seconds_per_file(run) for run in previous) * 1000
+            change = f"{(now - before) / before:+.0%}" if before else "n/a"
+            lines.append(
+                f"Median time per file over the last {len(recent)} run(s): {now:.1f} ms "
+                f"(previous {len(previous)}: {before:.1f} ms, {change})"
+            )
+        stages = {}
+        for record in recent:
+            for stage, seconds in record.get('stages', {}).items():
+                stages.setdefault(stage, []).append(seconds)
+        if stages:
+            lines.append("Median stage times: " + ", ".join(
+                f"{stage} {statistics.median(values):.2f}s" for stage, values in sorted(stages.items())
+            ))
+        return lines, bool(flags[-1])
+
+    def _trim(self):
+        """Drop the oldest runs once the file holds twice max_runs records."""
+        # Records are longer than 100 bytes, so a small file needs no counting
+        if self.history_path.stat().st_size < 200 * self.max_runs:
+            return
+        with open(self.history_path, 'rb') as f:
+            count = sum(1 for _ in f)
+        if count <= 2 * self.max_runs:
+            return
+        with open(self.history_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()[-self.max_runs:]
+        tmp_path = self.history_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        tmp_path.replace(self.history_path)
+
+    @staticmethod
+    def _megabytes(value, unit=1024 * 1024):
+        return "-" if value is None else f"{value / unit:.1f}"
@@ -0,0 +1,155 @@
+"""
+Shard module for splitting a conversion across several processes or machines.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from .card_index import CardIndex
+
+
+SHARD_PATTERN = re.compile(r'^\s*(\d+)\s*/\s*(\d+)\s*$')
+
+# Suffix added to the stem of state files written by a sharded run
+STATE_SUFFIX_PATTERN = re.compile(r'\.shard-(\d+)-of-(\d+)$')
+
+
+class Shard:
+    """Class responsible for deciding which cards belong to one shard of a run."""
+
+    def __init__(self, index, count):
+        """
+        Initialize a shard.
+
+        Args:
+            index (int): Shard number, from 1 to count
+            count (int): Total number of shards
+
+        Raises:
+            ValueError: If the shard number is out of range
+        """
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count} (expected i/N with 1 <= i <= N)")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Parse an i/N shard specification.
+
+        Args:
+            spec: Shard object or string such as "2/4"
+
+        Returns:
+            Shard: Parsed shard
+
+        Raises:
+            ValueError: If the specification is malformed or out of range
+        """
+        if isinstance(spec, Shard):
+            return spec
+        match = SHARD_PATTERN.match(str(spec))
+        if not match:
+            raise ValueError(f"Invalid shard '{spec}' (expected i/N, e.g. 2/4)")
+        return cls(int(match.group(1)), int(match.group(2)))
+
+    @classmethod
+    def from_state_file(cls, path):
+        """
+        Get the shard that wrote a state file.
+
+        Args:
+            path (Path): State file such as card-index.shard-2-of-4.json
+
+        Returns:
+            Shard or None: The shard, or None for an unsharded state file
+        """
+        match = STATE_SUFFIX_PATTERN.search(Path(path).stem)
+        if not match:
+            return None
+        try:
+            return cls(int(match.group(1)), int(match.group(2)))
+        except ValueError:
+            return None
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+    def __repr__(self):
+        return f"Shard({self.index}, {self.count})"
+
+    def __eq__(self, other):
+        return isinstance(other, Shard) and (self.index, self.count) == (other.index, other.count)
+
+    def __hash__(self):
+        return hash((self.index, self.count))
+
+    @property
+    def suffix(self):
+        """str: Suffix added to the stem of this shard's state files."""
+        return f".shard-{self.index}-of-{self.count}"
+
+    def state_name(self, name):
+        """
+        Get the name of this shard's copy of a state file.
+
+        Args:
+            name (str): Unsharded file name, such as "card-index.json"
+
+        Returns:
+            str: Sharded file name, such as "card-index.shard-2-of-4.json"
+        """
+        path = Path(name)
+        return f"{path.stem}{self.suffix}{path.suffix}"
+
+    def shard_of(self, key):
+        """
+        Get the shard number a key hashes to.
+
+        The hash is stable across processes, machines, and Python versions.
+
+        Args:
+            key (str): UID, or the source file name for cards without one
+
+        Returns:
+            int: Shard number, from 1 to count
+        """
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big') % self.count + 1
+
+    def owns(self, uid, vcf_path):
+        """
+        Check whether a card belongs to this shard.
+
+        Cards are assigned by UID, so every shard owns its UIDs outright and
+        the rename and removal of their notes never races with another
+        shard. Cards without a UID are assigned by the name of their source
+        file, which is the same on every machine whatever the mount point.
+
+        Args:
+            uid (str): UID of the card, or an empty string
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            bool: True if this shard converts the card
+        """
+        return self.shard_of(uid or Path(vcf_path).name) == self.index
+
+    def owns_content(self, data, vcf_path):
+        """
+        Check whether a single-card VCF file belongs to this shard.
+
+        The UID is read from the raw bytes exactly as CardIndex.scan() does,
+        so the file is never parsed by a shard that does not own it.
+
+        Args:
+            data (bytes): Raw content of the VCF file
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            bool: True if this shard converts the file
+        """
+        match = CardIndex.UID_PATTERN.search(data)
+        uid = match.group(1).decode('utf-8', 'replace').strip() if match else ''
+        return self.owns(uid, vcf_path)
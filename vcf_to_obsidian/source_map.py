@@ -0,0 +1,156 @@
+"""
+Source Map module for remembering which notes each VCF file produced.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+class SourceMap:
+    """Class responsible for mapping VCF files to the notes generated from them."""
+
+    def __init__(self, map_path=None):
+        """
+        Initialize the source map.
+
+        Args:
+            map_path (Path, optional): JSON file the map is persisted to
+        """
+        self.map_path = Path(map_path) if map_path else None
+        self.sources = {}
+        self.complete = False
+        self._sources_by_note = {}
+        self._dirty = False
+        if self.map_path:
+            self.load()
+
+    def notes_for(self, vcf_path):
+        """
+        Get the notes generated from a VCF file.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            list: Note file names
+        """
+        return list(self.sources.get(self._key(vcf_path), []))
+
+    def update(self, vcf_path, notes):
+        """
+        Record the notes a VCF file produced, replacing its earlier notes.
+
+        A note belongs to one source at a time: if a contact moved from
+        another file, the note is dropped from that file's entry, so
+        deleting the old file later does not remove it.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            notes (iterable): Note file names or paths
+        """
+        key = self._key(vcf_path)
+        names = sorted({Path(note).name for note in notes})
+        if self.sources.get(key, []) == names:
+            return
+        for name in self.sources.get(key, []):
+            if self._sources_by_note.get(name) == key:
+                del self._sources_by_note[name]
+        for name in names:
+            owner = self._sources_by_note.get(name)
+            if owner is not None and owner != key:
+                remaining = [other for other in self.sources[owner] if other != name]
+                if remaining:
+                    self.sources[owner] = remaining
+                else:
+                    del self.sources[owner]
+            self._sources_by_note[name] = key
+        if names:
+            self.sources[key] = names
+        else:
+            self.sources.pop(key, None)
+        self._dirty = True
+
+    def pop(self, vcf_path):
+        """
+        Forget a VCF file and get the notes it produced.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            list: Note file names that were recorded for the file
+        """
+        names = self.sources.pop(self._key(vcf_path), [])
+        for name in names:
+            self._sources_by_note.pop(name, None)
+        if names:
+            self._dirty = True
+        return names
+
+    def cover(self, notes):
+        """
+        Record whether every note of a vault is owned by a source in the map.
+
+        A complete map means a VCF file missing from it produced no notes,
+        so its cards need not be looked up in the rest of the vault.
+
+        Args:
+            notes (iterable): Note file names or paths of every note in the
+                vault that carries a UID
+        """
+        complete = all(Path(note).name in self._sources_by_note for note in notes)
+        if complete != self.complete:
+            self.complete = complete
+            self._dirty = True
+
+    def merge(self, source_maps):
+        """
+        Replace the entries with the union of other source maps.
+
+        The cards of one multi-card file may have been converted by several
+        shards, so the notes recorded for a file are combined.
+
+        Args:
+            source_maps (iterable): SourceMap objects to combine, such as
+                those written by the shards of a run
+        """
+        sources = {}
+        for source_map in source_maps:
+            for key, names in source_map.sources.items():
+                sources.setdefault(key, set()).update(names)
+        self.sources = {key: sorted(names) for key, names in sources.items()}
+        self._sources_by_note = {
+            name: key for key, names in self.sources.items() for name in names
+        }
+        self.complete = False
+        self._dirty = True
+
+    def load(self):
+        """Load the map from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.map_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.sources = data.get('sources', {})
+            self.complete = bool(data.get('complete', False))
+        except Exception:
+            self.sources = {}
+            self.complete = False
+        self._sources_by_note = {
+            name: key for key, names in self.sources.items() for name in names
+        }
+        self._dirty = False
+
+    def save(self):
+        """Write the map to disk if it has changed since it was loaded."""
+        if not self.map_path or not self._dirty:
+            return
+        self.map_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.map_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'complete': self.complete, 'sources': self.sources}, f, indent=1)
+        tmp_path.replace(self.map_path)
+        self._dirty = False
+
+    def _key(self, vcf_path):
+        return os.path.abspath(vcf_path)
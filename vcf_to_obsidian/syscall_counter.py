@@ -0,0 +1,100 @@
+"""
+Syscall Counter module for measuring the filesystem calls of a run.
+"""
+
+import sys
+import threading
+
+
+# Audit events raised by filesystem calls, and the name each is counted under
+AUDIT_EVENTS = {
+    'open': 'open',
+    'os.scandir': 'scandir',
+    'os.listdir': 'scandir',
+    'os.rename': 'rename',
+    'os.remove': 'remove',
+    'os.utime': 'utime',
+    'os.mkdir': 'mkdir',
+    'os.truncate': 'truncate',
+}
+
+
+class SyscallCounter:
+    """Class responsible for counting the filesystem calls made while it is active."""
+
+    # Counters currently counting; the audit hook cannot be removed once added
+    _active = []
+    _hook_installed = False
+    _hook_lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Initialize a counter with no counts.
+
+        Only calls that name a path are counted, as those are the ones
+        that cost a round trip on a network filesystem; reads, writes and
+        stats of open files are not. Opens, directory listings, renames,
+        removals and timestamp changes are counted through Python's audit
+        hooks, which see every thread of the process. Python raises no
+        audit event for stat, so stat calls are counted where the converter
+        makes them, with add().
+        """
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start counting, installing the process-wide audit hook on first use."""
+        with SyscallCounter._hook_lock:
+            if not SyscallCounter._hook_installed:
+                sys.addaudithook(SyscallCounter._audit)
+                SyscallCounter._hook_installed = True
+            if self not in SyscallCounter._active:
+                SyscallCounter._active.append(self)
+
+    def stop(self):
+        """Stop counting; the counts are kept."""
+        with SyscallCounter._hook_lock:
+            if self in SyscallCounter._active:
+                SyscallCounter._active.remove(self)
+
+    def add(self, name, count=1):
+        """
+        Count calls of one kind.
+
+        Args:
+            name (str): Kind of call, such as "stat"
+            count (int): Number of calls
+        """
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + count
+
+    @property
+    def total(self):
+        """int: Number of calls counted."""
+        return sum(self.counts.values())
+
+    def describe(self, files, converted=0):
+        """
+        Describe the counts per file and per converted file.
+
+        Args:
+            files (int): Number of files the run looked at
+            converted (int): Number of files it converted
+
+        Returns:
+            str: Total, per-file rates, and the count of each kind of call
+        """
+        rates = [f"{self.total / count:.1f} per {label}"
+                 for count, label in ((files, "file"), (converted, "converted file")) if count]
+        kinds = ", ".join(f"{name} {count}" for name, count in sorted(self.counts.items()))
+        rate = f" ({', '.join(rates)})" if rates else ""
+        return f"Filesystem calls: {self.total}{rate}: {kinds or 'none'}"
+
+    @classmethod
+    def _audit(cls, event, args):
+        if not cls._active:
+            return
+        name = AUDIT_EVENTS.get(event)
+        if name is not None:
+            for counter in list(cls._active):
+                counter.add(name)
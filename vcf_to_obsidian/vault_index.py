@@ -0,0 +1,243 @@
+"""
+Vault Index module for preloading metadata of existing Markdown notes.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from .markdown_writer import RENDERER_PATTERN
+
+
+REV_PATTERN = re.compile(r'^REV: (\d{8}T\d{6}Z)\s*$')
+
+
+class VaultIndex:
+    """Class responsible for holding UID, REV, and renderer metadata of existing notes in memory."""
+
+    def __init__(self):
+        """Initialize an empty vault index."""
+        self.notes = {}
+        self.by_uid = {}
+        self.note_count = 0
+        self.bytes_read = 0
+        self.elapsed = 0.0
+        self.partial = False
+        self._absent = set()
+
+    def load(self, output_dir, max_workers=None, directory_cache=None, names=None):
+        """
+        Read the frontmatter of every note in a directory concurrently.
+
+        The directory is listed once and each note is read exactly once on a
+        thread pool; all later lookups are answered from memory.
+
+        With names, only those notes are read and the directory is not
+        listed. The index is then partial: a note it was not loaded with is
+        read on its first lookup, and UID lookups only find loaded notes.
+
+        Args:
+            output_dir (Path): Directory containing Markdown notes
+            max_workers (int, optional): Number of reader threads; defaults
+                to the ThreadPoolExecutor default
+            directory_cache (DirectoryCache, optional): Lists the directory
+                instead, keeping the listing for later existence checks
+            names (iterable, optional): File names of the only notes to read
+
+        Returns:
+            VaultIndex: This index, for chaining
+        """
+        start = time.perf_counter()
+        if names is not None:
+            self.partial = True
+            paths = [Path(output_dir) / name for name in sorted(set(names))]
+        elif directory_cache is not None:
+            # Directories named *.md fail to open and are skipped below
+            paths = [Path(output_dir) / name for name in directory_cache.names(output_dir) if name.endswith('.md')]
+        else:
+            try:
+                with os.scandir(output_dir) as entries:
+                    paths = [
+                        Path(entry.path) for entry in entries
+                        if entry.name.endswith('.md') and entry.is_file()
+                    ]
+            except OSError:
+                paths = []
+
+        read = self._read_metadata if directory_cache is None else self._read_metadata_raw
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for path, metadata in zip(paths, pool.map(read, paths)):
+                if metadata is None:
+                    if self.partial:
+                        self._absent.add(path)
+                    continue
+                uid, rev, renderer, size = metadata
+                self.bytes_read += size
+                self.note_count += 1
+                self.update(path, uid, rev, renderer)
+
+        self.elapsed = time.perf_counter() - start
+        return self
+
+    def contains(self, path):
+        """
+        Check whether a note is known to exist.
+
+        Args:
+            path (Path): Path to the Markdown note
+
+        Returns:
+            bool: True if the note is in the index
+        """
+        return self._note(path) is not None
+
+    def files_with_uid(self, uid):
+        """
+        Get the notes whose frontmatter carries a UID.
+
+        Args:
+            uid (str): UID to look up
+
+        Returns:
+            list: List of Path objects for notes with matching UID
+        """
+        return sorted(self.by_uid.get(uid, ()))
+
+    def get_rev(self, path):
+        """
+        Get the REV timestamp recorded in a note.
+
+        Args:
+            path (Path): Path to the Markdown note
+
+        Returns:
+            datetime or None: REV timestamp, or None if unknown
+        """
+        note = self._note(path)
+        return note[1] if note else None
+
+    def get_renderer_version(self, path):
+        """
+        Get the renderer version a note was generated with.
+
+        Args:
+            path (Path): Path to the Markdown note
+
+        Returns:
+            int: Renderer version, or 0 if unknown
+        """
+        note = self._note(path)
+        return note[2] if note else 0
+
+    def update(self, path, uid, rev, renderer=0):
+        """
+        Record the metadata of a note that was read or written.
+
+        Args:
+            path (Path): Path to the Markdown note
+            uid (str or None): UID in the note's frontmatter
+            rev (datetime or None): REV timestamp in the note's frontmatter
+            renderer (int): Renderer version recorded in the note
+        """
+        path = Path(path)
+        self.remove(path)
+        self._absent.discard(path)
+        self.notes[path] = (uid, rev, renderer)
+        if uid:
+            self.by_uid.setdefault(uid, set()).add(path)
+
+    def remove(self, path):
+        """
+        Forget a note that was deleted.
+
+        Args:
+            path (Path): Path to the Markdown note
+        """
+        path = Path(path)
+        note = self.notes.pop(path, None)
+        if self.partial:
+            self._absent.add(path)
+        if note and note[0]:
+            paths = self.by_uid.get(note[0])
+            if paths:
+                paths.discard(path)
+                if not paths:
+                    del self.by_uid[note[0]]
+
+    def throughput(self):
+        """
+        Describe how fast the index was loaded.
+
+        Returns:
+            str: Note count, size, time and rates of the last load
+        """
+        elapsed = max(self.elapsed, 1e-9)
+        megabytes = self.bytes_read / (1024 * 1024)
+        return (
+            f"Preloaded {self.note_count} note(s) ({megabytes:.1f} MB) in {self.elapsed:.2f}s: "
+            f"{self.note_count / elapsed:.0f} notes/s, {megabytes / elapsed:.1f} MB/s"
+        )
+
+    def _note(self, path):
+        """Get the metadata of a note, reading it first if a partial index has not seen it."""
+        path = Path(path)
+        note = self.notes.get(path)
+        if note is None and self.partial and path not in self._absent:
+            metadata = self._read_metadata(path)
+            if metadata is None:
+                self._absent.add(path)
+            else:
+                self.update(path, *metadata[:3])
+                note = self.notes[path]
+        return note
+
+    def _read_metadata(self, path):
+        """Read UID, REV, and renderer version from a note's frontmatter; None if unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                size = os.fstat(f.fileno()).st_size
+                content = f.read()
+        except Exception:
+            return None
+        return self._parse_metadata(content) + (size,)
+
+    def _read_metadata_raw(self, path):
+        """Read metadata like _read_metadata(), with unbuffered reads and no stat call."""
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                chunks = [os.read(fd, 64 * 1024)]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, 64 * 1024))
+            finally:
+                os.close(fd)
+            data = b"".join(chunks)
+            content = data.decode('utf-8').replace('\r\n', '\n')
+        except Exception:
+            return None
+        return self._parse_metadata(content) + (len(data),)
+
+    @staticmethod
+    def _parse_metadata(content):
+        """Get UID, REV, and renderer version from the frontmatter of a note's text."""
+        uid = None
+        rev = None
+        renderer = 0
+        lines = content.split('\n')
+        if lines and lines[0].strip() == '---':
+            for line in lines[1:]:
+                if line.strip() == '---':
+                    break
+                if line.startswith('UID: ') and uid is None:
+                    uid = line[5:].strip()
+                elif line.startswith('#'):
+                    match = RENDERER_PATTERN.match(line)
+                    if match:
+                        renderer = int(match.group(1))
+                elif rev is None:
+                    match = REV_PATTERN.match(line)
+                    if match:
+                        rev = datetime.strptime(match.group(1), "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        return uid, rev, renderer
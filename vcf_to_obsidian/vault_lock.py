@@ -0,0 +1,206 @@
+"""
+Vault Lock module for keeping overlapping runs off the same vault.
+"""
+
+import json
+import os
+import socket
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+# What a run does when another run holds the lock
+LOCK_MODES = ("wait", "fail", "coalesce")
+
+# Exit status of a run that gave up because the vault was locked (EX_TEMPFAIL)
+EXIT_LOCKED = 75
+
+
+class VaultLocked(Exception):
+    """Raised when the vault is locked by another run and the lock mode is "fail"."""
+
+
+class VaultLock:
+    """Class responsible for an advisory, fcntl-based lock on a vault."""
+
+    def __init__(self, lock_path, mode="wait", poll_interval=0.2):
+        """
+        Initialize the lock without taking it.
+
+        The lock is an flock on a file in the vault's state directory, so
+        the kernel releases it when the holder exits, however it exits. The
+        holder's PID and host are written into the file: if the lock is
+        still held but that process is gone (the descriptor leaked into a
+        child, or an NFS server kept a dead client's lock), the lock is
+        stale and is broken by replacing the file.
+
+        Args:
+            lock_path (Path): Lock file
+            mode (str): One of LOCK_MODES: "wait" blocks until the lock is
+                free, "fail" raises VaultLocked, and "coalesce" asks the
+                holder for another pass and returns without the lock
+            poll_interval (float): Seconds between attempts while waiting
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in LOCK_MODES:
+            raise ValueError(f"lock mode must be one of {', '.join(LOCK_MODES)}")
+        self.lock_path = Path(lock_path)
+        self.pending_path = self.lock_path.with_name(self.lock_path.name + ".pending")
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    @property
+    def held(self):
+        """bool: True while this object holds the lock."""
+        return self._fd is not None
+
+    def acquire(self):
+        """
+        Take the lock according to the lock mode.
+
+        Returns:
+            bool: True if the lock was taken, False if the run was coalesced
+            into the holder's next pass
+
+        Raises:
+            VaultLocked: If the lock is held and the mode is "fail"
+        """
+        if self.try_acquire():
+            return True
+
+        if self.mode == "fail":
+            raise VaultLocked(self.describe_holder())
+
+        if self.mode == "coalesce":
+            self.pending_path.parent.mkdir(parents=True, exist_ok=True)
+            self.pending_path.touch()
+            # The holder may have finished between the two attempts; it
+            # only checks for requests after releasing, so try once more
+            if self.try_acquire():
+                self.pending_path.unlink(missing_ok=True)
+                return True
+            return False
+
+        while not self.try_acquire():
+            time.sleep(self.poll_interval)
+        return True
+
+    def try_acquire(self):
+        """
+        Take the lock if it is free, breaking it if it is stale.
+
+        Returns:
+            bool: True if the lock was taken
+        """
+        if self.held:
+            return True
+        if fcntl is None:
+            # No advisory locks on this platform; runs are not serialized
+            self._fd = -1
+            return True
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            locked_inode = os.fstat(fd).st_ino
+            os.close(fd)
+            if self._is_stale() and self._inode() == locked_inode:
+                # Lock a fresh file; the stale holder keeps the old inode
+                self.lock_path.unlink(missing_ok=True)
+                return self.try_acquire()
+            return False
+
+        if os.fstat(fd).st_ino != self._inode():
+            # The file was replaced after a stale lock was broken
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, json.dumps({
+            'pid': os.getpid(),
+            'host': socket.gethostname(),
+            'since': datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        }).encode('utf-8'))
+        self._fd = fd
+        return True
+
+    def release(self):
+        """Release the lock if it is held."""
+        if self._fd is None:
+            return
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = None
+
+    @property
+    def requested(self):
+        """bool: True if a coalesced run asked for another pass."""
+        return self.pending_path.exists()
+
+    def clear_request(self):
+        """
+        Mark a requested pass as started.
+
+        Call this only while holding the lock, so a request made during an
+        earlier pass is never consumed by a run that started before it.
+        """
+        self.pending_path.unlink(missing_ok=True)
+
+    def holder(self):
+        """
+        Read who holds the lock.
+
+        Returns:
+            dict or None: pid, host, and since of the last holder, or None if
+            the lock file is missing or unreadable
+        """
+        try:
+            with open(self.lock_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def _inode(self):
+        try:
+            return os.stat(self.lock_path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def _is_stale(self):
+        """Check whether the recorded holder is a process on this host that no longer exists."""
+        holder = self.holder()
+        if not holder or holder.get('host') != socket.gethostname():
+            return False
+        try:
+            os.kill(int(holder['pid']), 0)
+        except ProcessLookupError:
+            return True
+        except (PermissionError, KeyError, TypeError, ValueError):
+            return False
+        return False
+
+    def describe_holder(self):
+        """
+        Describe who holds the lock.
+
+        Returns:
+            str: Message naming the holder's PID, host, and start time
+        """
+        holder = self.holder()
+        if not holder:
+            return f"Vault is locked by another run ({self.lock_path})"
+        return (
+            f"Vault is locked by process {holder.get('pid')} on {holder.get('host')} "
+            f"since {holder.get('since')} ({self.lock_path})"
+        )
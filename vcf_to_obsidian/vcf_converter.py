@@ -2,22 +2,546 @@
 VCF Converter module for handling VCF to Markdown conversion.
 """
 
+import json
+import os
+import queue
 import re
+import stat
+import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from .vcf_reader import VCFReader
-from .markdown_writer import MarkdownWriter
+from .markdown_writer import MarkdownWriter, RENDERER_VERSION, RENDERER_PATTERN
 from .filename_generator import FilenameGenerator
+from .card_index import CardIndex
+from .quarantine import QuarantineCache
+from .vault_index import VaultIndex
+from .note_updater import NoteUpdater
+from .destination import Destination
+from .contact_filter import ContactFilter
+from .field_projection import FieldProjection
+from .ignore_matcher import IgnoreMatcher, IGNORE_FILE_NAME
+from .conversion_result import ConversionResult
+from .work_scheduler import WorkScheduler
+from .contact_catalog import ContactCatalog
+from .parse_cache import ParseCache, DEFAULT_MAX_BYTES
+from .shard import Shard
+from .source_map import SourceMap
+from .change_feed import ChangeFeed
+from .run_history import RunHistory
+from .autotuner import Autotuner
+from .write_pool import WritePool
+from .directory_cache import DirectoryCache
+from .syscall_counter import SyscallCounter
+from .duplicate_finder import DuplicateFinder, DEDUPE_FIELDS, DEFAULT_THRESHOLD
+from .vault_lock import VaultLock, VaultLocked, LOCK_MODES, EXIT_LOCKED
+
+
+# Directory inside the destination that holds converter state
+STATE_DIR_NAME = ".vcf-to-obsidian"
+
+# Where the REV written into each note comes from
+REV_SOURCES = ("now", "card", "mtime")
+
+# Timestamp resolutions (in ns) of common filesystems; a mirrored mtime may be
+# truncated to one of these when the note lives on a coarser filesystem
+MTIME_RESOLUTIONS_NS = (100, 1_000, 1_000_000_000, 2_000_000_000)
+
+# Marks the end of a stage's output in iter_convert
+_STAGE_DONE = object()
 
 
 class VCFConverter:
     """Class responsible for converting VCF files to Markdown format."""
 
-    def __init__(self):
-        """Initialize the VCF converter."""
+    def __init__(self, card_index=False, retry_failed=False, rev_source="now",
+                 mirror_mtime=False, preload=True, vault_workers=None,
+                 preserve_body=False, include=(), exclude=(), fields=None, no_photos=False,
+                 recursive=False, max_seconds=None, catalog=False, parse_cache=False,
+                 parse_cache_bytes=DEFAULT_MAX_BYTES, shard=None, lock="wait",
+                 source_map=False, history=True, parse_workers=None, write_workers=None,
+                 low_syscall=False, count_syscalls=False):
+        """
+        Initialize the VCF converter.
+
+        Args:
+            card_index (bool): Convert every card of multi-card VCF files,
+                tracking them in a persisted byte-offset index so only
+                changed cards are re-parsed
+            retry_failed (bool): Convert quarantined files again even if
+                they have not changed since they failed
+            rev_source (str): Source of the REV written into notes: "now"
+                for the conversion time, "card" for the card's own REV
+                (falling back to the source mtime), or "mtime" for the
+                source file's modification time. The last two make output
+                deterministic and turn the skip check into an equality test
+            mirror_mtime (bool): Set each note's mtime to its source's mtime
+                and skip conversion when the two match, so deciding to skip
+                needs two stat calls and no file reads
+            preload (bool): Read the frontmatter of every existing note once,
+                concurrently, at the start of a batch run and answer all UID
+                and REV lookups from memory
+            vault_workers (int, optional): Threads used to preload the vault
+            preserve_body (bool): Update only the frontmatter and the
+                #Contact tag line of existing notes, keeping everything the
+                user wrote in the body
+            include (iterable): Filter predicates (FIELD=VALUE or FIELD~REGEX)
+                a card must match to be converted
+            exclude (iterable): Filter predicates that keep a card from
+                being converted
+            fields (iterable, optional): vCard properties to convert; all
+                others are removed from the raw text before parsing. Identity
+                properties and properties used by filters are always kept
+            no_photos (bool): Remove PHOTO before parsing
+            recursive (bool): Also convert VCF files in subdirectories of
+                source folders
+            max_seconds (float, optional): Time budget for a batch run. Files
+                are then converted most recently modified first, and files
+                left when the budget runs out are deferred to the next run
+            catalog (bool): Maintain contacts.json, contacts.csv, and a
+                Markdown index note of every contact in each destination,
+                updated from conversion results instead of rescanning notes
+            parse_cache (bool): Keep parsed cards on disk, keyed by a hash of
+                their raw content, so runs whose sources did not change
+                render notes without parsing anything
+            parse_cache_bytes (int): Size the parse cache is trimmed to,
+                least recently used entries first
+            shard (Shard or str, optional): Convert only the cards of one
+                shard, e.g. "2/4". Cards are assigned by a hash of their UID
+                (or source file name), and state files get a per-shard
+                suffix, so shards can run concurrently on one vault
+            lock (str, optional): What a batch run does when another run
+                holds a destination's lock: "wait", "fail" (raise
+                VaultLocked), or "coalesce" (ask the running instance for
+                another pass and return without converting). None disables
+                locking
+            source_map (bool): Record which notes each VCF file produced in
+                sources.json, so the notes of deleted files can be removed
+                with delete_sources() and change feeds need not read the
+                whole vault
+            history (bool): Append a record of each run's counts, stage
+                times, I/O, and peak memory to history.jsonl
+            parse_workers (int, optional): Threads reading and parsing
+                files; chosen by the autotuner from the first files of a
+                run if None
+            write_workers (int, optional): Threads writing notes; chosen by
+                the autotuner if None. With one, notes are written on the
+                calling thread
+            low_syscall (bool): Keep filesystem calls to a minimum for
+                vaults and sources on network filesystems: each directory is
+                listed once per pass and existence and mtime checks are
+                answered from the listing, files are read and written with
+                one unbuffered call each, and state files are saved once
+                per pass instead of after every file
+            count_syscalls (bool): Count the filesystem calls of each run,
+                print them per converted file, and add them to its history
+                record
+
+        Raises:
+            ValueError: If an option is invalid
+        """
+        if max_seconds is not None and max_seconds <= 0:
+            raise ValueError("max_seconds must be positive")
+        if rev_source not in REV_SOURCES:
+            raise ValueError(f"rev_source must be one of {', '.join(REV_SOURCES)}")
+        self.shard = Shard.parse(shard) if shard is not None else None
+        if lock is not None and lock not in LOCK_MODES:
+            raise ValueError(f"lock must be one of {', '.join(LOCK_MODES)}")
+        self.lock = lock
+        self.source_map = source_map
+        self.history = history
+        self.autotuner = Autotuner(parse_workers, write_workers)
+        self.low_syscall = low_syscall
+        self.count_syscalls = count_syscalls
+        self.syscalls = SyscallCounter()
+        self.coalesced = False
         self.reader = VCFReader()
         self.writer = MarkdownWriter()
         self.filename_gen = FilenameGenerator()
+        self.updater = NoteUpdater()
+        self.contact_filter = ContactFilter(include, exclude)
+        self.reader.projection = FieldProjection(
+            fields, ("PHOTO",) if no_photos else ()
+        ).keeping(self.contact_filter.fields)
+        self.card_index = card_index
+        self.retry_failed = retry_failed
+        self.rev_source = rev_source
+        self.mirror_mtime = mirror_mtime
+        self.preload = preload
+        self.vault_workers = vault_workers
+        self.preserve_body = preserve_body
+        self.recursive = recursive
+        self.max_seconds = max_seconds
+        self.catalog = catalog
+        self.parse_cache = parse_cache
+        self.parse_cache_bytes = parse_cache_bytes
+        self.deferred = []
+        self.failures = []
+        self.unowned = 0
+        self._card_indexes = {}
+        self._quarantines = {}
+        self._vault_indexes = {}
+        self._catalogs = {}
+        self._parse_caches = {}
+        self._source_maps = {}
+        self._write_pool = None
+        self._directory_cache = None
+        # Sources of a change feed; set while iter_changes() converts them
+        self._changed_sources = None
+        # Guards state shared between the parse and write stages of iter_convert
+        self._state_lock = threading.RLock()
+
+    def _state_dir(self, output_dir):
+        """
+        Get the directory used to persist converter state for a destination.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            Path: State directory inside the output directory
+        """
+        return Path(output_dir) / STATE_DIR_NAME
+
+    def _state_file(self, output_dir, name):
+        """
+        Get the path of a state file, using this shard's copy in a sharded run.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+            name (str): Name of the state file, such as "card-index.json"
+
+        Returns:
+            Path: Path of the state file
+        """
+        if self.shard is not None:
+            name = self.shard.state_name(name)
+        return self._state_dir(output_dir) / name
+
+    def _get_card_index(self, output_dir):
+        """
+        Get the card index for a destination, loading it on first use.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            CardIndex: Card index persisted in the destination state directory
+        """
+        key = str(output_dir)
+        if key not in self._card_indexes:
+            self._card_indexes[key] = CardIndex(self._state_file(output_dir, "card-index.json"))
+        return self._card_indexes[key]
+
+    def _get_quarantine(self, output_dir):
+        """
+        Get the quarantine cache for a destination, loading it on first use.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            QuarantineCache: Quarantine cache persisted in the destination state directory
+        """
+        key = str(output_dir)
+        if key not in self._quarantines:
+            self._quarantines[key] = QuarantineCache(self._state_file(output_dir, "quarantine.json"))
+        return self._quarantines[key]
+
+    def _get_catalog(self, output_dir):
+        """
+        Get the contact catalog for a destination, loading it on first use.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            ContactCatalog or None: The catalog, or None if cataloging is off
+        """
+        if not self.catalog:
+            return None
+        key = str(output_dir)
+        if key not in self._catalogs:
+            self._catalogs[key] = ContactCatalog(
+                output_dir, self._state_dir(output_dir), self.shard.suffix if self.shard else ""
+            )
+        return self._catalogs[key]
+
+    def _get_parse_cache(self, output_dir):
+        """
+        Get the parse cache stored in a destination's state directory.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            ParseCache or None: The cache, or None if parse caching is off
+        """
+        if not self.parse_cache:
+            return None
+        key = str(output_dir)
+        with self._state_lock:
+            if key not in self._parse_caches:
+                self._parse_caches[key] = ParseCache(
+                    self._state_dir(output_dir) / "parse-cache", self.parse_cache_bytes
+                )
+            return self._parse_caches[key]
+
+    def _parse_cached(self, output_dir, data, parse):
+        """
+        Parse a card, reusing the cached result for identical raw data.
+
+        Args:
+            output_dir (Path): Output directory whose state holds the cache
+            data (bytes): Raw card data the parse result depends on
+            parse (callable): Parses the card on a cache miss
+
+        Returns:
+            ContactRecord: Parsed card
+        """
+        cache = self._get_parse_cache(output_dir)
+        if cache is None:
+            return parse()
+        key = cache.key(data, self.reader.projection)
+        vcard = cache.get(key)
+        if vcard is None:
+            vcard = parse()
+            cache.put(key, vcard)
+        return vcard
+
+    def _get_source_map(self, output_dir):
+        """
+        Get the source map of a destination, loading it on first use.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            SourceMap or None: The map, or None if source mapping is off
+        """
+        if not self.source_map:
+            return None
+        key = str(output_dir)
+        if key not in self._source_maps:
+            self._source_maps[key] = SourceMap(self._state_file(output_dir, "sources.json"))
+        return self._source_maps[key]
+
+    def _save_state(self, state):
+        """
+        Save a quarantine or card index, unless saves wait for the end of the pass.
+
+        Args:
+            state: QuarantineCache or CardIndex that may have changed
+        """
+        if self._directory_cache is None:
+            state.save()
+
+    def _save_run_state(self):
+        """Write every catalog, source map, quarantine, and card index that changed."""
+        for catalog in self._catalogs.values():
+            catalog.save()
+        for key, source_map in self._source_maps.items():
+            index = self._vault_indexes.get(key)
+            if index is not None and not index.partial:
+                source_map.cover(path for path, note in index.notes.items() if note[0])
+            source_map.save()
+        with self._state_lock:
+            for quarantine in self._quarantines.values():
+                quarantine.save()
+            for index in self._card_indexes.values():
+                index.save()
+
+    def forget_state(self):
+        """
+        Drop the state loaded from destinations, so it is read again on next use.
+
+        Call this when another process may have changed the vault or its
+        state files since they were loaded.
+        """
+        self._card_indexes.clear()
+        self._quarantines.clear()
+        self._vault_indexes.clear()
+        self._catalogs.clear()
+        self._source_maps.clear()
+
+    def preload_vault(self, output_dir, sources=None):
+        """
+        Load the metadata of every note in a destination into memory.
+
+        Once loaded, UID lookups, REV lookups and existence checks for notes
+        in this destination are answered from the index instead of disk.
+
+        With sources and a complete source map, only the notes the map
+        records for those sources are loaded, so the cost follows the number
+        of changed files rather than the size of the vault. A card that
+        moved between files is still found when both files are among the
+        sources, as a change feed reports them. The map is complete once a
+        run that loaded the whole vault found every note owned by a source;
+        until then, and after notes appear that no source produced, the
+        whole vault is loaded so renamed contacts' old notes are found.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+            sources (iterable, optional): VCF files whose notes to load
+
+        Returns:
+            VaultIndex: The loaded index
+        """
+        names = None
+        source_map = self._get_source_map(output_dir) if sources is not None else None
+        if source_map is not None and source_map.complete:
+            names = [name for source in sources for name in source_map.notes_for(source)]
+        index = VaultIndex().load(
+            output_dir, max_workers=self.vault_workers, directory_cache=self._directory_cache,
+            names=names,
+        )
+        self._vault_indexes[str(Path(output_dir))] = index
+        return index
+
+    def _get_vault_index(self, output_dir):
+        """
+        Get the preloaded index of a destination, if there is one.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+
+        Returns:
+            VaultIndex or None: Preloaded index, or None if not preloaded
+        """
+        return self._vault_indexes.get(str(Path(output_dir)))
+
+    def _find_existing_files_with_uid(self, output_dir, uid):
+        """
+        Find notes with a UID, using the preloaded index when available.
+
+        Args:
+            output_dir (Path): Output directory for Markdown files
+            uid (str): UID to search for
+
+        Returns:
+            list: List of Path objects for files with matching UID
+        """
+        index = self._get_vault_index(output_dir)
+        if index is not None:
+            return index.files_with_uid(uid)
+        return self.filename_gen.find_existing_files_with_uid(output_dir, uid)
+
+    def _stat(self, path):
+        """
+        Stat a file, through the directory cache in low-syscall mode.
+
+        Args:
+            path (Path): Path of the file
+
+        Returns:
+            os.stat_result: Status of the file
+
+        Raises:
+            OSError: If the file does not exist
+        """
+        if self._directory_cache is not None:
+            return self._directory_cache.stat(path)
+        self.syscalls.add('stat')
+        return os.stat(path)
+
+    def _exists(self, path):
+        """
+        Check whether a file exists, through the directory cache in low-syscall mode.
+
+        Args:
+            path (Path): Path of the file
+
+        Returns:
+            bool: True if the file exists
+        """
+        if self._directory_cache is not None:
+            return self._directory_cache.exists(path)
+        self.syscalls.add('stat')
+        return Path(path).exists()
+
+    def _file_changed(self, path, removed=False):
+        """
+        Keep the directory cache in step with a file that was written or removed.
+
+        Args:
+            path (Path): Path of the file
+            removed (bool): True if the file was removed
+        """
+        if self._directory_cache is None:
+            return
+        if removed:
+            self._directory_cache.removed(path)
+        else:
+            self._directory_cache.changed(path)
+
+    def _read_source(self, vcf_path):
+        """
+        Read the raw bytes of a VCF file.
+
+        In low-syscall mode the file is read with a single unbuffered read,
+        skipping the extra stat, ioctl and seek calls of a buffered file
+        object. Its size and mtime come from the open file and are kept in
+        the directory cache, so later checks of the source need no stat.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+
+        Returns:
+            bytes: Content of the file
+        """
+        if self._directory_cache is None:
+            with open(vcf_path, 'rb') as f:
+                return f.read()
+        fd = os.open(vcf_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            status = os.fstat(fd)
+            self._directory_cache.update(vcf_path, status)
+            size = status.st_size
+            # A read shorter than requested means end of file
+            data = os.read(fd, size + 1)
+            if len(data) > size:
+                # The file grew since its directory was listed
+                chunks = [data]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, 64 * 1024))
+                data = b"".join(chunks)
+        finally:
+            os.close(fd)
+        return data
+
+    def _write_text(self, path, text, times=None):
+        """
+        Write a note with one open, one write, and one close.
+
+        Args:
+            path (Path): Path of the note
+            text (str): Content, with newline-terminated lines
+            times (tuple, optional): (atime_ns, mtime_ns) to give the note,
+                set through the open file where the platform allows
+        """
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        data = memoryview(text.encode('utf-8'))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            if times is not None:
+                os.utime(fd if os.utime in os.supports_fd else path, ns=times)
+        finally:
+            os.close(fd)
+
+    def _wait_for_write(self, path):
+        """
+        Wait until a note being written in the background is on disk.
+
+        Args:
+            path (Path): Path of the note
+        """
+        if self._write_pool is not None:
+            self._write_pool.wait(path)
 
     def _extract_rev_timestamp_from_markdown(self, markdown_path):
         """
@@ -29,8 +553,12 @@ class VCFConverter:
         Returns:
             datetime or None: REV timestamp as datetime object, or None if not found
         """
+        index = self._get_vault_index(markdown_path.parent)
+        if index is not None:
+            return index.get_rev(markdown_path)
+
         try:
-            if not markdown_path.exists():
+            if not self._exists(markdown_path):
                 return None
                 
             with open(markdown_path, 'r', encoding='utf-8') as f:
@@ -47,22 +575,132 @@ class VCFConverter:
         except Exception:
             return None
     
-    def _should_skip_conversion(self, vcf_path, markdown_path):
+    def _extract_renderer_version_from_markdown(self, markdown_path):
+        """
+        Extract the renderer version from an existing Markdown file.
+        
+        Args:
+            markdown_path (Path): Path to the Markdown file
+            
+        Returns:
+            int: Renderer version, or 0 if the note does not record one
+        """
+        index = self._get_vault_index(markdown_path.parent)
+        if index is not None:
+            return index.get_renderer_version(markdown_path)
+
+        try:
+            with open(markdown_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception:
+            return 0
+        match = RENDERER_PATTERN.search(content)
+        return int(match.group(1)) if match else 0
+
+    def _renderer_outdated(self, markdown_path):
+        """
+        Check whether a note was generated by an older renderer.
+        
+        Without a preloaded vault index, --mirror-mtime skip checks never
+        read notes, so the renderer version is not checked there.
+        
+        Args:
+            markdown_path (Path): Path to the Markdown file
+            
+        Returns:
+            bool: True if the note must be re-rendered
+        """
+        if self.mirror_mtime and self._get_vault_index(markdown_path.parent) is None:
+            return False
+        return self._extract_renderer_version_from_markdown(markdown_path) < RENDERER_VERSION
+
+    def _source_rev(self, vcard, vcf_path):
+        """
+        Derive the REV timestamp for a note from its source.
+        
+        Args:
+            vcard (ContactRecord): Parsed card
+            vcf_path (Path): Path to the VCF file
+            
+        Returns:
+            datetime or None: UTC timestamp truncated to whole seconds, or
+            None when REV should be the conversion time
+        """
+        if self.rev_source == "now":
+            return None
+        
+        rev = None
+        if self.rev_source == "card":
+            rev = self.reader.get_rev_timestamp(vcard)
+        if rev is None:
+            rev = datetime.fromtimestamp(self._stat(vcf_path).st_mtime, tz=timezone.utc)
+        return rev.replace(microsecond=0)
+
+    def _mtimes_match(self, vcf_path, markdown_path):
+        """
+        Check whether a note carries its source's mirrored modification time.
+        
+        Args:
+            vcf_path (Path): Path to the VCF file
+            markdown_path (Path): Path to the Markdown file
+            
+        Returns:
+            bool: True if the note's mtime equals the source mtime, allowing
+            for truncation to the note filesystem's timestamp resolution
+        """
+        try:
+            vcf_ns = self._stat(vcf_path).st_mtime_ns
+            markdown_ns = self._stat(markdown_path).st_mtime_ns
+        except OSError:
+            return False
+        
+        if markdown_ns == vcf_ns:
+            return True
+        return any(
+            markdown_ns % resolution == 0 and markdown_ns == vcf_ns - vcf_ns % resolution
+            for resolution in MTIME_RESOLUTIONS_NS
+        )
+
+    def _should_skip_conversion(self, vcf_path, markdown_path, expected_rev=None):
         """
         Check if conversion should be skipped based on file modification times.
         
+        A note generated by an older renderer is never skipped, so an upgrade
+        that changes the output re-renders exactly the notes it affects.
+        
         Args:
             vcf_path (Path): Path to the VCF file
             markdown_path (Path): Path to the Markdown file
+            expected_rev (datetime, optional): REV derived from the source; when
+                given, conversion is skipped only if the note's REV equals it
+                and the source is not newer than the note
             
         Returns:
             bool: True if conversion should be skipped, False otherwise
         """
-        if not markdown_path.exists():
+        self._wait_for_write(markdown_path)
+        if self.mirror_mtime:
+            return self._mtimes_match(vcf_path, markdown_path) and not self._renderer_outdated(markdown_path)
+        
+        index = self._get_vault_index(markdown_path.parent)
+        if not (index.contains(markdown_path) if index is not None else self._exists(markdown_path)):
+            return False
+        
+        if self._renderer_outdated(markdown_path):
             return False
         
+        if expected_rev is not None:
+            if self._extract_rev_timestamp_from_markdown(markdown_path) != expected_rev:
+                return False
+            # A card's REV may stay the same while its content changes, so the
+            # source must also not have been modified since the note was written
+            try:
+                return self._stat(vcf_path).st_mtime_ns <= self._stat(markdown_path).st_mtime_ns
+            except OSError:
+                return False
+        
         # Get VCF file modification time
-        vcf_mtime = datetime.fromtimestamp(vcf_path.stat().st_mtime, tz=timezone.utc)
+        vcf_mtime = datetime.fromtimestamp(self._stat(vcf_path).st_mtime, tz=timezone.utc)
         
         # Get REV timestamp from markdown
         rev_timestamp = self._extract_rev_timestamp_from_markdown(markdown_path)
@@ -79,85 +717,600 @@ class VCFConverter:
         # Use a small tolerance to account for filesystem timestamp precision
         return vcf_mtime <= rev_timestamp
 
-    def convert_vcf_to_markdown(self, vcf_path, output_dir):
+    def _destinations(self, output_dir):
+        """
+        Normalize one or more output directories into Destination objects.
+
+        Args:
+            output_dir: Path, Destination, specification string, or a list
+                or tuple of them
+
+        Returns:
+            list: List of Destination objects
+        """
+        if isinstance(output_dir, (list, tuple)):
+            return [Destination.parse(destination) for destination in output_dir]
+        return [Destination.parse(output_dir)]
+
+    def _select_destinations(self, destinations, content, parse):
+        """
+        Select the destinations a card is written to.
+
+        The global and per-destination filters are evaluated on the raw card
+        text first; the card is parsed only if a predicate cannot be decided
+        there.
+
+        Args:
+            destinations (list): Candidate Destination objects
+            content (str): Text of the card
+            parse (callable): Returns the parsed vCard when called
+
+        Returns:
+            tuple: (selected_destinations, vcard or None if not parsed)
+        """
+        vcard = None
+        selected = []
+        for contact_filter, targets in [(self.contact_filter, None)] + [
+            (destination.filter, [destination]) for destination in destinations
+        ]:
+            decision = contact_filter.matches_raw(content)
+            if decision is None:
+                if vcard is None:
+                    vcard = parse()
+                decision = contact_filter.matches(vcard)
+            if targets is None:
+                if not decision:
+                    return [], vcard
+            elif decision:
+                selected.extend(targets)
+        return selected, vcard
+
+    def _keep_filter_fields(self, destinations):
+        """
+        Make sure the reader's projection keeps properties used by destination filters.
+
+        Args:
+            destinations (list): Destination objects
+        """
+        if self.reader.projection:
+            self.reader.projection = self.reader.projection.keeping(
+                field for destination in destinations for field in destination.filter.fields
+            )
+
+    def convert_vcf_to_markdown(self, vcf_path, output_dir):
+        """
+        Convert a single VCF file to Markdown format.
+
+        When several destinations are given the file is parsed once and each
+        card is rendered once per photo mode; the rendered note is reused for
+        every destination with the same options. Failed files are quarantined
+        in the first destination.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        destinations = self._destinations(output_dir)
+        self._keep_filter_fields(destinations)
+        result = self._write_source(self._parse_source(vcf_path, destinations), destinations)
+        self._save_run_state()
+        return result.ok
+
+    def _parse_source(self, vcf_path, destinations):
+        """
+        Read, filter, and parse a VCF file without writing anything.
+
+        This is the parse stage of a conversion. It prints nothing and only
+        touches shared state under the state lock, so it can run on a
+        different thread than the write stage.
+
+        Args:
+            vcf_path (Path): Path to the VCF file
+            destinations (list): Destination objects
+
+        Returns:
+            dict: Parsed source with a status of "quarantined", "failed",
+            "cards", "filtered", "unowned" or "parsed" and the data the write
+            stage needs
+        """
+        start = time.perf_counter()
+        parsed = {'source': vcf_path, 'status': 'parsed'}
+        try:
+            if not self.retry_failed:
+                with self._state_lock:
+                    entry = self._get_quarantine(destinations[0].path).lookup(vcf_path)
+                if entry is not None:
+                    parsed.update(status='quarantined', error=entry['error'])
+                    parsed['seconds'] = time.perf_counter() - start
+                    return parsed
+
+            if self.card_index:
+                with self._state_lock:
+                    index = self._get_card_index(destinations[0].path)
+                    indexed = index.contains(vcf_path)
+                cards = index.scan(vcf_path)
+                # A file that was indexed stays indexed, so notes of cards it lost are removed
+                if len(cards) > 1 or indexed:
+                    parsed.update(status='cards', cards=cards)
+                    parsed['seconds'] = time.perf_counter() - start
+                    return parsed
+
+            data = None
+            if self.shard is not None:
+                data = self._read_source(vcf_path)
+                if not self.shard.owns_content(data, vcf_path):
+                    parsed['status'] = 'unowned'
+                    parsed['seconds'] = time.perf_counter() - start
+                    return parsed
+
+            # Read VCF file, applying filters before parsing where possible
+            selected = destinations
+            state_path = destinations[0].path
+            if self.contact_filter or any(destination.filter for destination in destinations):
+                with open(vcf_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+                def parse_content():
+                    return self._parse_cached(
+                        state_path, content.encode('utf-8'),
+                        lambda: self.reader.read_record(content=content),
+                    )
+
+                selected, vcard = self._select_destinations(destinations, content, parse_content)
+                if not selected:
+                    parsed['status'] = 'filtered'
+                    parsed['seconds'] = time.perf_counter() - start
+                    return parsed
+                if vcard is None:
+                    vcard = parse_content()
+            elif self.parse_cache or data is not None:
+                if data is None:
+                    data = self._read_source(vcf_path)
+                vcard = self._parse_cached(state_path, data, lambda: self.reader.read_record(data=data))
+            elif self._directory_cache is not None:
+                vcard = self.reader.read_record(data=self._read_source(vcf_path))
+            else:
+                vcard = self.reader.read_record(vcf_path)
+
+            # Generate filename
+            parsed.update(
+                vcard=vcard,
+                selected=selected,
+                filename=self.filename_gen.generate_filename(vcard, vcf_path),
+                rev=self._source_rev(vcard, vcf_path),
+            )
+        except Exception as e:
+            parsed.update(status='failed', error=e)
+        parsed['seconds'] = time.perf_counter() - start
+        return parsed
+
+    def _write_source(self, parsed, destinations):
+        """
+        Write the notes of a parsed VCF file and report the outcome.
+
+        This is the write stage of a conversion: skip checks, rendering,
+        writing, and all quarantine and index bookkeeping happen here.
+
+        Args:
+            parsed (dict): Parsed source as returned by _parse_source()
+            destinations (list): Destination objects
+
+        Returns:
+            ConversionResult: Outcome of the conversion
+        """
+        start = time.perf_counter()
+        vcf_path = parsed['source']
+        quarantine = self._get_quarantine(destinations[0].path)
+        notes = []
+
+        def result(status, error=None):
+            return ConversionResult(
+                vcf_path, status, notes, error,
+                parsed['seconds'], time.perf_counter() - start,
+            )
+
+        if parsed['status'] == 'quarantined':
+            print(f"Quarantined: {vcf_path.name} (unchanged since it failed: {parsed['error']})")
+            self.failures.append((vcf_path, parsed['error']))
+            with self._state_lock:
+                self._save_state(quarantine)
+            return result('quarantined', parsed['error'])
+
+        try:
+            if parsed['status'] == 'failed':
+                raise parsed['error']
+
+            if parsed['status'] == 'cards':
+                cards_parsed = {}
+                results = [
+                    self._convert_indexed_cards(
+                        vcf_path, destination, [dict(card) for card in parsed['cards']],
+                        cards_parsed, notes,
+                    )
+                    for destination in destinations
+                ]
+                return result('converted' if all(results) else 'failed')
+
+            if parsed['status'] == 'unowned':
+                self.unowned += 1
+                return result('unowned')
+
+            if parsed['status'] == 'filtered':
+                print(f"Filtered: {vcf_path.name} (excluded by filter)")
+                with self._state_lock:
+                    quarantine.clear(vcf_path)
+                    self._save_state(quarantine)
+                return result('filtered')
+
+            vcard = parsed['vcard']
+            rev = parsed['rev']
+            note_rev = rev or datetime.now(timezone.utc).replace(microsecond=0)
+            renders = {}
+
+            for destination in parsed['selected']:
+                output_file = destination.path / f"{parsed['filename']}.md"
+                target = output_file.name if len(destinations) == 1 else output_file
+                source_map = self._get_source_map(destination.path)
+                if source_map is not None:
+                    source_map.update(vcf_path, [output_file])
+
+                # Check if we should skip conversion based on modification times
+                if self._should_skip_conversion(vcf_path, output_file, rev):
+                    if self.mirror_mtime:
+                        reason = "mtime unchanged"
+                    elif rev is None:
+                        reason = "VCF not newer than markdown"
+                    else:
+                        reason = "REV unchanged"
+                    print(f"Skipped: {vcf_path.name} -> {target} ({reason})")
+                    catalog = self._get_catalog(destination.path)
+                    if catalog is not None:
+                        catalog.update(vcard, output_file)
+                    continue
+
+                self._write_note(
+                    vcard, vcf_path, destination.path, output_file, note_rev,
+                    destination.photos, renders, background=True,
+                )
+                notes.append(output_file)
+                print(f"Converted: {vcf_path.name} -> {target}")
+
+            with self._state_lock:
+                quarantine.clear(vcf_path)
+                self._save_state(quarantine)
+            return result('converted' if notes else 'skipped')
+
+        except Exception as e:
+            print(f"Error converting {vcf_path}: {e}")
+            self.failures.append((vcf_path, str(e)))
+            with self._state_lock:
+                quarantine.record(vcf_path, e)
+                self._save_state(quarantine)
+            return result('failed', str(e))
+
+    def _write_note(self, vcard, vcf_path, output_dir, output_file, rev=None, photos="embed",
+                    renders=None, background=False):
+        """
+        Render a vCard and write it to its Markdown note.
+
+        Existing notes with the same UID but a different filename are removed
+        so that renamed contacts do not leave stale notes behind. With
+        preserve_body, an existing note is updated in place instead, and a
+        renamed contact's note is moved to its new filename rather than
+        removed.
+
+        With background set and a write pool running, the note itself is
+        written on the pool and the indexes are updated right away; the
+        caller collects the outcome of the write from the pool.
+
+        Args:
+            vcard (ContactRecord): Parsed card
+            vcf_path (Path): Path to the source VCF file
+            output_dir (Path): Output directory for Markdown files
+            output_file (Path): Path of the note to write
+            rev (datetime, optional): REV to write; defaults to the current time
+            photos (str): Photo mode of the destination
+            renders (dict, optional): Notes already rendered for this vCard and
+                REV, keyed by photo mode; filled in and reused across destinations
+            background (bool): Write the note on the write pool, if there is one
+        """
+        # Generate markdown content
+        if rev is None:
+            rev = datetime.now(timezone.utc).replace(microsecond=0)
+        if renders is None:
+            renders = {}
+        markdown_content = renders.get(photos)
+        if markdown_content is None:
+            markdown_content = self.writer.generate_obsidian_markdown(vcard, rev, photos)
+            renders[photos] = markdown_content
+        uid = vcard.uid
+        index = self._get_vault_index(output_dir)
+        catalog = self._get_catalog(output_dir)
+
+        self._wait_for_write(output_file)
+        exists = index.contains(output_file) if index is not None else self._exists(output_file)
+
+        # Remove existing files with the same UID if the filename would be different
+        if uid:
+            existing_files = self._find_existing_files_with_uid(output_dir, uid)
+            for existing_file in existing_files:
+                if existing_file != output_file:
+                    self._wait_for_write(existing_file)
+                    try:
+                        if self.preserve_body and not exists:
+                            existing_file.rename(output_file)
+                            self._file_changed(existing_file, removed=True)
+                            self._file_changed(output_file)
+                            exists = True
+                            if index is not None:
+                                index.remove(existing_file)
+                            print(f"Renamed: {existing_file.name} -> {output_file.name}")
+                            continue
+                        existing_file.unlink()
+                        self._file_changed(existing_file, removed=True)
+                        if index is not None:
+                            index.remove(existing_file)
+                        if catalog is not None:
+                            catalog.remove(existing_file)
+                        print(f"Removed old file: {existing_file.name}")
+                    except Exception as e:
+                        print(
+                            f"Warning: Could not remove old file {existing_file.name}: {e}"
+                        )
+
+        times = None
+        if self.mirror_mtime:
+            source_stat = self._stat(vcf_path)
+            times = (source_stat.st_atime_ns, source_stat.st_mtime_ns)
+
+        # Write Markdown file
+        def write():
+            if self.preserve_body and exists:
+                self.updater.update(output_file, markdown_content)
+            elif self._directory_cache is not None:
+                self._write_text(output_file, markdown_content, times)
+                return
+            else:
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(markdown_content)
+
+            if times is not None:
+                os.utime(output_file, ns=times)
+
+        if background and self._write_pool is not None:
+            self._write_pool.submit(output_file, write)
+        else:
+            write()
+        self._file_changed(output_file)
+
+        if index is not None:
+            index.update(output_file, uid, rev, RENDERER_VERSION)
+        if catalog is not None:
+            catalog.update(vcard, output_file)
+
+    def _convert_indexed_cards(self, vcf_path, output_dir, cards, parsed=None, notes=None):
         """
-        Convert a single VCF file to Markdown format.
+        Convert the changed cards of a multi-card VCF file.
+
+        Cards whose content hash matches the stored index are skipped without
+        being decoded. Notes of cards that disappeared from the file are removed.
 
         Args:
             vcf_path (Path): Path to the VCF file
-            output_dir (Path): Output directory for Markdown files
+            output_dir: Output directory for Markdown files, or a Destination
+            cards (list): Card entries as returned by CardIndex.scan()
+            parsed (dict, optional): Cards already read for another
+                destination, keyed by content hash; filled in and reused
+            notes (list, optional): Collects the paths of written notes
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if every changed card was converted, False otherwise
         """
-        try:
-            # Read VCF file to get vcard for filename generation
-            vcard = self.reader.read_vcf_file(vcf_path)
-
-            # Generate filename
-            output_filename = self.filename_gen.generate_filename(vcard, vcf_path)
-            output_file = Path(output_dir) / f"{output_filename}.md"
+        destination = Destination.parse(output_dir)
+        output_dir = destination.path
+        index = self._get_card_index(output_dir)
+        catalog = self._get_catalog(output_dir)
+        positions = {id(card): position for position, card in enumerate(cards, 1)}
+        if self.shard is not None:
+            # Index only owned cards, so removals only ever touch this shard's notes
+            cards = [card for card in cards if self.shard.owns(card['uid'], vcf_path)]
+        changed, removed = index.diff(vcf_path, cards, output_dir, self.retry_failed)
+        changed_ids = {id(card) for card in changed}
+        changed.extend(
+            card for card in cards
+            if id(card) not in changed_ids and card.get('note') and not card.get('error')
+            and self._renderer_outdated(output_dir / card['note'])
+        )
+        if parsed is None:
+            parsed = {}
+        changed_ids = {id(card) for card in changed}
+        filtered_count = 0
+        success = True
 
-            # Check if we should skip conversion based on modification times
-            if self._should_skip_conversion(vcf_path, output_file):
-                print(f"Skipped: {vcf_path.name} -> {output_file.name} (VCF not newer than markdown)")
-                return True
+        for card in changed:
+            position = positions[id(card)]
+            try:
+                entry = parsed.setdefault(card['hash'], {'vcard': None, 'renders': {}})
+                if 'content' not in entry:
+                    entry['content'] = index.read_card(vcf_path, card)
 
-            # Generate markdown content
-            markdown_content = self.writer.generate_obsidian_markdown(vcard)
+                def parse():
+                    if entry['vcard'] is None:
+                        entry['vcard'] = self._parse_cached(
+                            output_dir, entry['content'].encode('utf-8'),
+                            lambda: self.reader.read_record(content=entry['content']),
+                        )
+                    return entry['vcard']
 
-            # Remove existing files with the same UID if the filename would be different
-            if hasattr(vcard, "uid") and vcard.uid and vcard.uid.value:
-                existing_files = self.filename_gen.find_existing_files_with_uid(
-                    output_dir, vcard.uid.value
+                if not self._select_destinations([destination], entry['content'], parse)[0]:
+                    filtered_count += 1
+                    continue
+                vcard = parse()
+                if 'filename' not in entry:
+                    entry['filename'] = self.filename_gen.generate_filename(vcard, vcf_path)
+                    entry['rev'] = (
+                        self._source_rev(vcard, vcf_path)
+                        or datetime.now(timezone.utc).replace(microsecond=0)
+                    )
+                output_file = output_dir / f"{entry['filename']}.md"
+                self._write_note(
+                    vcard, vcf_path, output_dir, output_file, entry['rev'],
+                    destination.photos, entry['renders'],
                 )
-                for existing_file in existing_files:
-                    if existing_file != output_file:
-                        try:
-                            existing_file.unlink()
-                            print(f"Removed old file: {existing_file.name}")
-                        except Exception as e:
-                            print(
-                                f"Warning: Could not remove old file {existing_file.name}: {e}"
-                            )
-
-            # Write Markdown file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
-
-            print(f"Converted: {vcf_path.name} -> {output_file.name}")
-            return True
+                card['note'] = output_file.name
+                if notes is not None:
+                    notes.append(output_file)
+                print(f"Converted: {vcf_path.name} [card {position}] -> {output_file.name}")
+            except Exception as e:
+                print(f"Error converting {vcf_path} [card {position}]: {e}")
+                self.failures.append((f"{vcf_path} [card {position}]", str(e)))
+                card['error'] = str(e)
+                success = False
 
-        except Exception as e:
-            print(f"Error converting {vcf_path}: {e}")
-            return False
+        for card in cards:
+            if card.get('error') and id(card) not in changed_ids:
+                position = positions[id(card)]
+                print(f"Quarantined: {vcf_path.name} [card {position}] (unchanged since it failed: {card['error']})")
+                self.failures.append((f"{vcf_path} [card {position}]", card['error']))
+                success = False
 
-    def convert_vcf_files_from_sources(
-        self, folder_sources, file_sources, output_dir, ignore_files=None, verbose=False
-    ):
+        current_notes = {card.get('note') for card in cards}
+        for card in removed:
+            note = card.get('note')
+            if not note or note in current_notes:
+                continue
+            try:
+                self._wait_for_write(Path(output_dir) / note)
+                (Path(output_dir) / note).unlink(missing_ok=True)
+                self._file_changed(Path(output_dir) / note, removed=True)
+                if catalog is not None:
+                    catalog.remove(note)
+                print(f"Removed old file: {note}")
+            except Exception as e:
+                print(f"Warning: Could not remove old file {note}: {e}")
+
+        unchanged_count = sum(1 for card in cards if card.get('note') and id(card) not in changed_ids)
+        if unchanged_count:
+            print(f"Skipped: {unchanged_count} unchanged card(s) in {vcf_path.name}")
+        if filtered_count:
+            print(f"Filtered: {filtered_count} card(s) in {vcf_path.name} (excluded by filter)")
+
+        index.update(vcf_path, [card for card in cards if card.get('note') or card.get('error')])
+        self._save_state(index)
+        source_map = self._get_source_map(output_dir)
+        if source_map is not None:
+            source_map.update(vcf_path, [card['note'] for card in cards if card.get('note')])
+        return success
+
+    def delete_sources(self, vcf_paths, output_dir):
         """
-        Convert VCF files from multiple sources (folders and individual files) to Markdown format.
+        Remove the notes of VCF files that were deleted.
+
+        Notes are found through the source map, so the deleted files never
+        have to be read. Their card index, quarantine, and catalog entries
+        are dropped as well. The vault lock is held while notes are removed.
+
+        Args:
+            vcf_paths (iterable): Paths of the deleted VCF files
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+
+        Returns:
+            list: One ConversionResult per file, with status "deleted", or
+            "failed" if the file still exists or nothing is known about it
+        """
+        destinations = self._destinations(output_dir)
+        results = []
+        locks = self._lock_destinations(destinations)
+        if locks is None:
+            return results
+        try:
+            for vcf_path in map(Path, vcf_paths):
+                if vcf_path.exists():
+                    error = "source still exists; delete the file first"
+                    print(f"Error deleting {vcf_path}: {error}")
+                    results.append(ConversionResult(vcf_path, "failed", error=error))
+                    continue
+
+                notes = []
+                known = False
+                for destination in destinations:
+                    source_map = self._get_source_map(destination.path)
+                    names = source_map.pop(vcf_path) if source_map is not None else []
+                    known = known or bool(names)
+                    index = self._get_vault_index(destination.path)
+                    catalog = self._get_catalog(destination.path)
+                    for name in names:
+                        note = destination.path / name
+                        note.unlink(missing_ok=True)
+                        if index is not None:
+                            index.remove(note)
+                        if catalog is not None:
+                            catalog.remove(note)
+                        notes.append(note)
+                        print(f"Removed: {name} ({vcf_path.name} was deleted)")
+                    card_index = self._get_card_index(destination.path)
+                    if card_index.remove(vcf_path):
+                        card_index.save()
+                    quarantine = self._get_quarantine(destination.path)
+                    quarantine.clear(vcf_path)
+                    quarantine.save()
+
+                if known:
+                    results.append(ConversionResult(vcf_path, "deleted", notes))
+                else:
+                    error = "no notes are recorded for this source"
+                    print(f"Error deleting {vcf_path}: {error}")
+                    results.append(ConversionResult(vcf_path, "failed", error=error))
+        finally:
+            self._save_run_state()
+            for lock in locks:
+                lock.release()
+        return results
+
+    def discover_vcf_files(self, folder_sources, file_sources, ignore_files=None, verbose=False):
+        """
+        Find the VCF files to convert, yielding each one as soon as it is found.
 
-        This method collects VCF files from the specified sources, applies ignore filters,
-        and processes them directly using convert_vcf_to_markdown.
+        Ignore entries that name an existing file exclude exactly that file.
+        All other entries are patterns for IgnoreMatcher, combined with the
+        .vcfignore file at the root of each source folder, and are applied
+        while the folder is traversed. An entry without glob characters that
+        ignored nothing is reported with a warning once all files are found.
 
         Args:
             folder_sources (list): List of Path objects for directories containing VCF files
             file_sources (list): List of Path objects for individual VCF files
-            output_dir (Path): Output directory for Markdown files
-            ignore_files (list, optional): List of Path objects for files to ignore
+            ignore_files (list, optional): Files to ignore, or ignore patterns
             verbose (bool): Whether to enable verbose output
 
-        Returns:
-            tuple: (successful_count, total_count, all_vcf_files)
+        Yields:
+            Path: Each VCF file to convert, without duplicates
         """
         import click
 
-        # Collect all VCF files to process
-        all_vcf_files = []
+        # Split the ignore list into exact files and patterns
+        ignore_paths = set()
+        matcher = IgnoreMatcher()
+        for ignore_entry in ignore_files or []:
+            if Path(ignore_entry).is_file():
+                ignore_paths.add(str(Path(ignore_entry).resolve()))
+                if verbose:
+                    click.echo(f"Will ignore file: '{ignore_entry}'")
+            else:
+                matcher.add([str(ignore_entry)])
+                if verbose:
+                    click.echo(f"Will ignore pattern: '{ignore_entry}'")
+
+        # Yield each VCF file once
         processed_paths = set()  # Track processed file paths to avoid duplicates
+        ignored_count = 0
 
-        # Process folder sources
+        # Process folder sources; each folder is resolved once, not each file
         for source_path in folder_sources:
             if not source_path.is_dir():
                 if verbose:
@@ -167,34 +1320,40 @@ class VCFConverter:
                     )
                 continue
 
-            # Find all VCF files in this directory
-            vcf_files = list(source_path.glob("*.vcf")) + list(
-                source_path.glob("*.VCF")
-            )
+            source_root = str(source_path.resolve())
+            source_matcher = matcher.with_file(source_path / IGNORE_FILE_NAME)
+            found_count = 0
             new_files_count = 0
-            for vcf_file in vcf_files:
-                absolute_path = vcf_file.resolve()
-                if absolute_path not in processed_paths:
-                    all_vcf_files.append(vcf_file)
+            for vcf_file, relative_path in source_matcher.walk(
+                source_path, self.recursive, self._directory_cache
+            ):
+                found_count += 1
+                absolute_path = os.path.join(source_root, relative_path)
+                if absolute_path in ignore_paths:
+                    ignored_count += 1
+                elif absolute_path not in processed_paths:
+                    yield vcf_file
                     processed_paths.add(absolute_path)
                     new_files_count += 1
 
             if verbose:
-                if new_files_count < len(vcf_files):
+                if new_files_count < found_count:
                     click.echo(
-                        f"Found {len(vcf_files)} VCF file(s) in '{source_path}' ({new_files_count} new, {len(vcf_files) - new_files_count} duplicates)"
+                        f"Found {found_count} VCF file(s) in '{source_path}' ({new_files_count} new, {found_count - new_files_count} duplicates or ignored)"
                     )
                 else:
-                    click.echo(f"Found {len(vcf_files)} VCF file(s) in '{source_path}'")
+                    click.echo(f"Found {found_count} VCF file(s) in '{source_path}'")
 
         # Process individual file sources
         for file_path in file_sources:
-            if not file_path.exists():
+            try:
+                mode = self._stat(file_path).st_mode
+            except OSError:
                 if verbose:
                     click.echo(f"Error: File '{file_path}' does not exist.", err=True)
                 continue
 
-            if not file_path.is_file():
+            if not stat.S_ISREG(mode):
                 if verbose:
                     click.echo(f"Error: Path '{file_path}' is not a file.", err=True)
                 continue
@@ -207,9 +1366,11 @@ class VCFConverter:
                         err=True,
                     )
 
-            absolute_path = file_path.resolve()
-            if absolute_path not in processed_paths:
-                all_vcf_files.append(file_path)
+            absolute_path = str(file_path.resolve())
+            if absolute_path in ignore_paths or matcher.matches(file_path.name):
+                ignored_count += 1
+            elif absolute_path not in processed_paths:
+                yield file_path
                 processed_paths.add(absolute_path)
 
                 if verbose:
@@ -218,44 +1379,584 @@ class VCFConverter:
                 if verbose:
                     click.echo(f"Skipping duplicate file: '{file_path}'")
 
-        # Process ignore list - remove specified files from the conversion list
-        if ignore_files:
-            ignore_paths = set()
-            for ignore_path in ignore_files:
-                absolute_ignore_path = ignore_path.resolve()
-                ignore_paths.add(absolute_ignore_path)
+        if ignored_count > 0 and verbose:
+            click.echo(f"Ignored {ignored_count} file(s)")
+
+        # A literal entry that is neither a file nor matched anything is most likely a typo
+        for pattern in matcher.unmatched():
+            click.echo(
+                f"Warning: --ignore '{pattern}' is not an existing file and matched no path.",
+                err=True,
+            )
+
+    def _prepare_destinations(self, output_dir, verbose=False):
+        """
+        Create destination directories and preload their existing notes.
+
+        Args:
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            verbose (bool): Whether to enable verbose output
+
+        Returns:
+            list: List of Destination objects
+        """
+        import click
+
+        # Create destination directories
+        destinations = self._destinations(output_dir)
+        for destination in destinations:
+            destination.path.mkdir(parents=True, exist_ok=True)
+            if verbose:
+                click.echo(f"Destination directory: '{destination.path}'")
+
+            if self.preload:
+                index = self.preload_vault(destination.path, self._changed_sources)
                 if verbose:
-                    click.echo(f"Will ignore file: '{ignore_path}'")
-
-            # Filter out ignored files
-            initial_count = len(all_vcf_files)
-            all_vcf_files = [
-                vcf_file
-                for vcf_file in all_vcf_files
-                if vcf_file.resolve() not in ignore_paths
-            ]
-            ignored_count = initial_count - len(all_vcf_files)
-
-            if ignored_count > 0 and verbose:
-                click.echo(f"Ignored {ignored_count} file(s)")
-
-        # Create destination directory
-        output_dir.mkdir(parents=True, exist_ok=True)
-        if verbose:
-            click.echo(f"Destination directory: '{output_dir}'")
+                    click.echo(index.throughput())
 
         if verbose:
-            click.echo(f"Converting to Markdown in '{output_dir}'")
+            for destination in destinations:
+                click.echo(f"Converting to Markdown in '{destination.path}'")
+
+        self._keep_filter_fields(destinations)
+        return destinations
+
+    def iter_convert(
+        self, folder_sources, file_sources, output_dir, ignore_files=None, verbose=False,
+        queue_size=64,
+    ):
+        """
+        Convert VCF files from multiple sources, yielding a result per file as it completes.
+
+        Discovery, parsing, and writing run as three stages connected by
+        bounded queues: a discovery thread walks the sources, parse threads
+        read and parse files, and notes are written from the calling thread
+        as results are consumed. At most queue_size files are buffered
+        between stages, so memory stays flat however many files there are.
+        Closing the generator early stops the background stages.
+
+        Results are per file, not per contact. A multi-card file converted
+        with card_index yields one result listing the notes of all its
+        written cards; it fails if any card failed, and the failing cards
+        are recorded in self.failures.
+
+        A file whose parse raises outside the per-file error handling fails
+        like any other file, so a worker error never stalls the pass.
+
+        Unless both are pinned, the number of parse threads and of threads
+        writing notes is chosen by self.autotuner once the first files of
+        the run have been measured, and the choice is printed so it can be
+        pinned. With several write threads, a file's result is yielded once
+        its notes are on disk; a note that cannot be written fails its file.
+
+        With max_seconds set, all files are discovered and ordered by
+        WorkScheduler before conversion starts: files deferred by the last
+        run first, then by modification time, newest first. Once the budget
+        is spent no further notes are written; the remaining files are left
+        in self.deferred and persisted so the next run starts with them.
+
+        Each destination's vault lock is held for the whole pass, so
+        overlapping runs never clean up or rewrite the same notes. With the
+        "coalesce" lock mode, a run that finds the vault locked yields
+        nothing and sets self.coalesced; the running instance then makes
+        one more pass after its current one, which covers any number of
+        coalesced runs.
+
+        Args:
+            folder_sources (list): List of Path objects for directories containing VCF files
+            file_sources (list): List of Path objects for individual VCF files
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            ignore_files (list, optional): Files to ignore, or ignore patterns
+            verbose (bool): Whether to enable verbose output
+            queue_size (int): Maximum number of files waiting between stages
+
+        Yields:
+            ConversionResult: Outcome of each file, in discovery order; a
+            file appears once per pass
+
+        Raises:
+            VaultLocked: If a destination is locked and the lock mode is "fail"
+        """
+        self.coalesced = False
+        destinations = self._destinations(output_dir)
+        locks = self._lock_destinations(destinations)
+        if locks is None:
+            self.coalesced = True
+            return
+        run = self._start_run()
+        try:
+            while True:
+                run['passes'] += 1
+                for result in self._convert_pass(
+                    folder_sources, file_sources, destinations, ignore_files, verbose, queue_size, run
+                ):
+                    run['counts'][result.status] = run['counts'].get(result.status, 0) + 1
+                    run['stages']['parse'] += result.parse_seconds
+                    run['stages']['write'] += result.write_seconds
+                    yield result
+                for lock in locks:
+                    lock.release()
+                if not self._take_pass_requests(locks):
+                    break
+                print("Starting another pass requested by a run that was coalesced into this one")
+                self.forget_state()
+            run['complete'] = True
+            if self.count_syscalls:
+                print(self.syscalls.describe(sum(run['counts'].values()), run['counts'].get('converted', 0)))
+        finally:
+            self.syscalls.stop()
+            self._record_run(run, destinations)
+            for lock in locks:
+                lock.release()
+
+    def _start_run(self):
+        """
+        Start measuring a run for its history record.
+
+        Returns:
+            dict: Run measurements, filled in while the run goes on
+        """
+        self.syscalls = SyscallCounter()
+        if self.count_syscalls:
+            self.syscalls.start()
+        return {
+            'at': RunHistory.timestamp(),
+            'started': time.perf_counter(),
+            'io': RunHistory.io_counters(),
+            'passes': 0,
+            'counts': {},
+            'stages': {'discover': 0.0, 'parse': 0.0, 'write': 0.0},
+            'complete': False,
+        }
+
+    def _record_run(self, run, destinations):
+        """
+        Append the record of a finished run to the history of each destination.
+
+        Args:
+            run (dict): Run measurements from _start_run()
+            destinations (list): Destination objects
+        """
+        if not self.history:
+            return
+        record = {
+            'version': 1,
+            'at': run['at'],
+            'seconds': round(time.perf_counter() - run['started'], 3),
+            'files': sum(run['counts'].values()),
+            'counts': run['counts'],
+            'stages': {stage: round(seconds, 3) for stage, seconds in run['stages'].items()},
+            'passes': run['passes'],
+            'complete': run['complete'],
+            'workers': self.autotuner.to_dict(),
+            'peak_rss_kb': RunHistory.peak_rss_kb(),
+        }
+        io = RunHistory.io_counters()
+        if io is not None and run['io'] is not None:
+            record['bytes_read'] = io[0] - run['io'][0]
+            record['bytes_written'] = io[1] - run['io'][1]
+        if self.deferred:
+            record['deferred'] = len(self.deferred)
+        if self.shard is not None:
+            record['shard'] = str(self.shard)
+        if self.count_syscalls:
+            record['syscalls'] = dict(self.syscalls.counts)
+        for path in sorted({destination.path for destination in destinations}):
+            try:
+                RunHistory(self._state_file(path, "history.jsonl")).append(record)
+            except OSError as e:
+                print(f"Warning: Could not record run history in {path}: {e}")
+
+    def _lock_destinations(self, destinations):
+        """
+        Take the vault lock of every destination.
+
+        Locks are taken in path order, so runs with overlapping
+        destinations cannot deadlock.
+
+        Args:
+            destinations (list): Destination objects
+
+        Returns:
+            list or None: The VaultLock objects held, or None if the run was
+            coalesced into a running instance
+
+        Raises:
+            VaultLocked: If a destination is locked and the lock mode is "fail"
+        """
+        if self.lock is None:
+            return []
+        locks = [
+            VaultLock(self._state_file(path, "vault.lock"), self.lock)
+            for path in sorted({destination.path for destination in destinations})
+        ]
+        held = []
+        try:
+            for lock in locks:
+                if self.lock == "wait" and not lock.try_acquire():
+                    print(f"Waiting: {lock.describe_holder()}")
+                if not lock.acquire():
+                    print(f"Coalesced: {lock.describe_holder()}; it will make another pass for this run")
+                    for other in held:
+                        other.release()
+                    return None
+                held.append(lock)
+        except BaseException:
+            for other in held:
+                other.release()
+            raise
+        return locks
+
+    def _take_pass_requests(self, locks):
+        """
+        Take the locks again if a coalesced run asked for another pass.
+
+        Call this after releasing the locks. A request is consumed only
+        once every lock is held again; if another run took a lock first,
+        the request is left for that run.
+
+        Args:
+            locks (list): VaultLock objects of the destinations
+
+        Returns:
+            bool: True if another pass was requested and the locks are held
+        """
+        if not any(lock.requested for lock in locks):
+            return False
+        for index, lock in enumerate(locks):
+            if not lock.try_acquire():
+                for other in locks[:index]:
+                    other.release()
+                return False
+        for lock in locks:
+            lock.clear_request()
+        return True
+
+    def _convert_pass(self, folder_sources, file_sources, destinations, ignore_files, verbose, queue_size,
+                      run=None):
+        """
+        Make one pass over the sources; the body of iter_convert.
+
+        Args:
+            folder_sources (list): List of Path objects for directories containing VCF files
+            file_sources (list): List of Path objects for individual VCF files
+            destinations (list): Destination objects
+            ignore_files (list): Files to ignore, or ignore patterns
+            verbose (bool): Whether to enable verbose output
+            queue_size (int): Maximum number of files waiting between stages
+            run (dict, optional): Run measurements; discovery time is added
+
+        Yields:
+            ConversionResult: Outcome of each file, in discovery order
+        """
+        deadline = None if self.max_seconds is None else time.monotonic() + self.max_seconds
+        if self.low_syscall:
+            self._directory_cache = DirectoryCache(self.syscalls)
+        destinations = self._prepare_destinations(destinations, verbose)
+        scheduler = None
+        if deadline is not None:
+            scheduler = WorkScheduler(self._state_file(destinations[0].path, "deferred.json"))
+        scheduled = []
+        self.deferred = []
+        discovered = queue.Queue(maxsize=queue_size)
+        parsed_sources = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        tuner = self.autotuner
+        tuner.start()
+
+        def put(target, item):
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(source):
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return _STAGE_DONE
+
+        def discover():
+            # Time spent waiting for the parse stage does not count as discovery
+            started = time.perf_counter()
+            waited = 0.0
+            position = 0
+            try:
+                sources = self.discover_vcf_files(folder_sources, file_sources, ignore_files, verbose)
+                if scheduler is not None:
+                    scheduled.extend(scheduler.order(sources))
+                    sources = scheduled
+                for vcf_file in sources:
+                    put_started = time.perf_counter()
+                    if not put(discovered, (position, vcf_file)):
+                        return
+                    waited += time.perf_counter() - put_started
+                    position += 1
+            except Exception as e:
+                put(discovered, (position, e))
+                return
+            finally:
+                if run is not None:
+                    run['stages']['discover'] += time.perf_counter() - started - waited
+            put(discovered, (position, _STAGE_DONE))
+
+        def parse():
+            position = None
+            try:
+                while True:
+                    item = get(discovered)
+                    if item is _STAGE_DONE:
+                        return
+                    position, vcf_file = item
+                    if vcf_file is _STAGE_DONE or isinstance(vcf_file, Exception):
+                        # Leave the end of the input for the other parse threads
+                        put(discovered, item)
+                        put(parsed_sources, item)
+                        return
+                    # Thread CPU time is a system call, so it is read only while sampling
+                    sampling = tuner.sampling
+                    if sampling:
+                        wall, cpu = time.perf_counter(), time.thread_time()
+                    try:
+                        parsed = self._parse_source(vcf_file, destinations)
+                    except Exception as e:
+                        parsed = {'source': vcf_file, 'status': 'failed', 'error': e, 'seconds': 0.0}
+                    if sampling:
+                        tuner.record('parse', time.perf_counter() - wall, time.thread_time() - cpu)
+                    if not put(parsed_sources, (position, parsed)):
+                        return
+                    position = None
+            except Exception as e:
+                # The consumer waits for every position, so an error must reach it
+                # like discovery errors do, or the run would never end
+                if position is not None:
+                    put(parsed_sources, (position, e))
+
+        threads = [threading.Thread(target=discover, name="vcf-discover", daemon=True)]
+
+        def start_workers(parse_workers, write_workers):
+            while len(threads) <= parse_workers:
+                thread = threading.Thread(target=parse, name=f"vcf-parse-{len(threads)}", daemon=True)
+                threads.append(thread)
+                thread.start()
+            if write_workers > 1 and self._write_pool is None:
+                self._write_pool = WritePool(write_workers)
+
+        threads[0].start()
+        start_workers(tuner.parse_workers, tuner.write_workers)
+        try:
+            written = 0
+            # Parse threads finish files out of order; results are yielded in discovery order
+            early = {}
+            writing = deque()
+            while True:
+                if written in early:
+                    item = early.pop(written)
+                else:
+                    position, item = parsed_sources.get()
+                    if position != written:
+                        early[position] = item
+                        continue
+                if item is _STAGE_DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.deferred = scheduled[written:]
+                    break
+                sampling = tuner.sampling and self._write_pool is None
+                if sampling:
+                    wall, cpu = time.perf_counter(), time.thread_time()
+                result = self._write_source(item, destinations)
+                if sampling:
+                    tuner.record('write', time.perf_counter() - wall, time.thread_time() - cpu)
+                if self._write_pool is None:
+                    yield result
+                else:
+                    writing.append((result, self._write_pool.take()))
+                    while writing and (
+                        len(writing) > queue_size or all(future.done() for future in writing[0][1])
+                    ):
+                        yield self._finish_writes(*writing.popleft(), destinations)
+                written += 1
+                if tuner.ready:
+                    start_workers(*tuner.tune())
+                    print(tuner.describe())
+            while writing:
+                yield self._finish_writes(*writing.popleft(), destinations)
+            if scheduler is not None:
+                scheduler.defer(self.deferred)
+                scheduler.save()
+            if verbose:
+                import click
+                for cache in self._parse_caches.values():
+                    click.echo(f"Parse cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+        finally:
+            stop.set()
+            tuner.stop()
+            for thread in threads:
+                thread.join()
+            if self._write_pool is not None:
+                self._write_pool.close()
+                self._write_pool = None
+            self._save_run_state()
+            self._directory_cache = None
+
+    def _finish_writes(self, result, writes, destinations):
+        """
+        Wait for the background writes of a file and fail it if one failed.
+
+        Args:
+            result (ConversionResult): Result of the write stage
+            writes (list): Futures of the file's background writes
+            destinations (list): Destination objects
+
+        Returns:
+            ConversionResult: The result, or a failed result if a note
+            could not be written
+        """
+        errors = [future.exception() for future in writes]
+        error = next((error for error in errors if error is not None), None)
+        if error is None:
+            return result
+        print(f"Error converting {result.source}: {error}")
+        self.failures.append((result.source, str(error)))
+        with self._state_lock:
+            quarantine = self._get_quarantine(destinations[0].path)
+            quarantine.record(result.source, error)
+            self._save_state(quarantine)
+        return ConversionResult(
+            result.source, 'failed', result.notes, str(error), result.parse_seconds, result.write_seconds,
+        )
+
+    def convert_vcf_files_from_sources(
+        self, folder_sources, file_sources, output_dir, ignore_files=None, verbose=False
+    ):
+        """
+        Convert VCF files from multiple sources (folders and individual files) to Markdown format.
+
+        This method collects the results of iter_convert into counts and the
+        list of processed files. If a coalesced run caused another pass, the
+        outcome of a file's last pass counts.
+
+        Args:
+            folder_sources (list): List of Path objects for directories containing VCF files
+            file_sources (list): List of Path objects for individual VCF files
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            ignore_files (list, optional): Files to ignore, or ignore patterns
+            verbose (bool): Whether to enable verbose output
+
+        Returns:
+            tuple: (successful_count, total_count, all_vcf_files)
+        """
+        results = {}
+        for result in self.iter_convert(folder_sources, file_sources, output_dir, ignore_files, verbose):
+            results.pop(result.source, None)
+            results[result.source] = result
+
+        successful_conversions = sum(1 for result in results.values() if result.ok)
+        all_vcf_files = list(results)
+        return successful_conversions, len(all_vcf_files), all_vcf_files
+
+    def iter_changes(self, paths, output_dir, ignore_files=None, verbose=False):
+        """
+        Convert only the VCF files a sync tool reported, removing the notes of deleted ones.
+
+        No source folder is listed. Paths that still exist are converted
+        like --file sources, and the vault is preloaded with just the notes
+        the source map records for them; deleted paths go to
+        delete_sources(). The source map is switched on, so the notes of
+        files converted here can be removed when they are deleted later.
+        With max_seconds set, files deferred by the last run are converted
+        along with the feed, first.
+
+        Args:
+            paths: A ChangeFeed, or an iterable of changed and deleted paths
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            ignore_files (list, optional): Files to ignore, or ignore patterns;
+                they apply to changed files only
+            verbose (bool): Whether to enable verbose output
+
+        Yields:
+            ConversionResult: Outcome of each deleted file, then of each
+            changed file
+
+        Raises:
+            VaultLocked: If a destination is locked and the lock mode is "fail"
+        """
+        feed = paths if isinstance(paths, ChangeFeed) else ChangeFeed(paths)
+        changed, deleted = feed.split()
+        self.source_map = True
+        if deleted:
+            yield from self.delete_sources(deleted, output_dir)
+        if self.max_seconds is not None:
+            destination = self._destinations(output_dir)[0]
+            scheduler = WorkScheduler(self._state_file(destination.path, "deferred.json"))
+            changed += [Path(deferred_path) for deferred_path in scheduler.deferred]
+        if not changed:
+            return
+        self._changed_sources = changed
+        try:
+            yield from self.iter_convert([], changed, output_dir, ignore_files, verbose)
+        finally:
+            self._changed_sources = None
+
+    def process_changes(self, feed, obsidian, verbose, ignore):
+        """
+        Process a change feed from the CLI and report the results.
+
+        Args:
+            feed (ChangeFeed): Changed and deleted source paths
+            obsidian: Destination directory for Markdown files, or a list of
+                destination specifications
+            verbose: Boolean flag for verbose output
+            ignore: Tuple/list of VCF file paths to ignore
+        """
+        import click
+        import sys
+
+        if not feed.paths:
+            click.echo("No changed VCF files to process.")
+            return
+
+        results = {}
+        try:
+            for result in self.iter_changes(feed, obsidian, list(ignore) if ignore else [], verbose):
+                results.pop(result.source, None)
+                results[result.source] = result
+        except VaultLocked as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(EXIT_LOCKED)
+
+        if self.coalesced:
+            return
 
-        # Convert each VCF file to the destination directly
-        successful_conversions = 0
-        total_conversions = len(all_vcf_files)
+        deleted = sum(1 for result in results.values() if result.status == "deleted")
+        successful = sum(1 for result in results.values() if result.ok)
+        click.echo(f"Found {len(feed.paths)} changed VCF file(s), {deleted} of them deleted")
+        click.echo(f"Successfully completed {successful}/{len(results)} changes.")
 
-        for vcf_file in all_vcf_files:
-            if self.convert_vcf_to_markdown(vcf_file, output_dir):
-                successful_conversions += 1
+        if self.deferred:
+            click.echo(
+                f"Deferred: {len(self.deferred)} file(s) after the {self.max_seconds:g}s time budget ran out; "
+                "the next run converts them first."
+            )
 
-        return successful_conversions, total_conversions, all_vcf_files
+        failed = [result for result in results.values() if not result.ok]
+        if failed:
+            click.echo(f"Failed: {len(failed)} source(s)")
+            for result in failed:
+                click.echo(f"  {result.source}: {result.error}")
+            sys.exit(1)
 
     def process_tasks(self, folder, obsidian, file, verbose, ignore):
         """
@@ -266,7 +1967,8 @@ class VCFConverter:
 
         Args:
             folder: Tuple/list of folder paths containing VCF files
-            obsidian: Path to destination directory for Markdown files
+            obsidian: Destination directory for Markdown files, or a list of
+                destination specifications
             file: Tuple/list of individual VCF file paths to process
             verbose: Boolean flag for verbose output
             ignore: Tuple/list of VCF file paths to ignore
@@ -303,18 +2005,25 @@ class VCFConverter:
         ignore_files = list(ignore) if ignore else []
 
         # Use existing method to handle the conversion
-        successful_conversions, total_conversions, all_vcf_files = (
-            self.convert_vcf_files_from_sources(
-                folder_sources=folder_sources,
-                file_sources=file_sources,
-                output_dir=obsidian,
-                ignore_files=ignore_files,
-                verbose=verbose,
+        try:
+            successful_conversions, total_conversions, all_vcf_files = (
+                self.convert_vcf_files_from_sources(
+                    folder_sources=folder_sources,
+                    file_sources=file_sources,
+                    output_dir=obsidian,
+                    ignore_files=ignore_files,
+                    verbose=verbose,
+                )
             )
-        )
+        except VaultLocked as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(EXIT_LOCKED)
+
+        if self.coalesced:
+            return
 
         # Handle edge cases for messaging
-        if not all_vcf_files:
+        if not all_vcf_files and not self.deferred:
             if not folder_sources and not file_sources:
                 click.echo("No VCF files found to process.", err=True)
             else:
@@ -325,7 +2034,232 @@ class VCFConverter:
             sys.exit(1)
 
         # Report final results
-        click.echo(f"Found {len(all_vcf_files)} VCF file(s) to process")
+        click.echo(f"Found {len(all_vcf_files) + len(self.deferred)} VCF file(s) to process")
         click.echo(
             f"Successfully completed {successful_conversions}/{len(all_vcf_files)} conversions."
         )
+
+        if self.unowned:
+            click.echo(f"Shard {self.shard}: {self.unowned} file(s) belong to other shards")
+
+        if self.deferred:
+            click.echo(
+                f"Deferred: {len(self.deferred)} file(s) after the {self.max_seconds:g}s time budget ran out; "
+                "the next run converts them first."
+            )
+            if verbose:
+                for deferred_path in self.deferred:
+                    click.echo(f"  {deferred_path}")
+
+        if self.failures:
+            click.echo(f"Failed: {len(self.failures)} source(s)")
+            for failed_path, error in self.failures:
+                click.echo(f"  {failed_path}: {error}")
+            if not self.retry_failed:
+                click.echo("Unchanged failed sources are skipped on later runs; use --retry-failed to retry them.")
+
+    def show_stats(self, output_dir, limit=20):
+        """
+        Print the recent runs recorded in each destination's history.
+
+        Args:
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            limit (int): Number of most recent runs listed
+
+        Returns:
+            bool: True if the latest run of any destination regressed
+            compared with the runs before it
+        """
+        import click
+
+        regressed = False
+        for destination in self._destinations(output_dir):
+            history = RunHistory(self._state_file(destination.path, "history.jsonl"))
+            lines, latest_regressed = history.report(limit)
+            click.echo(f"Runs converting into '{destination.path}':")
+            for line in lines:
+                click.echo(line)
+            if latest_regressed:
+                click.echo("Warning: The latest run regressed compared with the runs before it", err=True)
+                regressed = True
+        return regressed
+
+    def merge_shards(self, output_dir, verbose=False):
+        """
+        Reconcile the state written by the shards of a run into unsharded state.
+
+        For every destination, the per-shard card indexes, quarantine
+        caches, deferred lists, source maps, and contact catalogs are combined into the
+        files an unsharded run uses; the catalog also gets its index note.
+        The shard files are kept, so the shards can keep running
+        incrementally.
+
+        Args:
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            verbose (bool): Whether to enable verbose output
+
+        Returns:
+            bool: True if the state of every shard was found and no UID was
+            claimed by more than one shard
+        """
+        import click
+
+        complete = True
+        for destination in self._destinations(output_dir):
+            state_dir = self._state_dir(destination.path)
+            shards = {}
+            for path in sorted(state_dir.glob("*.shard-*-of-*.json")):
+                shard = Shard.from_state_file(path)
+                if shard is not None:
+                    name = path.name.replace(shard.suffix, "")
+                    shards.setdefault(name, []).append((shard, path))
+            if not shards:
+                click.echo(f"Error: No shard state found in '{destination.path}'", err=True)
+                complete = False
+                continue
+
+            found = {shard for entries in shards.values() for shard, _ in entries}
+            counts = {shard.count for shard in found}
+            if len(counts) > 1:
+                click.echo(
+                    f"Warning: '{destination.path}' has state from runs with different shard counts: "
+                    + ", ".join(str(count) for count in sorted(counts)),
+                    err=True,
+                )
+                complete = False
+            for count in sorted(counts):
+                missing = [index for index in range(1, count + 1) if Shard(index, count) not in found]
+                if missing:
+                    click.echo(
+                        "Warning: No state from shard(s) "
+                        + ", ".join(f"{index}/{count}" for index in missing)
+                        + f" in '{destination.path}'",
+                        err=True,
+                    )
+                    complete = False
+
+            paths = {name: [path for _, path in entries] for name, entries in shards.items()}
+            if "card-index.json" in paths:
+                merged = CardIndex(state_dir / "card-index.json")
+                merged.merge(CardIndex(path) for path in paths["card-index.json"])
+                merged.save()
+            if "quarantine.json" in paths:
+                merged = QuarantineCache(state_dir / "quarantine.json")
+                merged.merge(QuarantineCache(path) for path in paths["quarantine.json"])
+                merged.save()
+            if "deferred.json" in paths:
+                merged = WorkScheduler(state_dir / "deferred.json")
+                merged.merge(WorkScheduler(path) for path in paths["deferred.json"])
+                merged.save()
+            if "sources.json" in paths:
+                merged = SourceMap(state_dir / "sources.json")
+                merged.merge(SourceMap(path) for path in paths["sources.json"])
+                merged.save()
+            if "contacts.json" in paths:
+                merged = ContactCatalog(destination.path, state_dir)
+                conflicts = merged.merge(
+                    ContactCatalog(destination.path, state_dir, shard.suffix)
+                    for shard, _ in shards["contacts.json"]
+                )
+                merged.save()
+                if conflicts:
+                    click.echo(
+                        f"Warning: {len(conflicts)} contact(s) were written by more than one shard "
+                        f"in '{destination.path}'; was the shard count changed?",
+                        err=True,
+                    )
+                    if verbose:
+                        for key in conflicts:
+                            click.echo(f"  {key}")
+                    complete = False
+
+            click.echo(
+                f"Merged state of {len(found)} shard(s) into '{state_dir}': "
+                + ", ".join(sorted(paths))
+            )
+        return complete
+
+    def find_duplicates(self, folder_sources, file_sources, ignore_files=None, verbose=False,
+                        threshold=DEFAULT_THRESHOLD):
+        """
+        Find contacts in the sources that likely describe the same person.
+
+        Every card, including each card of a multi-card file, is parsed
+        with only the properties used for matching, and added to a
+        DuplicateFinder; no notes are written.
+
+        Args:
+            folder_sources (list): List of Path objects for directories containing VCF files
+            file_sources (list): List of Path objects for individual VCF files
+            ignore_files (list, optional): Files to ignore, or ignore patterns
+            verbose (bool): Whether to enable verbose output
+            threshold (float): Minimum score, from 0 to 1, for suggesting a merge
+
+        Returns:
+            tuple: (groups as returned by DuplicateFinder.find(), the finder)
+        """
+        finder = DuplicateFinder(threshold)
+        reader = VCFReader(FieldProjection(DEDUPE_FIELDS))
+        scanner = CardIndex()
+        for vcf_path in self.discover_vcf_files(folder_sources, file_sources, ignore_files, verbose):
+            try:
+                data = vcf_path.read_bytes()
+                for position, card in enumerate(scanner.scan(vcf_path), 1):
+                    try:
+                        vcard = reader.read_record(data=data[card['offset']:card['offset'] + card['length']])
+                        note = f"{self.filename_gen.generate_filename(vcard, vcf_path)}.md"
+                        finder.add(vcard, vcf_path, note)
+                    except Exception as e:
+                        print(f"Error reading {vcf_path} [card {position}]: {e}")
+            except Exception as e:
+                print(f"Error reading {vcf_path}: {e}")
+        return finder.find(), finder
+
+    def report_duplicates(self, folder_sources, file_sources, output_dir, ignore_files=None,
+                          verbose=False, threshold=DEFAULT_THRESHOLD):
+        """
+        Print merge suggestions and save them as duplicates.json in each destination.
+
+        Args:
+            folder_sources (list): List of Path objects for directories containing VCF files
+            file_sources (list): List of Path objects for individual VCF files
+            output_dir: Output directory for Markdown files, a Destination,
+                or a list of them
+            ignore_files (list, optional): Files to ignore, or ignore patterns
+            verbose (bool): Whether to enable verbose output
+            threshold (float): Minimum score, from 0 to 1, for suggesting a merge
+
+        Returns:
+            list: Groups of likely duplicates
+        """
+        import click
+
+        groups, finder = self.find_duplicates(folder_sources, file_sources, ignore_files, verbose, threshold)
+        for group in groups:
+            click.echo(f"Possible duplicates (score {group['score']:.2f}: {'; '.join(group['reasons'])}):")
+            for contact in group['contacts']:
+                note = Path(contact['note']).stem if contact['note'] else contact['fn']
+                uid = f" (UID {contact['uid']})" if contact['uid'] else ""
+                click.echo(f"  [[{note}]] from {contact['source']}{uid}")
+        click.echo(
+            f"Found {len(groups)} group(s) of possible duplicates among {len(finder.contacts)} contact(s) "
+            f"with {finder.comparisons} comparison(s)"
+        )
+        if finder.skipped_blocks:
+            keys = ", ".join(finder.skipped_keys[:5]) + (", ..." if finder.skipped_blocks > 5 else "")
+            click.echo(
+                f"Warning: Skipped {finder.skipped_blocks} block(s) with more than {finder.max_block_size} "
+                f"contacts (too common to compare pairwise): {keys}; contacts in them are only compared "
+                "through their other blocks"
+            )
+
+        for destination in self._destinations(output_dir):
+            path = self._state_dir(destination.path) / "duplicates.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'threshold': threshold, 'groups': groups}, f, indent=1)
+            if verbose:
+                click.echo(f"Wrote merge suggestions to '{path}'")
+        return groups
@@ -2,17 +2,35 @@
 VCF Reader module for parsing VCF files.
 """
 
+import re
 import vobject
 import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from .field_projection import FieldProjection
+from .contact_record import ContactRecord
+
+
+# Basic or extended ISO 8601 date-time as used by the vCard REV property
+REV_PATTERN = re.compile(
+    r'^(\d{4})-?(\d{2})-?(\d{2})'
+    r'(?:T(\d{2}):?(\d{2}):?(\d{2})(?:\.\d+)?)?'
+    r'(Z|[+-]\d{2}:?\d{2})?$'
+)
 
 
 class VCFReader:
     """Class responsible for reading and parsing VCF files."""
     
-    def __init__(self):
-        """Initialize the VCF reader."""
-        pass
+    def __init__(self, projection=None):
+        """
+        Initialize the VCF reader.
+        
+        Args:
+            projection (FieldProjection, optional): Properties to drop from
+                the raw text before it is parsed
+        """
+        self.projection = projection or FieldProjection()
     
     def is_valid_uuid(self, uid_value):
         """
@@ -33,6 +51,41 @@ class VCFReader:
         except (ValueError, TypeError):
             return False
     
+    def get_rev_timestamp(self, vcard):
+        """
+        Get the card's own REV property as a UTC timestamp.
+        
+        Args:
+            vcard: ContactRecord or vobject vCard object
+            
+        Returns:
+            datetime or None: REV as timezone-aware UTC datetime, or None if
+            the card has no REV or it cannot be parsed
+        """
+        value = ContactRecord.coerce(vcard).rev
+        if not value:
+            return None
+        
+        if isinstance(value, datetime):
+            rev = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+            return rev.astimezone(timezone.utc)
+        
+        match = REV_PATTERN.match(str(value).strip())
+        if not match:
+            return None
+        year, month, day, hour, minute, second, offset = match.groups()
+        try:
+            rev = datetime(int(year), int(month), int(day),
+                           int(hour or 0), int(minute or 0), int(second or 0),
+                           tzinfo=timezone.utc)
+        except ValueError:
+            return None
+        if offset and offset != 'Z':
+            sign = 1 if offset[0] == '+' else -1
+            digits = offset[1:].replace(':', '')
+            rev -= sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        return rev
+    
     def read_vcf_file(self, vcf_path):
         """
         Read and parse a VCF file using vobject.
@@ -46,9 +99,72 @@ class VCFReader:
         Raises:
             Exception: If file cannot be read or parsed
         """
+        if self.projection:
+            # Project the raw bytes so dropped properties are never decoded
+            with open(vcf_path, 'rb') as file:
+                return self.read_vcf_bytes(file.read())
+        
         with open(vcf_path, 'r', encoding='utf-8') as file:
             content = file.read()
         
-        vcard = vobject.readOne(content)
-        return vcard
+        return self.read_vcf_content(content)
+    
+    def read_vcf_bytes(self, data):
+        """
+        Parse a single vCard from raw VCF bytes.
+        
+        The projection is applied to the bytes before they are decoded.
+        
+        Args:
+            data (bytes): UTF-8 encoded VCF data
+            
+        Returns:
+            vobject.vCard: Parsed vCard object
+            
+        Raises:
+            Exception: If the data cannot be decoded or parsed
+        """
+        return vobject.readOne(self.projection.apply(data).decode('utf-8'))
+    
+    def read_record(self, vcf_path=None, data=None, content=None):
+        """
+        Parse a single vCard into a ContactRecord.
+        
+        The vobject tree is discarded once the record is extracted, so only
+        the record stays in memory, in caches, and in messages to other
+        processes.
+        
+        Args:
+            vcf_path (Path, optional): Path to the VCF file
+            data (bytes, optional): UTF-8 encoded VCF data
+            content (str, optional): VCF text
+            
+        Returns:
+            ContactRecord: The parsed card
+            
+        Raises:
+            Exception: If the card cannot be read or parsed
+        """
+        if content is not None:
+            vcard = self.read_vcf_content(content)
+        elif data is not None:
+            vcard = self.read_vcf_bytes(data)
+        else:
+            vcard = self.read_vcf_file(vcf_path)
+        return ContactRecord.from_vcard(vcard)
+    
+    def read_vcf_content(self, content):
+        """
+        Parse a single vCard from VCF text that has already been loaded.
+        
+        Args:
+            content (str): VCF text containing at least one vCard
+            
+        Returns:
+            vobject.vCard: Parsed vCard object
+            
+        Raises:
+            Exception: If the content cannot be parsed
+        """
+        return vobject.readOne(self.projection.apply(content))
     
@@ -0,0 +1,94 @@
+"""
+Work Scheduler module for ordering VCF files when a run has a time budget.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+class WorkScheduler:
+    """Class responsible for ordering work by recency and remembering deferred files."""
+
+    def __init__(self, state_path=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            state_path (Path, optional): JSON file the deferred list is persisted to
+        """
+        self.state_path = Path(state_path) if state_path else None
+        self.deferred = []
+        if self.state_path:
+            self.load()
+
+    def order(self, vcf_paths):
+        """
+        Order VCF files so the most valuable work is done first.
+
+        Files deferred by the previous run come first, so a backlog drains
+        across runs. Within each group the most recently modified files come
+        first. Each file is stat'ed once.
+
+        Args:
+            vcf_paths (iterable): VCF files to schedule
+
+        Returns:
+            list: The same files in scheduling order
+        """
+        deferred = set(self.deferred)
+        keyed = []
+        for vcf_path in vcf_paths:
+            try:
+                mtime_ns = os.stat(vcf_path).st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            keyed.append((self._key(vcf_path) not in deferred, -mtime_ns, vcf_path))
+        keyed.sort(key=lambda item: item[:2])
+        return [vcf_path for _, _, vcf_path in keyed]
+
+    def defer(self, vcf_paths):
+        """
+        Replace the deferred list with the files a run did not get to.
+
+        Args:
+            vcf_paths (iterable): VCF files left over when the budget ran out
+        """
+        self.deferred = [self._key(vcf_path) for vcf_path in vcf_paths]
+
+    def merge(self, schedulers):
+        """
+        Replace the deferred list with the union of other schedulers' lists.
+
+        Args:
+            schedulers (iterable): WorkScheduler objects to combine, such as
+                those written by the shards of a run
+        """
+        deferred = {}
+        for scheduler in schedulers:
+            deferred.update(dict.fromkeys(scheduler.deferred))
+        self.deferred = list(deferred)
+
+    def load(self):
+        """Load the deferred list from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.deferred = json.load(f).get('deferred', [])
+        except Exception:
+            self.deferred = []
+
+    def save(self):
+        """Write the deferred list to disk, removing the file when nothing is deferred."""
+        if not self.state_path:
+            return
+        if not self.deferred:
+            self.state_path.unlink(missing_ok=True)
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'deferred': self.deferred}, f, indent=1)
+        tmp_path.replace(self.state_path)
+
+    def _key(self, vcf_path):
+        return os.path.abspath(vcf_path)
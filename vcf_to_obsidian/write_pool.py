@@ -0,0 +1,72 @@
+"""
+Write Pool module for writing notes on background threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+# Pending writes kept before finished ones are forgotten
+PRUNE_AT = 1024
+
+
+class WritePool:
+    """Class responsible for writing notes concurrently, one write per note at a time."""
+
+    def __init__(self, workers):
+        """
+        Initialize the pool and start its threads.
+
+        The pool is driven by a single thread, the write stage of a
+        conversion; only the writes themselves run on the pool's threads.
+
+        Args:
+            workers (int): Number of writing threads
+        """
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vcf-write")
+        self._pending = {}
+        self._submitted = []
+
+    def submit(self, path, write):
+        """
+        Write a note in the background, after any pending write of the same note.
+
+        Args:
+            path (Path): Note the write creates or changes
+            write (callable): Performs the write; exceptions it raises are
+                reported through the futures returned by take()
+        """
+        self.wait(path)
+        future = self._executor.submit(write)
+        self._pending[path] = future
+        self._submitted.append(future)
+        if len(self._pending) >= PRUNE_AT:
+            self._pending = {key: pending for key, pending in self._pending.items() if not pending.done()}
+
+    def wait(self, path):
+        """
+        Wait for the pending write of a note, if there is one.
+
+        Call this before reading, renaming or removing a note.
+
+        Args:
+            path (Path): Path of the note
+        """
+        future = self._pending.pop(path, None)
+        if future is not None:
+            wait([future])
+
+    def take(self):
+        """
+        Get the writes submitted since the last call.
+
+        Returns:
+            list: concurrent.futures.Future per write
+        """
+        submitted, self._submitted = self._submitted, []
+        return submitted
+
+    def close(self):
+        """Wait for every pending write and stop the threads."""
+        self._executor.shutdown(wait=True)
+        self._pending.clear()